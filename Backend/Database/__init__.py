@@ -1,3 +1,4 @@
 from Backend.Database.blockchain import Block
 from Backend.Database.blockchain import Blockchain
-from Backend.Database.blockchain import MultiSigWallet
\ No newline at end of file
+from Backend.Database.blockchain import MultiSigWallet
+from Backend.Database.contract_registry import ContractRegistry
@@ -1,8 +1,11 @@
-import uuid
 import hashlib
 import time
-import pandas as pd
-import numpy as np
+from Backend.Database.contract_registry import ContractRegistry
+from Backend.metrics import (
+    metrics, BLOCKS_ADDED, BLOCK_TRANSACTIONS, ADD_BLOCK_SECONDS,
+    MULTISIG_PROPOSALS, MULTISIG_APPROVALS, MULTISIG_EXECUTIONS, MULTISIG_PENDING
+)
+from Backend.tracing import tracer
 
 # --- Blockchain Simulation ---
 class Block:
@@ -46,6 +49,8 @@ def __init__(self):
         Initializes the blockchain with a genesis block.
         """
         self.chain = [self.create_genesis_block()]  # Start the chain with the genesis block
+        self.contract_registry = ContractRegistry()  # Smart contracts indexed as blocks are added
+        self.version = 0  # Bumped on every change, so readers can cache results derived from the chain
 
     def create_genesis_block(self):
         """
@@ -63,9 +68,19 @@ def add_block(self, transactions):
         Args:
             transactions (list): List of transactions for the new block.
         """
-        previous_block = self.chain[-1]  # Get the last block in the chain
-        block = Block(len(self.chain), transactions, previous_block.hash)  # Create a new block
-        self.chain.append(block)  # Add the new block to the chain
+        start = time.perf_counter() if metrics.enabled else None
+        with tracer.span("blockchain.add_block", transactions=len(transactions)):
+            previous_block = self.chain[-1]  # Get the last block in the chain
+            with tracer.span("block.hash"):
+                block = Block(len(self.chain), transactions, previous_block.hash)  # Create a new block
+            self.chain.append(block)  # Add the new block to the chain
+            with tracer.span("contract_registry.register_block"):
+                self.contract_registry.register_block(block)  # Index any smart contracts in the block
+            self.version += 1
+        if start is not None:
+            ADD_BLOCK_SECONDS.observe(time.perf_counter() - start)
+            BLOCKS_ADDED.inc()
+            BLOCK_TRANSACTIONS.inc(len(transactions))
 
     def get_chain(self):
         """
@@ -100,11 +115,18 @@ def propose_transaction(self, transaction):
 
         Args:
             transaction (dict): The transaction to propose.
+
+        Returns:
+            int: The index of the transaction in the pending list.
         """
         self.pending_transactions.append({
             "transaction": transaction,  # The transaction details
             "approvals": set()  # Set of owners who have approved the transaction
         })
+        if metrics.enabled:
+            MULTISIG_PROPOSALS.inc()
+            MULTISIG_PENDING.inc()
+        return len(self.pending_transactions) - 1
 
     def approve_transaction(self, transaction_index, owner):
         """
@@ -120,6 +142,8 @@ def approve_transaction(self, transaction_index, owner):
         tx = self.pending_transactions[transaction_index]  # Get the transaction
         if owner in self.owners:  # Check if the owner is valid
             tx["approvals"].add(owner)  # Add the owner's approval
+            if metrics.enabled:
+                MULTISIG_APPROVALS.inc()
         return len(tx["approvals"]) >= self.required_signatures  # Check if approvals meet the requirement
 
     def execute_transaction(self, transaction_index):
@@ -137,6 +161,13 @@ def execute_transaction(self, transaction_index):
         """
         tx = self.pending_transactions[transaction_index]  # Get the transaction
         if len(tx["approvals"]) >= self.required_signatures:  # Check if approvals meet the requirement
+            if metrics.enabled:
+                MULTISIG_EXECUTIONS.inc(result="approved")
+                if not tx.get("executed"):
+                    MULTISIG_PENDING.dec()
+            tx["executed"] = True
             return tx["transaction"]  # Return the transaction details
         else:
+            if metrics.enabled:
+                MULTISIG_EXECUTIONS.inc(result="rejected")
             raise Exception("Not enough approvals")  # Raise an exception if approvals are insufficient
\ No newline at end of file
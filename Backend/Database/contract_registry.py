@@ -0,0 +1,100 @@
+import hashlib
+
+# --- Contract Registry ---
+class ContractRegistry:
+    """
+    Indexes the smart contracts of a blockchain by bytecode digest and rule type.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty registry.
+        """
+        self.by_digest = {}  # digest -> contract entry
+        self.by_rule_type = {}  # rule type -> list of contract entries, oldest first
+        self.appearances = []  # (block_index, contract entry) in chain order
+
+    def register_block(self, block):
+        """
+        Registers every smart contract transaction of a block.
+
+        Args:
+            block (Block): The block appended to the chain.
+        """
+        for tx in block.transactions:
+            if isinstance(tx, dict) and tx.get("type") == "smart_contract" and "bytecode" in tx:
+                self.register(tx, block.index)
+
+    def register(self, tx, block_index):
+        """
+        Registers a smart contract transaction found in a block.
+
+        Args:
+            tx (dict): The smart contract transaction.
+            block_index (int): The index of the block containing the transaction.
+
+        Returns:
+            dict: The registry entry of the contract.
+        """
+        digest = contract_digest(tx["bytecode"])
+        rule_type = tx.get("rule_type", "dao")
+        entry = self.by_digest.get(digest)
+        if entry is None:
+            entry = {
+                "digest": digest,
+                "rule_type": rule_type,
+                "bytecode": tx["bytecode"],
+                "blocks": [],
+                "transaction": tx
+            }
+            self.by_digest[digest] = entry
+        entry["blocks"].append(block_index)
+        self.by_rule_type.setdefault(rule_type, []).append(entry)
+        self.appearances.append((block_index, tx))
+        return entry
+
+    def get(self, digest):
+        """
+        Looks up a contract by its bytecode digest.
+
+        Args:
+            digest (str): The SHA-256 digest of the contract bytecode.
+
+        Returns:
+            dict: The registry entry, or None if unknown.
+        """
+        return self.by_digest.get(digest)
+
+    def active_rule(self, rule_type):
+        """
+        Retrieves the most recently added contract of a rule type.
+
+        Args:
+            rule_type (str): "quorum", "voting_time", "proposal_cost" or "dao".
+
+        Returns:
+            dict: The registry entry of the active contract, or None if there is none.
+        """
+        entries = self.by_rule_type.get(rule_type)
+        return entries[-1] if entries else None
+
+    def contracts(self):
+        """
+        Lists every contract appearance in chain order.
+
+        Returns:
+            list: (block_index, transaction) tuples.
+        """
+        return list(self.appearances)
+
+def contract_digest(bytecode):
+    """
+    Calculates the registry key of a contract bytecode.
+
+    Args:
+        bytecode (str): The contract bytecode.
+
+    Returns:
+        str: The SHA-256 hex digest of the bytecode.
+    """
+    return hashlib.sha256(bytecode.encode()).hexdigest()
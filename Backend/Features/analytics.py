@@ -0,0 +1,208 @@
+import pandas as pd
+import numpy as np
+from Backend.Features.chain_export import ChainExporter
+
+# Signed effect of each transaction type on member balances: (member column, sign)
+MEMBER_BALANCE_EFFECTS = {
+    "token_sale": ("buyer", 1),
+    "treasury_contribution": ("contributor", -1),
+    "fund_distribution": ("recipient", 1),
+}
+TREASURY_INFLOW_TYPES = ["treasury_contribution"]
+TREASURY_OUTFLOW_TYPES = ["fund_distribution", "investment"]
+
+def gini(balances):
+    """
+    Calculates the Gini coefficient of token holdings.
+
+    Args:
+        balances (array-like): Balances of the holders.
+
+    Returns:
+        float: 0 for perfect equality up to (n - 1) / n when one holder owns everything.
+    """
+    x = np.sort(np.clip(np.asarray(balances, dtype=np.float64), 0, None))
+    n = x.size
+    total = x.sum()
+    if n == 0 or total == 0:
+        return 0.0
+    ranks = np.arange(1, n + 1)
+    return float(2.0 * np.dot(ranks, x) / (n * total) - (n + 1) / n)
+
+def top_n_share(balances, n=10):
+    """
+    Calculates the share of all tokens held by the n largest holders.
+
+    Args:
+        balances (array-like): Balances of the holders.
+        n (int): Number of top holders.
+
+    Returns:
+        float: The share between 0 and 1; 0.0 when n is 0 or less.
+    """
+    x = np.clip(np.asarray(balances, dtype=np.float64), 0, None)
+    total = x.sum()
+    if x.size == 0 or total == 0 or n <= 0:
+        return 0.0
+    if n < x.size:
+        x = np.partition(x, x.size - n)[x.size - n:]
+    return float(x.sum() / total)
+
+class DAOAnalytics:
+    """
+    Vectorized treasury and token-holder analytics over a DAO's wallets and chain.
+    """
+
+    def __init__(self, dao):
+        """
+        Initializes the analytics for a DAO.
+
+        Args:
+            dao (DAOCreation): The DAO to analyse.
+        """
+        self.dao = dao
+        self.exporter = ChainExporter(dao.blockchain)
+        self.frames = {}  # tx type -> DataFrame of all exported transactions
+
+    def refresh(self):
+        """
+        Pulls the transactions of blocks added since the last refresh.
+
+        Returns:
+            dict: Transaction type -> DataFrame of every transaction so far.
+        """
+        for tx_type, frame in self.exporter.export().items():
+            previous = self.frames.get(tx_type)
+            self.frames[tx_type] = frame if previous is None else pd.concat([previous, frame], ignore_index=True)
+        return self.frames
+
+    def holder_concentration(self, n=10):
+        """
+        Measures how concentrated token holdings are across members.
+
+        Args:
+            n (int): Number of top holders for the top-N share.
+
+        Returns:
+            dict: Number of holders, Gini coefficient and top-N share.
+        """
+        balances = np.fromiter(self.dao.wallets.values(), dtype=np.float64, count=len(self.dao.wallets))
+        return {
+            "holders": int(np.count_nonzero(balances > 0)),
+            "gini": gini(balances),
+            f"top_{n}_share": top_n_share(balances, n),
+        }
+
+    def balance_changes(self):
+        """
+        Lists every change to member balances recorded on the chain.
+
+        Returns:
+            pandas.DataFrame: Columns time, member and delta, ordered by block and position.
+        """
+        frames = self.refresh()
+        parts = []
+        for tx_type, (column, sign) in MEMBER_BALANCE_EFFECTS.items():
+            frame = frames.get(tx_type)
+            if frame is None or frame.empty:
+                continue
+            parts.append(pd.DataFrame({
+                "time": _event_time(frame),
+                "block_index": frame["block_index"],
+                "position": frame["position"],
+                "member": frame[column],
+                "delta": frame["amount"] * sign,
+            }))
+        if not parts:
+            return pd.DataFrame({"time": pd.Series(dtype="datetime64[ns, UTC]"), "member": pd.Series(dtype="string"),
+                                 "delta": pd.Series(dtype="float64")})
+        changes = pd.concat(parts, ignore_index=True).sort_values(["block_index", "position"], kind="stable")
+        return changes[["time", "member", "delta"]].reset_index(drop=True)
+
+    def balance_time_series(self, freq=None):
+        """
+        Builds the balance of every member over time. Opening balances are derived from the
+        current wallets minus all recorded changes, so the series ends at today's balances.
+
+        Args:
+            freq (str): Optional pandas period alias, e.g. "D", to sample the last balance per period.
+
+        Returns:
+            pandas.DataFrame: One column per member, indexed by time (or period end).
+        """
+        changes = self.balance_changes()
+        wallets = pd.Series(self.dao.wallets, dtype="float64")
+        totals = changes.groupby("member")["delta"].sum()
+        opening = wallets.sub(totals, fill_value=0)
+        changes["balance"] = changes.groupby("member")["delta"].cumsum() + changes["member"].map(opening).to_numpy()
+        series = changes.pivot_table(index="time", columns="member", values="balance", aggfunc="last")
+        series = series.reindex(columns=opening.index.union(series.columns))
+        start = pd.DataFrame([opening.reindex(series.columns).to_numpy(dtype=np.float64)], columns=series.columns,
+                             index=pd.DatetimeIndex([pd.to_datetime(self.dao.creation_time, utc=True)]))
+        series = pd.concat([start, series]).ffill().fillna(0)
+        if freq:
+            series = series.resample(freq).last().ffill()
+        return series
+
+    def treasury_flows(self, freq="D"):
+        """
+        Aggregates treasury inflow and outflow per period.
+
+        Args:
+            freq (str): The pandas period alias, e.g. "D", "W" or "MS".
+
+        Returns:
+            pandas.DataFrame: Columns inflow, outflow and net per period.
+        """
+        frames = self.refresh()
+        parts = []
+        for types, column in ((TREASURY_INFLOW_TYPES, "inflow"), (TREASURY_OUTFLOW_TYPES, "outflow")):
+            for tx_type in types:
+                frame = frames.get(tx_type)
+                if frame is not None and not frame.empty:
+                    parts.append(pd.DataFrame({"time": _event_time(frame), column: frame["amount"]}))
+        if not parts:
+            return pd.DataFrame(columns=["inflow", "outflow", "net"], dtype="float64")
+        flows = pd.concat(parts, ignore_index=True).set_index("time").sort_index()
+        flows = flows.reindex(columns=["inflow", "outflow"]).fillna(0).resample(freq).sum()
+        flows["net"] = flows["inflow"] - flows["outflow"]
+        return flows
+
+    def token_sale_price_stats(self):
+        """
+        Summarises token sale prices.
+
+        Returns:
+            dict: Sale count, tokens sold, proceeds, volume-weighted average, mean, median,
+            standard deviation, minimum and maximum price.
+        """
+        sales = self.refresh().get("token_sale")
+        if sales is None or sales.empty:
+            return {"count": 0, "tokens_sold": 0.0, "proceeds": 0.0}
+        price = sales["token_price"].to_numpy(dtype=np.float64)
+        amount = sales["amount"].to_numpy(dtype=np.float64)
+        proceeds = float(np.dot(price, amount))
+        tokens = float(amount.sum())
+        return {
+            "count": int(price.size),
+            "tokens_sold": tokens,
+            "proceeds": proceeds,
+            "vwap": proceeds / tokens if tokens else float("nan"),
+            "mean": float(price.mean()),
+            "median": float(np.median(price)),
+            "std": float(price.std(ddof=0)),
+            "min": float(price.min()),
+            "max": float(price.max()),
+        }
+
+def _event_time(frame):
+    """
+    Picks the business timestamp of exported transactions, falling back to the block time.
+
+    Args:
+        frame (pandas.DataFrame): An exported frame.
+
+    Returns:
+        pandas.Series: UTC timestamps.
+    """
+    return frame["timestamp"].fillna(frame["block_time"])
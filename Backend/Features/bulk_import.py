@@ -0,0 +1,177 @@
+import os
+import pandas as pd
+import numpy as np
+from Backend.Features.transaction_engine import TransactionEngine
+from Backend.Features.transactions import (
+    TokenSaleTransaction, TreasuryContributionTransaction,
+    FundDistributionTransaction, InvestmentTransaction
+)
+
+# Columns of an import file. `member` is the buyer, contributor or recipient depending on `type`.
+IMPORT_COLUMNS = ["type", "member", "amount", "token_price", "reason", "target_project", "idempotency_key"]
+TRANSACTION_TYPES = ["token_sale", "treasury_contribution", "fund_distribution", "investment"]
+MEMBER_CREDIT_TYPES = ["token_sale", "fund_distribution"]
+TREASURY_DEBIT_TYPES = ["fund_distribution", "investment"]
+
+def read_transaction_chunks(path, chunksize=10000):
+    """
+    Streams a CSV or Parquet transaction file in chunks.
+
+    Args:
+        path (str): The path of a .csv or .parquet file.
+        chunksize (int): Number of rows per chunk.
+
+    Yields:
+        pandas.DataFrame: The next chunk of rows.
+    """
+    if str(path).lower().endswith(".parquet"):
+        import pyarrow.parquet as pq  # Optional dependency, only needed for Parquet files
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=chunksize, dtype={"member": "string", "reason": "string",
+                                                                  "target_project": "string", "type": "string"})
+
+def validate_chunk(chunk, dao):
+    """
+    Validates a chunk of transaction rows with vectorized checks.
+
+    Balance checks are upper bounds: a row is rejected only if it could not be covered even
+    if every earlier credit in the chunk succeeded. The DAO's ledger makes the final decision.
+
+    Args:
+        chunk (pandas.DataFrame): The rows to validate.
+        dao (DAOCreation): The DAO the rows are imported into.
+
+    Returns:
+        pandas.Series: The rejection reason per row, or NA for valid rows.
+    """
+    chunk = _normalize(chunk)
+    tx_type = chunk["type"]
+    member = chunk["member"]
+    amount = chunk["amount"]
+    reason = pd.Series(pd.NA, index=chunk.index, dtype="object")
+
+    def reject(mask, message):
+        reason[mask & reason.isna()] = message
+
+    reject(~tx_type.isin(TRANSACTION_TYPES), "Unknown transaction type.")
+    reject(amount.isna(), "Amount must be a number.")
+    reject(amount <= 0, "Amount must be positive.")
+    reject(tx_type.ne("investment") & member.isna(), "Missing member.")
+    reject(tx_type.eq("investment") & chunk["target_project"].isna(), "Missing target project.")
+    reject(tx_type.eq("token_sale") & ~(chunk["token_price"] >= 0), "Token price must be a non-negative number.")
+    is_contribution = tx_type.eq("treasury_contribution")
+    reject(is_contribution & ~member.isin(list(dao.wallets)), "Unknown member.")
+
+    valid_amount = amount.where(reason.isna(), 0)
+    # Member balances: starting balance plus every earlier credit in the chunk
+    credit = valid_amount.where(tx_type.isin(MEMBER_CREDIT_TYPES), 0)
+    credits_before = credit.groupby(member.fillna("")).cumsum() - credit
+    available = member.map(dao.wallets).astype("float64").fillna(0) + credits_before
+    reject(is_contribution & (available < amount), "Insufficient balance.")
+    # Treasury balance: current balance plus every earlier contribution in the chunk
+    treasury_credit = valid_amount.where(is_contribution & reason.isna(), 0)
+    treasury_available = dao.ledger.treasury_balance + treasury_credit.cumsum() - treasury_credit
+    reject(tx_type.isin(TREASURY_DEBIT_TYPES) & (treasury_available < amount), "Insufficient treasury balance.")
+    return reason
+
+def import_transaction_frames(frames, dao, multisig_wallet, batch_size=None):
+    """
+    Validates chunks of transaction rows and executes the valid rows in batches.
+
+    Args:
+        frames (iterable): pandas DataFrames with IMPORT_COLUMNS.
+        dao (DAOCreation): The DAO to import into.
+        multisig_wallet (MultiSigWallet): The multisig wallet used for approvals.
+        batch_size (int): Maximum transactions per block. Defaults to one block per chunk.
+
+    Returns:
+        dict: Counts of imported and rejected rows, blocks written, and a DataFrame report
+        of rejected rows with their `row` number and `reason`.
+    """
+    engine = TransactionEngine(dao, multisig_wallet)
+    imported = 0
+    blocks = 0
+    rejected = []
+    offset = 0
+    for chunk in frames:
+        chunk = _normalize(chunk).set_axis(np.arange(offset, offset + len(chunk)))
+        offset += len(chunk)
+        reasons = validate_chunk(chunk, dao)
+        invalid = reasons.notna()
+        if invalid.any():
+            rejected.append(chunk[invalid].assign(reason=reasons[invalid]))
+        valid = chunk[~invalid]
+        size = batch_size or max(len(valid), 1)
+        for start in range(0, len(valid), size):
+            rows = valid.iloc[start:start + size]
+            transactions = [_build_transaction(row, dao, multisig_wallet) for row in rows.itertuples()]
+            chain_len = len(dao.blockchain.chain)
+            results = engine.execute_batch(transactions)
+            blocks += len(dao.blockchain.chain) - chain_len
+            failed = [i for i, result in enumerate(results) if "executed and recorded" not in result]
+            imported += len(results) - len(failed)
+            if failed:
+                rejected.append(rows.iloc[failed].assign(reason=[results[i] for i in failed]))
+    report = pd.concat(rejected) if rejected else pd.DataFrame(columns=IMPORT_COLUMNS + ["reason"])
+    report = report.rename_axis("row").reset_index()
+    return {"imported": imported, "rejected": len(report), "blocks": blocks, "report": report}
+
+def import_transactions(path, dao, multisig_wallet, chunksize=10000, report_path=None):
+    """
+    Streams a CSV or Parquet file of transactions into a DAO.
+
+    Args:
+        path (str): The path of the transaction file.
+        dao (DAOCreation): The DAO to import into.
+        multisig_wallet (MultiSigWallet): The multisig wallet used for approvals.
+        chunksize (int): Rows read, validated and recorded per block.
+        report_path (str): Optional CSV path the rejected rows are written to.
+
+    Returns:
+        dict: The import summary, see import_transaction_frames.
+    """
+    summary = import_transaction_frames(read_transaction_chunks(path, chunksize), dao, multisig_wallet)
+    if report_path:
+        os.makedirs(os.path.dirname(os.path.abspath(report_path)), exist_ok=True)
+        summary["report"].to_csv(report_path, index=False)
+    return summary
+
+def _normalize(chunk):
+    """
+    Adds missing optional columns and coerces numeric columns.
+
+    Args:
+        chunk (pandas.DataFrame): The raw chunk.
+
+    Returns:
+        pandas.DataFrame: The normalized chunk.
+    """
+    chunk = chunk.reindex(columns=IMPORT_COLUMNS + [c for c in chunk.columns if c not in IMPORT_COLUMNS])
+    chunk["amount"] = pd.to_numeric(chunk["amount"], errors="coerce")
+    chunk["token_price"] = pd.to_numeric(chunk["token_price"], errors="coerce")
+    return chunk
+
+def _build_transaction(row, dao, multisig_wallet):
+    """
+    Builds the transaction object of a validated row.
+
+    Args:
+        row (namedtuple): The row from DataFrame.itertuples().
+        dao (DAOCreation): The DAO.
+        multisig_wallet (MultiSigWallet): The multisig wallet.
+
+    Returns:
+        DAOTransaction: The transaction.
+    """
+    amount = int(row.amount) if float(row.amount).is_integer() else float(row.amount)
+    key = None if pd.isna(row.idempotency_key) else str(row.idempotency_key)
+    if row.type == "token_sale":
+        return TokenSaleTransaction(dao, row.member, amount, float(row.token_price), multisig_wallet, key)
+    if row.type == "treasury_contribution":
+        return TreasuryContributionTransaction(dao, row.member, amount, multisig_wallet, key)
+    if row.type == "fund_distribution":
+        reason = "" if pd.isna(row.reason) else row.reason
+        return FundDistributionTransaction(dao, row.member, amount, reason, multisig_wallet, key)
+    return InvestmentTransaction(dao, row.target_project, amount, multisig_wallet, key)
@@ -0,0 +1,190 @@
+import os
+import json
+import pandas as pd
+import numpy as np
+
+# Typed columns exported per transaction type, in addition to the block columns
+TRANSACTION_SCHEMAS = {
+    "token_sale": {"buyer": "string", "amount": "float64", "token_price": "float64"},
+    "treasury_contribution": {"contributor": "string", "amount": "float64"},
+    "fund_distribution": {"recipient": "string", "amount": "float64", "reason": "string"},
+    "investment": {"target_project": "string", "amount": "float64"},
+    "smart_contract": {"action": "string", "rule_type": "string", "dao_name": "string", "bytecode": "string"},
+}
+BLOCK_COLUMNS = ["block_index", "block_time", "block_hash", "position", "timestamp", "idempotency_key"]
+OTHER_TYPE = "other"  # Transactions without a known type are exported as JSON payloads
+
+STATE_FILE = "_export_state.json"
+WRITERS = {"parquet": "to_parquet", "feather": "to_feather"}
+
+class ChainExporter:
+    """
+    Exports a blockchain's transactions into typed pandas DataFrames, one per transaction type,
+    processing only the blocks added since the previous export.
+    """
+
+    def __init__(self, blockchain, exported_height=0):
+        """
+        Initializes the exporter.
+
+        Args:
+            blockchain (Blockchain): The blockchain to export.
+            exported_height (int): Number of leading blocks already exported.
+        """
+        self.blockchain = blockchain
+        self.exported_height = exported_height
+
+    def export(self):
+        """
+        Exports the transactions of the blocks added since the last export.
+
+        Returns:
+            dict: Transaction type -> DataFrame of the new transactions. Types without new
+            transactions are omitted.
+        """
+        frames, height = self._frames()
+        self.exported_height = height
+        return frames
+
+    def _frames(self):
+        """
+        Builds the frames of the blocks added since the last export, without advancing the exported height.
+
+        Returns:
+            tuple: Transaction type -> DataFrame, and the chain height they cover.
+        """
+        chain = self.blockchain.chain
+        start = self.exported_height
+        columns = {}  # tx type -> column name -> list of values
+        for block in chain[start:]:
+            for position, tx in enumerate(block.transactions):
+                tx_type = tx.get("type") if isinstance(tx, dict) else None
+                schema = TRANSACTION_SCHEMAS.get(tx_type)
+                cols = columns.setdefault(tx_type if schema else OTHER_TYPE, {})
+                _append(cols, "block_index", block.index)
+                _append(cols, "block_time", block.timestamp)
+                _append(cols, "block_hash", block.hash)
+                _append(cols, "position", position)
+                _append(cols, "timestamp", tx.get("timestamp") if isinstance(tx, dict) else None)
+                _append(cols, "idempotency_key", tx.get("idempotency_key") if isinstance(tx, dict) else None)
+                if schema:
+                    for name in schema:
+                        _append(cols, name, tx.get(name))
+                else:
+                    _append(cols, "type", tx_type)
+                    _append(cols, "payload", json.dumps(tx, default=str, sort_keys=True))
+        return {tx_type: _to_frame(tx_type, cols) for tx_type, cols in columns.items()}, len(chain)
+
+    def export_to(self, directory, fmt="parquet"):
+        """
+        Exports the new transactions to Parquet or Feather part files, one directory per type.
+        The exported height is stored in the directory so later exports, also from another
+        process, resume where this one stopped. If a write fails, the height is not advanced and
+        the partial files are removed, so a retry exports the same blocks.
+
+        Args:
+            directory (str): The output directory.
+            fmt (str): "parquet" or "feather". Both require pyarrow (the optional columnar dependency group).
+
+        Returns:
+            list: Paths of the files written.
+        """
+        if fmt not in WRITERS:
+            raise ValueError(f"Unsupported export format: {fmt}")
+        os.makedirs(directory, exist_ok=True)
+        state_path = os.path.join(directory, STATE_FILE)
+        if os.path.exists(state_path):
+            with open(state_path) as f:
+                state = json.load(f)
+            self.exported_height = max(self.exported_height, self._resume_height(state))
+        start = self.exported_height
+        frames, end = self._frames()
+        paths = []
+        try:
+            for tx_type, frame in frames.items():
+                os.makedirs(os.path.join(directory, tx_type), exist_ok=True)
+                path = os.path.join(directory, tx_type, f"part-{start:08d}-{end - 1:08d}.{fmt}")
+                paths.append(path)
+                getattr(frame, WRITERS[fmt])(path)
+            with open(state_path + ".tmp", "w") as f:
+                json.dump({"height": end, "last_hash": self.blockchain.chain[end - 1].hash}, f)
+            os.replace(state_path + ".tmp", state_path)
+        except BaseException:
+            # Remove this attempt's parts so a retry exports the same blocks without duplicates
+            for path in paths:
+                if os.path.exists(path):
+                    os.remove(path)
+            raise
+        # Advance only once the parts and the state are on disk
+        self.exported_height = end
+        return paths
+
+    def _resume_height(self, state):
+        """
+        Validates a stored export state against the chain.
+
+        Args:
+            state (dict): The stored state.
+
+        Returns:
+            int: The height to resume from.
+
+        Raises:
+            ValueError: If the stored state belongs to a different chain.
+        """
+        height = state["height"]
+        chain = self.blockchain.chain
+        if height > len(chain) or chain[height - 1].hash != state["last_hash"]:
+            raise ValueError("Export directory belongs to a different chain.")
+        return height
+
+def read_export(directory, tx_type, fmt="parquet"):
+    """
+    Reads every part file of a transaction type back into one DataFrame.
+
+    Args:
+        directory (str): The export directory.
+        tx_type (str): The transaction type.
+        fmt (str): "parquet" or "feather".
+
+    Returns:
+        pandas.DataFrame: The exported transactions, oldest first.
+    """
+    folder = os.path.join(directory, tx_type)
+    reader = pd.read_parquet if fmt == "parquet" else pd.read_feather
+    parts = sorted(name for name in os.listdir(folder) if name.endswith(f".{fmt}")) if os.path.isdir(folder) else []
+    if not parts:
+        return pd.DataFrame()
+    return pd.concat([reader(os.path.join(folder, name)) for name in parts], ignore_index=True)
+
+def _append(cols, name, value):
+    cols.setdefault(name, []).append(value)
+
+def _to_frame(tx_type, cols):
+    """
+    Builds a typed DataFrame from exported columns.
+
+    Args:
+        tx_type (str): The transaction type.
+        cols (dict): Column name -> list of values.
+
+    Returns:
+        pandas.DataFrame: The typed frame.
+    """
+    frame = pd.DataFrame({
+        "block_index": np.asarray(cols["block_index"], dtype=np.int64),
+        "block_time": pd.to_datetime(np.asarray(cols["block_time"], dtype=np.float64), unit="s", utc=True),
+        "block_hash": pd.array(cols["block_hash"], dtype="string"),
+        "position": np.asarray(cols["position"], dtype=np.int32),
+        "timestamp": pd.to_datetime(pd.Series(cols["timestamp"], dtype="object"),
+                                    format="%Y-%m-%dT%H:%M:%SZ", utc=True, errors="coerce"),
+        "idempotency_key": pd.array(cols["idempotency_key"], dtype="string"),
+    })
+    schema = TRANSACTION_SCHEMAS.get(tx_type, {"type": "string", "payload": "string"})
+    for name, dtype in schema.items():
+        values = cols[name]
+        if dtype == "float64":
+            frame[name] = pd.to_numeric(pd.Series(values, dtype="object"), errors="coerce").astype("float64")
+        else:
+            frame[name] = pd.array([None if v is None else str(v) for v in values], dtype=dtype)
+    return frame
@@ -0,0 +1,170 @@
+import threading
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
+from Backend.Features.transaction_engine import TransactionEngine
+
+class DAOLockRegistry:
+    """
+    Hands out one reentrant lock per DAO so that work on unrelated DAOs can run in parallel.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty registry.
+        """
+        self._locks = {}  # dao_id -> RLock
+        self._guard = threading.Lock()  # Protects lock creation
+
+    def lock_for(self, dao_id):
+        """
+        Retrieves the lock of a DAO, creating it on first use.
+
+        Args:
+            dao_id (str): The DAO ID.
+
+        Returns:
+            threading.RLock: The DAO's lock.
+        """
+        lock = self._locks.get(dao_id)
+        if lock is None:
+            with self._guard:
+                lock = self._locks.setdefault(dao_id, threading.RLock())
+        return lock
+
+# Locks shared by every entry point that mutates DAOs in this process
+dao_locks = DAOLockRegistry()
+
+@contextmanager
+def locked(dao, locks=None):
+    """
+    Holds a DAO's lock for the duration of a with-block.
+
+    Args:
+        dao (DAOCreation): The DAO to lock.
+        locks (DAOLockRegistry): The registry to use. Defaults to the shared registry.
+    """
+    with (locks or dao_locks).lock_for(dao.dao_id):
+        yield dao
+
+class ConcurrentExecutor:
+    """
+    Runs DAO operations on a thread pool, serializing work per DAO and parallelizing across DAOs.
+
+    Each DAO has a serial queue drained by at most one worker at a time, so calls waiting for a
+    busy DAO queue up instead of occupying workers that other DAOs could use.
+    """
+
+    def __init__(self, max_workers=None, locks=None):
+        """
+        Initializes the executor.
+
+        Args:
+            max_workers (int): Number of worker threads. Defaults to the ThreadPoolExecutor default.
+            locks (DAOLockRegistry): The lock registry. Defaults to the shared registry.
+        """
+        self.locks = locks or dao_locks
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="dao-worker")
+        self._queues = {}  # dao_id -> deque of (future, fn, args, kwargs), present while a worker drains it
+        self._guard = threading.Lock()  # Protects the queues
+
+    def submit(self, dao, fn, *args, **kwargs):
+        """
+        Queues a call behind the DAO's earlier calls. It runs while holding the DAO's lock,
+        so it is also ordered with work on the DAO from other entry points.
+
+        Args:
+            dao (DAOCreation): The DAO the call operates on.
+            fn (callable): The function to call.
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function.
+
+        Returns:
+            concurrent.futures.Future: The future of the call's result.
+        """
+        future = Future()
+        with self._guard:
+            queue = self._queues.get(dao.dao_id)
+            if queue is None:
+                self.pool.submit(self._drain, dao.dao_id)
+                queue = self._queues[dao.dao_id] = deque()
+            queue.append((future, fn, args, kwargs))
+        return future
+
+    def _drain(self, dao_id):
+        """
+        Runs a DAO's queued calls in order until its queue is empty. Runs on one worker.
+        """
+        lock = self.locks.lock_for(dao_id)
+        while True:
+            with self._guard:
+                queue = self._queues[dao_id]
+                if not queue:
+                    del self._queues[dao_id]
+                    return
+                future, fn, args, kwargs = queue.popleft()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                with lock:
+                    result = fn(*args, **kwargs)
+            except BaseException as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+    def execute_transactions(self, transactions, batched=False):
+        """
+        Executes transactions for many DAOs concurrently. Transactions of the same DAO run
+        in submission order; different DAOs run in parallel.
+
+        Args:
+            transactions (list): DAOTransaction instances for any number of DAOs.
+            batched (bool): Record each DAO's transactions as one block with the TransactionEngine.
+
+        Returns:
+            list: One result message per transaction, in input order.
+        """
+        groups = {}  # dao_id -> (dao, [(position, transaction)])
+        for i, tx in enumerate(transactions):
+            groups.setdefault(tx.dao.dao_id, (tx.dao, []))[1].append((i, tx))
+        futures = [
+            (items, self.submit(dao, _run_group, items, batched))
+            for dao, items in groups.values()
+        ]
+        results = [None] * len(transactions)
+        for items, future in futures:
+            for (i, _), result in zip(items, future.result()):
+                results[i] = result
+        return results
+
+    def shutdown(self, wait=True):
+        """
+        Shuts down the worker threads.
+
+        Args:
+            wait (bool): Wait for pending work to finish.
+        """
+        self.pool.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+def _run_group(items, batched):
+    """
+    Executes the transactions of one DAO. Runs under the DAO's lock.
+
+    Args:
+        items (list): (position, transaction) pairs of the same DAO.
+        batched (bool): Use the TransactionEngine to record them as one block.
+
+    Returns:
+        list: The result messages, in order.
+    """
+    if batched:
+        first = items[0][1]
+        return TransactionEngine(first.dao, first.multisig_wallet).execute_batch([tx for _, tx in items])
+    return [tx.execute() for _, tx in items]
@@ -2,6 +2,11 @@
 import hashlib
 import time
 from Backend.Database import Blockchain
+from Backend.Features.events import (
+    DAOCreated, GovernanceRuleSet, MemberAdded, ProposalCreated, VoteCast
+)
+from Backend.metrics import metrics, CONTRACT_BLOCK_SECONDS, CONTRACT_GENERATION_SECONDS, CHAIN_LENGTH, DAO_MEMBERS
+from Backend.tracing import tracer
 
 # --- Utility Functions ---
 def generate_smart_contract_from_summary(summary):
@@ -38,6 +43,24 @@ def compile_solidity_to_bytecode(solidity_code):
     """
     return hashlib.sha256(solidity_code.encode()).hexdigest()
 
+def build_contract(dao):
+    """
+    Generates and compiles the smart contract of a DAO's current state, tracing each stage.
+
+    Args:
+        dao (DAOCreation): The DAO.
+
+    Returns:
+        tuple: (summary, Solidity contract, bytecode).
+    """
+    with tracer.span("dao.get_summary"):
+        summary = dao.get_summary()
+    with tracer.span("contract.generate"):
+        contract = generate_smart_contract_from_summary(summary)
+    with tracer.span("contract.compile"):
+        bytecode = compile_solidity_to_bytecode(contract)
+    return summary, contract, bytecode
+
 # --- DAO Creation Class ---
 class DAOCreation:
     """
@@ -54,18 +77,11 @@ def __init__(self, name, founders, token_name="REVO", initial_supply=1000000):
             token_name (str): The name of the DAO's token.
             initial_supply (int): The initial supply of the token.
         """
-        self.dao_id = str(uuid.uuid4())
-        self.name = name
-        self.founders = founders
-        self.token_name = token_name
-        self.initial_supply = initial_supply
-        self.creation_time = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-        self.wallets = {founder: initial_supply // len(founders) for founder in founders}
-        self.governance_rules = {}
-        self.proposals = []
-        self.members = set(founders)
         self.blockchain = Blockchain()  # Each DAO gets its own blockchain
-        self._add_smart_contract_block("DAO initialized")
+        # The creation event sets the DAO's fields, wallets, ledger and members
+        created = DAOCreated(str(uuid.uuid4()), name, founders, token_name, initial_supply,
+                             time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()))
+        self._record(created, "DAO initialized")
 
     def set_governance_rule(self, rule_name, value):
         """
@@ -78,8 +94,7 @@ def set_governance_rule(self, rule_name, value):
         Returns:
             str: Confirmation message.
         """
-        self.governance_rules[rule_name] = value
-        self._add_smart_contract_block(f"Set governance rule: {rule_name} = {value}")
+        self._record(GovernanceRuleSet(rule_name, value), f"Set governance rule: {rule_name} = {value}")
         return f"Rule '{rule_name}' set to {value}"
 
     def add_member(self, member_name):
@@ -92,9 +107,7 @@ def add_member(self, member_name):
         Returns:
             str: Confirmation message.
         """
-        self.members.add(member_name)
-        self.wallets[member_name] = 0
-        self._add_smart_contract_block(f"Added member: {member_name}")
+        self._record(MemberAdded(member_name), f"Added member: {member_name}")
         return f"Member '{member_name}' added."
 
     def create_proposal(self, title, description, proposer):
@@ -110,16 +123,8 @@ def create_proposal(self, title, description, proposer):
             str: The ID of the created proposal.
         """
         proposal_id = str(uuid.uuid4())
-        proposal = {
-            "id": proposal_id,
-            "title": title,
-            "description": description,
-            "proposer": proposer,
-            "votes": {},
-            "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-        }
-        self.proposals.append(proposal)
-        self._add_smart_contract_block(f"Created proposal: {title}")
+        created_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        self._record(ProposalCreated(proposal_id, title, description, proposer, created_at), f"Created proposal: {title}")
         return proposal_id
 
     def vote_on_proposal(self, proposal_id, member, vote):
@@ -136,8 +141,7 @@ def vote_on_proposal(self, proposal_id, member, vote):
         """
         for proposal in self.proposals:
             if proposal["id"] == proposal_id:
-                proposal["votes"][member] = vote
-                self._add_smart_contract_block(f"{member} voted '{vote}' on proposal '{proposal_id}'")
+                self._record(VoteCast(proposal_id, member, vote), f"{member} voted '{vote}' on proposal '{proposal_id}'")
                 return f"{member} voted '{vote}' on proposal '{proposal_id}'"
         return "Proposal not found."
 
@@ -161,22 +165,48 @@ def get_summary(self):
             "blockchain_length": len(self.blockchain.chain)
         }
 
-    def _add_smart_contract_block(self, action_desc):
+    def _record(self, event, action_desc):
+        """
+        Applies an event to the DAO and records it on the DAO's blockchain.
+
+        Args:
+            event (DAOEvent): The change to the DAO's state.
+            action_desc (str): A description of the action.
+        """
+        event.apply(self)
+        self._add_smart_contract_block(action_desc, event)
+
+    def _add_smart_contract_block(self, action_desc, event=None):
         """
         Adds a smart contract block to the DAO's blockchain.
 
         Args:
             action_desc (str): A description of the action.
+            event (DAOEvent): The typed event of the action, recorded so the DAO can be rebuilt from its chain.
         """
-        summary = self.get_summary()
-        contract = generate_smart_contract_from_summary(summary)
-        bytecode = compile_solidity_to_bytecode(contract)
-        tx = {
-            "type": "smart_contract",
-            "action": action_desc,
-            "dao_name": summary["name"],
-            "solidity": contract,
-            "bytecode": bytecode,
-            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-        }
-        self.blockchain.add_block([tx])
\ No newline at end of file
+        start = time.perf_counter() if metrics.enabled else None
+        with tracer.span("dao.contract_block", dao=self.dao_id):
+            summary, contract, bytecode = build_contract(self)
+            if start is not None:
+                CONTRACT_GENERATION_SECONDS.observe(time.perf_counter() - start)
+            tx = {
+                "type": "smart_contract",
+                "action": action_desc,
+                "dao_name": summary["name"],
+                "solidity": contract,
+                "bytecode": bytecode,
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+            }
+            if event is not None:
+                tx["event"] = event.to_dict()
+            self.blockchain.add_block([tx])
+        if start is not None:
+            CONTRACT_BLOCK_SECONDS.observe(time.perf_counter() - start)
+            self.record_gauges()
+
+    def record_gauges(self):
+        """
+        Publishes the DAO's chain length and member count to the metrics registry.
+        """
+        CHAIN_LENGTH.set(len(self.blockchain.chain), dao=self.dao_id)
+        DAO_MEMBERS.set(len(self.members), dao=self.dao_id)
\ No newline at end of file
@@ -0,0 +1,165 @@
+import copy
+from Backend.Features.ledger import TreasuryLedger
+from Backend.Features.idempotency import IdempotencyIndex
+
+class DAOEvent:
+    """
+    Base class for the typed events recorded on a DAO's chain with each change to its state.
+    Applying the events of a chain in order rebuilds the DAO.
+    """
+
+    event_type = None  # Event type recorded on the blockchain
+    fields = ()  # Names of the event's fields, in the order they are recorded
+
+    def __init__(self, *values, **named):
+        """
+        Initializes the event from its fields, given in order or by name.
+        """
+        if len(values) > len(self.fields):
+            raise TypeError(f"{type(self).__name__} takes {len(self.fields)} fields.")
+        named.update(zip(self.fields, values))
+        missing = [name for name in self.fields if name not in named]
+        unknown = [name for name in named if name not in self.fields]
+        if missing or unknown:
+            raise TypeError(f"{type(self).__name__} got missing fields {missing} and unknown fields {unknown}.")
+        for name in self.fields:
+            setattr(self, name, named[name])
+
+    def to_dict(self):
+        """
+        Builds the event's blockchain record. Fields are copied, so later changes to the DAO
+        cannot alter a recorded block.
+
+        Returns:
+            dict: The event type and fields.
+        """
+        return {"type": self.event_type, **copy.deepcopy({name: getattr(self, name) for name in self.fields})}
+
+    def apply(self, dao):
+        """
+        Applies the event to a DAO's state.
+
+        Args:
+            dao (DAOCreation): The DAO.
+        """
+        raise NotImplementedError
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.fields)
+        return f"{type(self).__name__}({values})"
+
+class DAOCreated(DAOEvent):
+    """
+    A DAO was created with its founders holding the initial supply.
+    """
+
+    event_type = "dao_created"
+    fields = ("dao_id", "name", "founders", "token_name", "initial_supply", "creation_time")
+
+    def apply(self, dao):
+        dao.dao_id = self.dao_id
+        dao.name = self.name
+        dao.founders = self.founders
+        dao.token_name = self.token_name
+        dao.initial_supply = self.initial_supply
+        dao.creation_time = self.creation_time
+        dao.wallets = {founder: self.initial_supply // len(self.founders) for founder in self.founders}
+        dao.ledger = TreasuryLedger(dao.wallets)  # Treasury account and running aggregates over the wallets
+        dao.idempotency = IdempotencyIndex()  # Results of recently executed transactions by idempotency key
+        dao.governance_rules = {}
+        dao.proposals = []
+        dao.members = set(self.founders)
+
+class GovernanceRuleSet(DAOEvent):
+    """
+    A governance rule was set or changed.
+    """
+
+    event_type = "governance_rule_set"
+    fields = ("rule_name", "value")
+
+    def apply(self, dao):
+        dao.governance_rules[self.rule_name] = self.value
+
+class MemberAdded(DAOEvent):
+    """
+    A member joined the DAO. A new wallet starts empty; tokens the member already holds,
+    e.g. from a token sale before joining, are kept so the wallets still add up to the ledger's supply.
+    """
+
+    event_type = "member_added"
+    fields = ("member",)
+
+    def apply(self, dao):
+        dao.members.add(self.member)
+        dao.wallets.setdefault(self.member, 0)
+
+class ProposalCreated(DAOEvent):
+    """
+    A proposal was created.
+    """
+
+    event_type = "proposal_created"
+    fields = ("proposal_id", "title", "description", "proposer", "created_at")
+
+    def apply(self, dao):
+        dao.proposals.append({
+            "id": self.proposal_id,
+            "title": self.title,
+            "description": self.description,
+            "proposer": self.proposer,
+            "votes": {},
+            "created_at": self.created_at
+        })
+
+class VoteCast(DAOEvent):
+    """
+    A member voted on a proposal; a later vote of the same member replaces the earlier one.
+    """
+
+    event_type = "vote_cast"
+    fields = ("proposal_id", "member", "vote")
+
+    def apply(self, dao):
+        for proposal in dao.proposals:
+            if proposal["id"] == self.proposal_id:
+                proposal["votes"][self.member] = self.vote
+                return
+        raise ValueError(f"Proposal '{self.proposal_id}' not found.")
+
+class ProposalEnacted(DAOEvent):
+    """
+    A proposal passed. Proposal objects and their status live outside the DAO,
+    so the event is recorded for the audit trail and changes no DAO state.
+    """
+
+    event_type = "proposal_enacted"
+    fields = ("title",)
+
+    def apply(self, dao):
+        pass
+
+EVENT_TYPES = {cls.event_type: cls for cls in (
+    DAOCreated, GovernanceRuleSet, MemberAdded, ProposalCreated, VoteCast, ProposalEnacted
+)}
+
+def event_from_dict(data):
+    """
+    Rebuilds an event from its blockchain record.
+
+    Args:
+        data (dict): The record written by DAOEvent.to_dict().
+
+    Returns:
+        DAOEvent: The event.
+
+    Raises:
+        ValueError: If the event type is unknown.
+    """
+    cls = EVENT_TYPES.get(data.get("type"))
+    if cls is None:
+        raise ValueError(f"Unknown event type: {data.get('type')}")
+    return cls(**{name: value for name, value in data.items() if name != "type"})
@@ -0,0 +1,75 @@
+import time
+from collections import OrderedDict
+
+MISSING = object()  # Returned by lookup() for unknown or expired keys
+
+
+class IdempotencyIndex:
+    """
+    Bounded index of executed idempotency keys and their results, with time-based eviction.
+    """
+
+    def __init__(self, ttl_seconds=300, max_entries=10000, clock=time.time):
+        """
+        Initializes the index.
+
+        Args:
+            ttl_seconds (float): How long a key is remembered after it was recorded.
+            max_entries (int): Maximum number of keys kept; the oldest are evicted first.
+            clock (callable): Returns the current time in seconds.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.clock = clock
+        self._entries = OrderedDict()  # key -> (expires_at, result), oldest first
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, key):
+        """
+        Looks up the result recorded for a key.
+
+        Args:
+            key (str): The idempotency key.
+
+        Returns:
+            The recorded result, or MISSING if the key is unknown or expired.
+        """
+        self._evict(self.clock())
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return MISSING
+        self.hits += 1
+        return entry[1]
+
+    def remember(self, key, result, recorded_at=None):
+        """
+        Records the result of an executed key.
+
+        Args:
+            key (str): The idempotency key.
+            result: The result returned to the caller.
+            recorded_at (float): When the key was executed, e.g. when it is replayed from the chain. Defaults to now.
+        """
+        now = self.clock() if recorded_at is None else recorded_at
+        self._entries[key] = (now + self.ttl_seconds, result)
+        self._entries.move_to_end(key)
+        self._evict(now)
+
+    def _evict(self, now):
+        """
+        Drops expired keys and keys beyond the size limit, oldest first.
+
+        Args:
+            now (float): The current time.
+        """
+        entries = self._entries
+        while entries:
+            key, (expires_at, _) = next(iter(entries.items()))
+            if expires_at > now and len(entries) <= self.max_entries:
+                break
+            entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self._entries)
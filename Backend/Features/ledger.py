@@ -0,0 +1,148 @@
+# --- Ledger Accounts ---
+TREASURY_ACCOUNT = "__treasury__"  # The DAO treasury
+ISSUANCE_ACCOUNT = "__issuance__"  # Source of newly minted tokens
+EXTERNAL_ACCOUNT = "__external__"  # Tokens that left the DAO, e.g. investments
+
+# Accounts that may hold a negative balance
+UNBOUNDED_ACCOUNTS = {ISSUANCE_ACCOUNT, EXTERNAL_ACCOUNT}
+
+
+class InsufficientBalanceError(Exception):
+    """
+    Raised when a posting would overdraw an account.
+    """
+
+
+class TreasuryLedger:
+    """
+    Double-entry ledger of a DAO's token balances with a treasury account and running aggregates.
+    """
+
+    def __init__(self, member_balances):
+        """
+        Initializes the ledger over the DAO's member wallets.
+
+        Args:
+            member_balances (dict): The DAO's wallets; member balances are kept in this dict.
+        """
+        self.member_balances = member_balances  # Shared with DAOCreation.wallets
+        self.treasury_balance = 0
+        self.system_balances = {ISSUANCE_ACCOUNT: -sum(member_balances.values()), EXTERNAL_ACCOUNT: 0}
+        self.total_supply = sum(member_balances.values())
+        self.inflow = {}  # tx type -> amount credited to the treasury
+        self.outflow = {}  # tx type -> amount debited from the treasury
+        self.sale_proceeds = 0  # Currency raised by token sales
+        self.posting_count = 0
+
+    def balance(self, account):
+        """
+        Retrieves the balance of an account.
+
+        Args:
+            account (str): A member name or one of the ledger accounts.
+
+        Returns:
+            The balance of the account.
+        """
+        if account == TREASURY_ACCOUNT:
+            return self.treasury_balance
+        if account in self.system_balances:
+            return self.system_balances[account]
+        return self.member_balances.get(account, 0)
+
+    def check(self, legs):
+        """
+        Checks that a set of postings can be applied without overdrawing any account.
+
+        Args:
+            legs (list): (debit_account, credit_account, amount) tuples.
+
+        Returns:
+            tuple: (True, None) if the postings are covered, otherwise (False, reason).
+        """
+        for account, delta in _net_deltas(legs).items():
+            if delta < 0 and account not in UNBOUNDED_ACCOUNTS and self.balance(account) + delta < 0:
+                return False, f"Insufficient balance in '{_display_name(account)}'."
+        return True, None
+
+    def post(self, tx_type, legs):
+        """
+        Atomically applies a set of postings: either every leg is applied or none is.
+
+        Args:
+            tx_type (str): The transaction type the postings belong to.
+            legs (list): (debit_account, credit_account, amount) tuples; each leg moves
+                `amount` out of the debit account into the credit account.
+
+        Raises:
+            InsufficientBalanceError: If an account would be overdrawn.
+        """
+        for _, _, amount in legs:
+            if amount <= 0:
+                raise ValueError("Posting amounts must be positive.")
+        ok, reason = self.check(legs)
+        if not ok:
+            raise InsufficientBalanceError(reason)
+        for account, delta in _net_deltas(legs).items():
+            if account == TREASURY_ACCOUNT:
+                self.treasury_balance += delta
+            elif account in self.system_balances:
+                self.system_balances[account] += delta
+            else:
+                self.member_balances[account] = self.member_balances.get(account, 0) + delta
+        for debit, credit, amount in legs:
+            if credit == TREASURY_ACCOUNT:
+                self.inflow[tx_type] = self.inflow.get(tx_type, 0) + amount
+            if debit == TREASURY_ACCOUNT:
+                self.outflow[tx_type] = self.outflow.get(tx_type, 0) + amount
+            if debit == ISSUANCE_ACCOUNT:
+                self.total_supply += amount
+            if credit == ISSUANCE_ACCOUNT:
+                self.total_supply -= amount
+        self.posting_count += len(legs)
+
+    def record_sale_proceeds(self, proceeds):
+        """
+        Adds the currency raised by a token sale to the running aggregates.
+
+        Args:
+            proceeds: The amount raised.
+        """
+        self.sale_proceeds += proceeds
+
+    def is_solvent(self):
+        """
+        Checks that the treasury is not overdrawn.
+
+        Returns:
+            bool: True if the treasury balance is non-negative.
+        """
+        return self.treasury_balance >= 0
+
+    def report(self):
+        """
+        Builds a treasury report from the running aggregates.
+
+        Returns:
+            dict: The treasury report.
+        """
+        return {
+            "total_supply": self.total_supply,
+            "treasury_balance": self.treasury_balance,
+            "circulating_supply": self.total_supply - self.treasury_balance - self.system_balances[EXTERNAL_ACCOUNT],
+            "invested": self.system_balances[EXTERNAL_ACCOUNT],
+            "inflow": dict(self.inflow),
+            "outflow": dict(self.outflow),
+            "sale_proceeds": self.sale_proceeds,
+            "solvent": self.is_solvent()
+        }
+
+def _net_deltas(legs):
+    deltas = {}
+    for debit, credit, amount in legs:
+        deltas[debit] = deltas.get(debit, 0) - amount
+        deltas[credit] = deltas.get(credit, 0) + amount
+    return deltas
+
+def _display_name(account):
+    return "treasury" if account == TREASURY_ACCOUNT else account
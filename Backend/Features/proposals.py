@@ -1,10 +1,10 @@
-import uuid
-import hashlib
 import time
-import pandas as pd
-import numpy as np
-import re
+import functools
+from Backend.Features.rule_vm import RuleProgram, RuleVM
 from Backend.Features.dao_creation import generate_smart_contract_from_summary, compile_solidity_to_bytecode
+from Backend.Features.events import ProposalEnacted
+from Backend.metrics import metrics, VOTING_TALLY_SECONDS
+from Backend.tracing import tracer
 
 class Proposal:
     """
@@ -58,15 +58,50 @@ def parse_proposal_keywords(proposal_string):
             found.append(v)
     return found
 
+def rule_vm(dao, rule_type):
+    """
+    Retrieves the VM of the DAO's active governance rule contract of a type.
+
+    Args:
+        dao (DAOCreation): The DAO.
+        rule_type (str): "quorum", "voting_time" or "proposal_cost".
+
+    Returns:
+        RuleVM: The VM of the most recently recorded contract, or None if the chain has none.
+    """
+    entry = dao.blockchain.contract_registry.active_rule(rule_type)
+    if entry is None or "rule_bytecode" not in entry["transaction"]:
+        return None
+    return _load_rule_vm(entry["transaction"]["rule_bytecode"])
+
+@functools.lru_cache(maxsize=256)
+def _load_rule_vm(rule_bytecode):
+    # Programs are immutable once recorded, so each is decoded once per process
+    return RuleVM(RuleProgram.from_hex(rule_bytecode))
+
+def _quorum(dao, vm):
+    if vm is not None:
+        return vm.call("quorum", totalMembers=len(dao.members))
+    return dao.governance_rules.get("quorum", (len(dao.members) // 2) + 1)
+
 def validate_proposal(proposal, dao):
+    # Rule contracts recorded on the DAO's chain decide; governance_rules and the defaults apply without one
     # Check proposal cost
-    cost = dao.governance_rules.get("proposal_cost", 0)
-    if dao.wallets.get(proposal.proposer, 0) < cost:
+    cost_vm = rule_vm(dao, "proposal_cost")
+    balance = dao.wallets.get(proposal.proposer, 0)
+    if cost_vm is not None:
+        cost = cost_vm.call("proposalCost")
+        can_submit = cost_vm.call("canSubmitProposal", balance)
+    else:
+        cost = dao.governance_rules.get("proposal_cost", 0)
+        can_submit = balance >= cost
+    if not can_submit:
         return False, "Insufficient tokens to submit proposal."
     # Check voting time
-    voting_time = dao.governance_rules.get("voting_time_hours", 48) * 3600
+    time_vm = rule_vm(dao, "voting_time")
+    voting_time = time_vm.call("VotingTime") if time_vm is not None else dao.governance_rules.get("voting_time_hours", 48) * 3600
     # Check quorum
-    quorum = dao.governance_rules.get("quorum", (len(dao.members) // 2) + 1)
+    quorum = _quorum(dao, rule_vm(dao, "quorum"))
     return True, {"cost": cost, "voting_time": voting_time, "quorum": quorum}
 
 def start_voting(proposal):
@@ -107,14 +142,33 @@ def check_voting_result(proposal, dao):
     Returns:
         str: The result of the voting process.
     """
+    with tracer.span("proposal.tally", dao=dao.dao_id, votes=len(proposal.votes)):
+        if not metrics.enabled:
+            return _tally(proposal, dao)
+        start = time.perf_counter()
+        result = _tally(proposal, dao)
+        VOTING_TALLY_SECONDS.observe(time.perf_counter() - start)
+        return result
+
+def _tally(proposal, dao):
+    # Rule contracts recorded on the DAO's chain decide; governance_rules and the defaults apply without one
     # Check voting time
-    voting_time = dao.governance_rules.get("voting_time_hours", 48) * 3600
-    if int(time.time()) - proposal.created_at > voting_time:
+    time_vm = rule_vm(dao, "voting_time")
+    if time_vm is not None:
+        deadline = time_vm.call("getVotingDeadline", proposal.created_at)
+    else:
+        deadline = proposal.created_at + dao.governance_rules.get("voting_time_hours", 48) * 3600
+    if int(time.time()) > deadline:
         proposal.status = "failed"
         return "Voting time expired."
     # Check quorum
-    quorum = dao.governance_rules.get("quorum", (len(dao.members) // 2) + 1)
-    if len(proposal.votes) < quorum:
+    quorum_vm = rule_vm(dao, "quorum")
+    quorum = _quorum(dao, quorum_vm)
+    if quorum_vm is not None:
+        quorum_met = quorum_vm.call("isQuorumMet", len(proposal.votes), totalMembers=len(dao.members))
+    else:
+        quorum_met = len(proposal.votes) >= quorum
+    if not quorum_met:
         proposal.status = "draft"
         return "Quorum not met."
     yes_votes = sum(1 for v in proposal.votes.values() if v == "yes")
@@ -125,7 +179,7 @@ def check_voting_result(proposal, dao):
         summary = dao.get_summary()
         contract = generate_smart_contract_from_summary(summary)
         bytecode = compile_solidity_to_bytecode(contract)
-        dao._add_smart_contract_block(f"Proposal passed and enacted: {proposal.title}")
+        dao._record(ProposalEnacted(proposal.title), f"Proposal passed and enacted: {proposal.title}")
         return "Proposal passed."
     else:
         proposal.status = "failed"
@@ -0,0 +1,223 @@
+import os
+import json
+import time
+import hashlib
+import calendar
+from concurrent.futures import ProcessPoolExecutor
+from Backend.Features.dao_creation import DAOCreation
+from Backend.Features.events import DAOEvent, DAOCreated, event_from_dict
+from Backend.Features.transactions import DAOTransaction, TRANSACTION_CLASSES
+from Backend.Features.snapshot import loads, load_snapshot
+from Backend.tracing import tracer
+
+class ReplayError(ValueError):
+    """
+    Raised when a chain is broken, does not extend a snapshot, or holds events that cannot be applied.
+    """
+
+class TransactionExecuted(DAOEvent):
+    """
+    A ledger transaction executed on the DAO. Its blockchain record is the event, so it is
+    read from the chain rather than recorded separately.
+    """
+
+    event_type = "transaction_executed"
+    fields = ("record",)
+
+    def to_dict(self):
+        # Contracts are left out of the audit trail; the block hash covers them
+        return {"type": self.event_type,
+                "transaction": {k: v for k, v in self.record.items() if k not in ("solidity", "bytecode")}}
+
+    def apply(self, dao):
+        tx = DAOTransaction.from_record(dao, self.record)
+        tx.apply()
+        if tx.idempotency_key is not None:
+            # Keys expire relative to when they were executed, not when they are replayed
+            recorded_at = calendar.timegm(time.strptime(tx.timestamp, "%Y-%m-%dT%H:%M:%SZ"))
+            dao.idempotency.remember(tx.idempotency_key, tx.success_message(), recorded_at)
+
+def block_events(block):
+    """
+    Reads the typed events of a block, in the order they were applied.
+
+    Args:
+        block (Block): The block.
+
+    Returns:
+        list: DAOEvent objects. Smart contracts without an event, such as governance rule contracts
+        and batch headers, change no DAO state and are skipped.
+    """
+    events = []
+    for tx in block.transactions:
+        if not isinstance(tx, dict):
+            continue
+        if "event" in tx:
+            events.append(event_from_dict(tx["event"]))
+        elif tx.get("type") in TRANSACTION_CLASSES:
+            events.append(TransactionExecuted(tx))
+    return events
+
+def verify_chain(blockchain, start=0):
+    """
+    Checks that each block links to the previous one and still matches its hash.
+
+    Args:
+        blockchain (Blockchain): The chain.
+        start (int): The first block checked.
+
+    Raises:
+        ReplayError: At the first broken block.
+    """
+    chain = blockchain.chain
+    for index in range(start, len(chain)):
+        block = chain[index]
+        if block.index != index:
+            raise ReplayError(f"Block {index} is recorded with index {block.index}.")
+        if index > 0 and block.previous_hash != chain[index - 1].hash:
+            raise ReplayError(f"Block {index} does not link to block {index - 1}.")
+        if block.hash_block() != block.hash:
+            raise ReplayError(f"Block {index} does not match its hash.")
+
+def audit_trail(blockchain, start=0, stop=None):
+    """
+    Lists the events of a chain with the blocks that record them.
+
+    Args:
+        blockchain (Blockchain): The chain.
+        start (int): The first block listed.
+        stop (int): The block after the last one listed. Defaults to the end of the chain.
+
+    Returns:
+        list: Dicts with block, timestamp, hash, previous_hash and event.
+    """
+    trail = []
+    for block in blockchain.chain[start:stop]:
+        for event in block_events(block):
+            trail.append({"block": block.index, "timestamp": block.timestamp, "hash": block.hash,
+                          "previous_hash": block.previous_hash, "event": event.to_dict()})
+    return trail
+
+def replay(blockchain, snapshot=None, verify=True):
+    """
+    Rebuilds a DAO's members, wallets, ledger, governance rules, proposals and idempotency keys
+    by applying the events recorded on its chain.
+
+    Args:
+        blockchain (Blockchain): The DAO's chain.
+        snapshot: A snapshot of the DAO at an earlier height of the same chain, as a file path,
+            a bytes-like object or a restored DAOCreation (which is updated in place). Only the
+            blocks after it are replayed.
+        verify (bool): Check the links and hashes of the replayed blocks first.
+
+    Returns:
+        DAOCreation: The rebuilt DAO, holding the given blockchain.
+
+    Raises:
+        ReplayError: If the chain is broken, does not extend the snapshot, or an event cannot be applied.
+    """
+    chain = blockchain.chain
+    if snapshot is None:
+        dao = DAOCreation.__new__(DAOCreation)
+        start = 0
+    else:
+        dao = _restore(snapshot)
+        start = len(dao.blockchain.chain)
+        if start > len(chain) or dao.blockchain.chain[-1].hash != chain[start - 1].hash:
+            raise ReplayError("The snapshot was not taken from this chain.")
+    if verify:
+        verify_chain(blockchain, start)
+    with tracer.span("dao.replay", blocks=len(chain) - start, snapshot=snapshot is not None):
+        created = snapshot is not None
+        for block in chain[start:]:
+            for event in block_events(block):
+                if not created and not isinstance(event, DAOCreated):
+                    raise ReplayError(f"Block {block.index} has a {event.event_type} event before the DAO's "
+                                      "creation event; the chain may predate typed events.")
+                created = True
+                try:
+                    event.apply(dao)
+                except Exception as exc:
+                    raise ReplayError(f"Block {block.index}: {event.event_type} could not be applied: {exc}") from exc
+    if not created:
+        raise ReplayError("The chain has no DAO creation event.")
+    dao.blockchain = blockchain
+    return dao
+
+def replay_many(sources, max_workers=None):
+    """
+    Rebuilds many DAOs in a process pool, e.g. to recover every DAO of a service after a restart.
+
+    Args:
+        sources (Mapping): DAO ID -> Blockchain, or -> (Blockchain, snapshot) to replay from a
+            snapshot. Snapshot file paths are cheapest, since each worker loads its own.
+        max_workers (int): Number of worker processes. Defaults to the number of CPUs;
+            1 replays in the calling process.
+
+    Returns:
+        dict: DAO ID -> rebuilt DAOCreation, holding the given blockchain.
+
+    Raises:
+        ReplayError: If any DAO cannot be rebuilt.
+    """
+    items = [(dao_id, *(source if isinstance(source, tuple) else (source, None))) for dao_id, source in sources.items()]
+    workers = max_workers or os.cpu_count() or 1
+    if workers == 1 or len(items) < 2:
+        states = [_replay_state(item) for item in items]
+    else:
+        chunksize = max(1, len(items) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            states = list(executor.map(_replay_state, items, chunksize=chunksize))
+    daos = {}
+    for (dao_id, blockchain, _), dao in zip(items, states):
+        dao.blockchain = blockchain
+        daos[dao_id] = dao
+    return daos
+
+def _replay_state(item):
+    """
+    Rebuilds one DAO without its chain, which the caller already holds. Runs in worker processes.
+    """
+    _, blockchain, snapshot = item
+    dao = replay(blockchain, snapshot)
+    dao.blockchain = None
+    return dao
+
+def state_digest(dao):
+    """
+    Hashes a DAO's state, e.g. to check that a replayed DAO matches the live one.
+    Idempotency keys are left out, since their expiry depends on the clock.
+
+    Args:
+        dao (DAOCreation): The DAO.
+
+    Returns:
+        str: The SHA-256 hex digest.
+    """
+    ledger = {field: value for field, value in vars(dao.ledger).items() if field != "member_balances"}
+    state = {
+        "dao_id": dao.dao_id,
+        "name": dao.name,
+        "founders": dao.founders,
+        "token_name": dao.token_name,
+        "initial_supply": dao.initial_supply,
+        "creation_time": dao.creation_time,
+        "members": sorted(dao.members, key=str),
+        "wallets": sorted(([str(member), balance] for member, balance in dao.wallets.items())),
+        "governance_rules": dao.governance_rules,
+        "proposals": dao.proposals,
+        "ledger": ledger,
+    }
+    return hashlib.sha256(json.dumps(state, sort_keys=True, default=_canonical).encode()).hexdigest()
+
+def _restore(snapshot):
+    if isinstance(snapshot, DAOCreation):
+        return snapshot
+    if isinstance(snapshot, (str, os.PathLike)):
+        return load_snapshot(snapshot)
+    return loads(snapshot)
+
+def _canonical(value):
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    return repr(value)
@@ -0,0 +1,341 @@
+import sys
+import struct
+
+# --- Rule VM Opcodes ---
+OP_PUSH = 0x01  # Push a signed 64-bit constant
+OP_ARG = 0x02   # Push a call argument by position
+OP_ENV = 0x03   # Push an environment value (e.g. totalMembers) by slot
+OP_ADD = 0x10
+OP_SUB = 0x11
+OP_MUL = 0x12
+OP_DIV = 0x13   # Integer division, as in Solidity
+OP_GE = 0x20
+OP_RET = 0xFF
+
+MAGIC = b"RVM1"
+
+_OPERAND_FORMATS = {OP_PUSH: ">q", OP_ARG: ">B", OP_ENV: ">B"}
+
+
+class RuleVMError(Exception):
+    """
+    Raised when a rule program is malformed or cannot be evaluated.
+    """
+
+
+class RuleProgram:
+    """
+    Represents the compact bytecode of a governance rule contract.
+    """
+
+    def __init__(self, rule_type, functions, env=()):
+        """
+        Initializes a rule program.
+
+        Args:
+            rule_type (str): The rule type ("quorum", "voting_time" or "proposal_cost").
+            functions (dict): Mapping of function name to its bytecode.
+            env (tuple): Names of the environment values the program reads.
+        """
+        self.rule_type = rule_type
+        self.functions = dict(functions)
+        self.env = tuple(env)
+        self._decoded = {}  # Decoded instructions per function, filled on first call
+
+    def to_bytes(self):
+        """
+        Serializes the program to its binary form.
+
+        Returns:
+            bytes: The serialized program.
+        """
+        out = [MAGIC, _pack_name(self.rule_type), struct.pack(">B", len(self.env))]
+        out.extend(_pack_name(name) for name in self.env)
+        out.append(struct.pack(">B", len(self.functions)))
+        for name, code in self.functions.items():
+            out.append(_pack_name(name))
+            out.append(struct.pack(">H", len(code)))
+            out.append(code)
+        return b"".join(out)
+
+    def to_hex(self):
+        """
+        Serializes the program to a hex string suitable for a blockchain transaction.
+
+        Returns:
+            str: The hex-encoded program.
+        """
+        return self.to_bytes().hex()
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Deserializes a program from its binary form.
+
+        Args:
+            data (bytes): The serialized program.
+
+        Returns:
+            RuleProgram: The deserialized program.
+
+        Raises:
+            RuleVMError: If the data is not a valid rule program.
+        """
+        data = memoryview(data)
+        if bytes(data[:4]) != MAGIC:
+            raise RuleVMError("Not a rule program")
+        try:
+            pos = 4
+            rule_type, pos = _unpack_name(data, pos)
+            env = []
+            count = data[pos]
+            pos += 1
+            for _ in range(count):
+                name, pos = _unpack_name(data, pos)
+                env.append(name)
+            functions = {}
+            count = data[pos]
+            pos += 1
+            for _ in range(count):
+                name, pos = _unpack_name(data, pos)
+                (length,) = struct.unpack_from(">H", data, pos)
+                pos += 2
+                functions[name] = bytes(data[pos:pos + length])
+                pos += length
+        except (IndexError, struct.error) as exc:
+            raise RuleVMError(f"Truncated rule program: {exc}")
+        return cls(rule_type, functions, env)
+
+    @classmethod
+    def from_hex(cls, hex_string):
+        """
+        Deserializes a program from a hex string.
+
+        Args:
+            hex_string (str): The hex-encoded program.
+
+        Returns:
+            RuleProgram: The deserialized program.
+        """
+        return cls.from_bytes(bytes.fromhex(hex_string))
+
+    def decode(self, function_name):
+        """
+        Decodes the bytecode of a function into (opcode, operand) pairs.
+
+        Args:
+            function_name (str): The name of the function.
+
+        Returns:
+            list: The decoded instructions.
+
+        Raises:
+            RuleVMError: If the function does not exist or its bytecode is invalid.
+        """
+        decoded = self._decoded.get(function_name)
+        if decoded is not None:
+            return decoded
+        code = self.functions.get(function_name)
+        if code is None:
+            raise RuleVMError(f"Unknown function '{function_name}' in {self.rule_type} rule")
+        decoded = []
+        pos = 0
+        while pos < len(code):
+            op = code[pos]
+            pos += 1
+            fmt = _OPERAND_FORMATS.get(op)
+            if fmt is None:
+                decoded.append((op, None))
+                continue
+            try:
+                (operand,) = struct.unpack_from(fmt, code, pos)
+            except struct.error:
+                raise RuleVMError(f"Truncated operand in '{function_name}'")
+            pos += struct.calcsize(fmt)
+            decoded.append((op, operand))
+        self._decoded[function_name] = decoded
+        return decoded
+
+
+class RuleVM:
+    """
+    A small stack machine that evaluates governance rule programs locally.
+    """
+
+    def __init__(self, program):
+        """
+        Initializes the VM for a rule program.
+
+        Args:
+            program (RuleProgram): The program to evaluate.
+        """
+        self.program = program
+
+    def call(self, function_name, *args, **env):
+        """
+        Calls a function of the program with scalar arguments.
+
+        Args:
+            function_name (str): The function to call, e.g. "isQuorumMet".
+            *args: The positional arguments of the function.
+            **env: Environment values, e.g. totalMembers=10.
+
+        Returns:
+            int or bool: The value returned by the function.
+        """
+        return _to_python(self._run(function_name, args, env))
+
+    def call_batch(self, function_name, *arrays, **env):
+        """
+        Calls a function of the program over arrays of inputs in one pass.
+
+        Args:
+            function_name (str): The function to call.
+            *arrays: One array-like per positional argument.
+            **env: Environment values; scalars or arrays broadcast against the inputs.
+
+        Returns:
+            numpy.ndarray: One result per input row.
+        """
+        import numpy as np  # Only batch calls need numpy, so loading the VM stays cheap
+        args = [np.asarray(a, dtype=np.int64) for a in arrays]
+        env = {k: np.asarray(v, dtype=np.int64) for k, v in env.items()}
+        result = self._run(function_name, args, env)
+        shape = np.broadcast_shapes(*(a.shape for a in args)) if args else ()
+        return np.broadcast_to(result, shape).copy()
+
+    def _run(self, function_name, args, env):
+        """
+        Runs the decoded instructions of a function.
+
+        Args:
+            function_name (str): The function to run.
+            args (sequence): The call arguments.
+            env (dict): The environment values.
+
+        Returns:
+            The value on top of the stack at OP_RET.
+        """
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        for op, operand in self.program.decode(function_name):
+            if op == OP_PUSH:
+                push(operand)
+            elif op == OP_ARG:
+                if operand >= len(args):
+                    raise RuleVMError(f"'{function_name}' expects at least {operand + 1} argument(s)")
+                push(args[operand])
+            elif op == OP_ENV:
+                name = self.program.env[operand]
+                if name not in env:
+                    raise RuleVMError(f"Missing environment value '{name}'")
+                push(env[name])
+            elif op == OP_RET:
+                return pop()
+            else:
+                b = pop()
+                a = pop()
+                if op == OP_ADD:
+                    push(a + b)
+                elif op == OP_SUB:
+                    push(a - b)
+                elif op == OP_MUL:
+                    push(a * b)
+                elif op == OP_DIV:
+                    zero = b == 0
+                    if zero.any() if hasattr(zero, "any") else zero:
+                        raise RuleVMError("Division by zero")
+                    push(a // b)
+                elif op == OP_GE:
+                    push(a >= b)
+                else:
+                    raise RuleVMError(f"Unknown opcode 0x{op:02x}")
+        raise RuleVMError(f"'{function_name}' returned without OP_RET")
+
+
+# --- Assembler ---
+def assemble(*instructions):
+    """
+    Assembles (opcode, operand) pairs into bytecode.
+
+    Args:
+        *instructions: Opcodes, or (opcode, operand) tuples for opcodes that take an operand.
+
+    Returns:
+        bytes: The bytecode.
+    """
+    out = bytearray()
+    for ins in instructions:
+        op, operand = ins if isinstance(ins, tuple) else (ins, None)
+        out.append(op)
+        fmt = _OPERAND_FORMATS.get(op)
+        if fmt is not None:
+            out += struct.pack(fmt, operand)
+    return bytes(out)
+
+def assemble_quorum(percent, plus):
+    """
+    Assembles the program of a quorum rule: quorum = (totalMembers * percent) / 100 + plus.
+
+    Args:
+        percent (int): The percentage of members required for quorum.
+        plus (int): Additional votes required.
+
+    Returns:
+        RuleProgram: The program exposing `quorum()` and `isQuorumMet(votes)`.
+    """
+    quorum = [(OP_ENV, 0), (OP_PUSH, percent), OP_MUL, (OP_PUSH, 100), OP_DIV, (OP_PUSH, plus), OP_ADD]
+    return RuleProgram("quorum", {
+        "quorum": assemble(*quorum, OP_RET),
+        "isQuorumMet": assemble((OP_ARG, 0), *quorum, OP_GE, OP_RET),
+    }, env=("totalMembers",))
+
+def assemble_voting_time(seconds):
+    """
+    Assembles the program of a voting time rule.
+
+    Args:
+        seconds (int): The voting time in seconds.
+
+    Returns:
+        RuleProgram: The program exposing `VotingTime()` and `getVotingDeadline(proposalCreatedAt)`.
+    """
+    return RuleProgram("voting_time", {
+        "VotingTime": assemble((OP_PUSH, seconds), OP_RET),
+        "getVotingDeadline": assemble((OP_ARG, 0), (OP_PUSH, seconds), OP_ADD, OP_RET),
+    })
+
+def assemble_proposal_cost(cost):
+    """
+    Assembles the program of a proposal cost rule.
+
+    Args:
+        cost (int): The cost of submitting a proposal.
+
+    Returns:
+        RuleProgram: The program exposing `proposalCost()` and `canSubmitProposal(balance)`.
+    """
+    return RuleProgram("proposal_cost", {
+        "proposalCost": assemble((OP_PUSH, cost), OP_RET),
+        "canSubmitProposal": assemble((OP_ARG, 0), (OP_PUSH, cost), OP_GE, OP_RET),
+    })
+
+
+# --- Helpers ---
+def _pack_name(name):
+    encoded = name.encode()
+    return struct.pack(">B", len(encoded)) + encoded
+
+def _unpack_name(data, pos):
+    length = data[pos]
+    start = pos + 1
+    return bytes(data[start:start + length]).decode(), start + length
+
+def _to_python(value):
+    np = sys.modules.get("numpy")  # Numpy results only come from numpy inputs, so it is loaded by then
+    if isinstance(value, bool) or np is not None and isinstance(value, np.bool_):
+        return bool(value)
+    if np is not None and isinstance(value, np.ndarray):
+        return value
+    return int(value)
@@ -0,0 +1,605 @@
+import re
+import json
+import asyncio
+import argparse
+import contextvars
+from http import HTTPStatus
+from urllib.parse import urlsplit, parse_qs, unquote
+from concurrent.futures import ThreadPoolExecutor
+from Backend.Database.blockchain import MultiSigWallet
+from Backend.Features.dao_creation import DAOCreation
+from Backend.Features.proposals import Proposal, start_voting, cast_vote, check_voting_result
+from Backend.Features.transaction_engine import TransactionEngine
+from Backend.Features.concurrency import dao_locks
+from Backend.Features.replay import audit_trail
+from Backend.tracing import tracer
+from Backend.memory import memory_report, allocations
+from Backend.Features.transactions import (
+    TokenSaleTransaction, TreasuryContributionTransaction,
+    FundDistributionTransaction, InvestmentTransaction
+)
+
+# Backpressure limits; requests beyond them are answered with 503 instead of queueing without bound
+MAX_CONNECTIONS = 1024
+MAX_IN_FLIGHT = 4096  # Requests being handled across all connections
+MAX_PIPELINE_DEPTH = 64  # Requests read ahead on one connection before reading pauses
+MAX_PENDING_WRITES = 10000  # Transactions waiting for their DAO's next block
+MAX_BATCH = 1000  # Transactions recorded per block
+MAX_HEADER_BYTES = 16 * 1024
+MAX_BODY_BYTES = 1024 * 1024
+
+class ServiceError(Exception):
+    """
+    An error answered with an HTTP status and a JSON error message.
+    """
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+class DAOService:
+    """
+    In-memory DAOs with their operations, where concurrent transactions of the same DAO are
+    grouped into one block per batch.
+    """
+
+    def __init__(self, max_pending_writes=MAX_PENDING_WRITES, max_batch=MAX_BATCH, workers=None):
+        """
+        Initializes the service.
+
+        Args:
+            max_pending_writes (int): Transactions allowed to wait per DAO before writes are refused.
+            max_batch (int): Maximum transactions recorded per block.
+            workers (int): Threads running backend work. Defaults to the ThreadPoolExecutor default.
+        """
+        self.max_pending_writes = max_pending_writes
+        self.max_batch = max_batch
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dao-service")
+        self.daos = {}  # dao_id -> DAOCreation
+        self.wallets = {}  # dao_id -> MultiSigWallet
+        self.proposals = {}  # (dao_id, title) -> Proposal
+        self._pending = {}  # dao_id -> [(transaction, future)] waiting for the next block
+        self._draining = set()  # DAOs whose pending writes are being recorded
+        self.blocks_written = 0
+        self.transactions_written = 0
+
+    def dao(self, dao_id):
+        """
+        Retrieves a DAO, answering 404 when it does not exist.
+        """
+        dao = self.daos.get(dao_id)
+        if dao is None:
+            raise ServiceError(HTTPStatus.NOT_FOUND, "DAO not found.")
+        return dao
+
+    async def create_dao(self, body):
+        """
+        Creates a DAO from name, founders, token_name and initial_supply.
+        """
+        founders = body.get("founders")
+        if not body.get("name") or not isinstance(founders, list) or not founders:
+            raise ServiceError(HTTPStatus.BAD_REQUEST, "name and a non-empty founders list are required.")
+        initial_supply = _integer(body.get("initial_supply", 1000000), "initial_supply")
+        dao = DAOCreation(body["name"], founders, body.get("token_name", "REVO"), initial_supply)
+        self.daos[dao.dao_id] = dao
+        self.wallets[dao.dao_id] = MultiSigWallet(list(founders), required_signatures=len(founders))
+        return {"dao_id": dao.dao_id}
+
+    async def summary(self, dao_id):
+        """
+        Retrieves a DAO's summary and ledger report.
+        """
+        dao = self.dao(dao_id)
+        return {**dao.get_summary(), "ledger": dao.ledger.report()}
+
+    async def chain(self, dao_id, start=0, limit=100):
+        """
+        Lists blocks of a DAO's chain from a height.
+        """
+        chain = self.dao(dao_id).blockchain.chain
+        blocks = chain[start:start + limit]
+        return {
+            "height": len(chain),
+            "blocks": [{"index": b.index, "timestamp": b.timestamp, "hash": b.hash,
+                        "previous_hash": b.previous_hash, "transactions": b.transactions} for b in blocks]
+        }
+
+    async def events(self, dao_id, start=0, limit=100):
+        """
+        Lists the typed events recorded in a range of a DAO's blocks, with their block hashes.
+        """
+        chain = self.dao(dao_id).blockchain
+        return {"height": len(chain.chain), "events": audit_trail(chain, start, start + limit)}
+
+    async def submit_transactions(self, dao_id, bodies):
+        """
+        Queues transactions for the DAO's next block and waits for their results.
+
+        Args:
+            dao_id (str): The DAO ID.
+            bodies (list): Transaction objects with type, member, amount and type-specific fields.
+
+        Returns:
+            list: One result per transaction, in order.
+        """
+        dao = self.dao(dao_id)
+        transactions = [_build_transaction(dao, self.wallets[dao_id], body) for body in bodies]
+        pending = self._pending.setdefault(dao_id, [])
+        if len(pending) + len(transactions) > self.max_pending_writes:
+            raise ServiceError(HTTPStatus.SERVICE_UNAVAILABLE, "Too many pending writes for this DAO.")
+        loop = asyncio.get_running_loop()
+        futures = [loop.create_future() for _ in transactions]
+        pending.extend(zip(transactions, futures))
+        if dao_id not in self._draining:
+            self._draining.add(dao_id)
+            # The drain serves many requests, so it traces its batches as roots of their own
+            loop.create_task(self._drain(dao_id), context=contextvars.Context())
+        messages = await asyncio.gather(*futures)
+        return [{"ok": "executed and recorded" in message, "result": message} for message in messages]
+
+    async def _drain(self, dao_id):
+        """
+        Records the DAO's pending transactions, one block per batch, until none are left.
+        Transactions arriving while a block is being built join the next batch.
+        """
+        loop = asyncio.get_running_loop()
+        pending = self._pending[dao_id]
+        try:
+            while pending:
+                batch = pending[:self.max_batch]
+                del pending[:self.max_batch]
+                transactions = [tx for tx, _ in batch]
+                try:
+                    results = await loop.run_in_executor(self.executor, self._execute_batch, dao_id, transactions)
+                except Exception as exc:
+                    for _, future in batch:
+                        future.set_exception(exc)
+                    continue
+                for (_, future), result in zip(batch, results):
+                    future.set_result(result)
+        finally:
+            self._draining.discard(dao_id)
+
+    @tracer.entry("service.write_batch")
+    def _execute_batch(self, dao_id, transactions):
+        """
+        Records a batch of transactions as one block. Runs on the worker pool.
+        """
+        with dao_locks.lock_for(dao_id):
+            chain = self.daos[dao_id].blockchain.chain
+            height = len(chain)
+            results = TransactionEngine(self.daos[dao_id], self.wallets[dao_id]).execute_batch(transactions)
+            self.blocks_written += len(chain) - height
+            self.transactions_written += len(transactions)
+            return results
+
+    async def create_proposal(self, dao_id, body):
+        """
+        Creates a proposal from title, description and proposer and opens voting.
+        """
+        dao = self.dao(dao_id)
+        if not body.get("title") or not body.get("proposer"):
+            raise ServiceError(HTTPStatus.BAD_REQUEST, "title and proposer are required.")
+
+        def create():
+            proposal = Proposal(body["title"], body.get("description", ""), body["proposer"], dao)
+            start_voting(proposal)
+            self.proposals[(dao_id, body["title"])] = proposal
+            return {"result": f"Proposal '{body['title']}' created."}
+        return await self._run_locked(dao_id, create)
+
+    async def cast_vote(self, dao_id, title, body):
+        """
+        Casts a member's vote on a proposal.
+        """
+        proposal = self._proposal(dao_id, title)
+        return await self._run_locked(dao_id, lambda: {"result": cast_vote(proposal, body.get("member"), body.get("vote"))})
+
+    async def proposal_result(self, dao_id, title):
+        """
+        Checks a proposal's result; a passed proposal is recorded on the DAO's chain.
+        """
+        proposal = self._proposal(dao_id, title)
+        dao = self.dao(dao_id)
+        return await self._run_locked(dao_id, lambda: {"result": check_voting_result(proposal, dao),
+                                                       "status": proposal.status})
+
+    def _proposal(self, dao_id, title):
+        self.dao(dao_id)
+        proposal = self.proposals.get((dao_id, title))
+        if proposal is None:
+            raise ServiceError(HTTPStatus.NOT_FOUND, "Proposal not found.")
+        return proposal
+
+    async def _run_locked(self, dao_id, fn):
+        """
+        Runs backend work on the worker pool under the DAO's lock, ordered with its write batches.
+        """
+        def call():
+            with dao_locks.lock_for(dao_id):
+                return fn()
+        # Run in a copy of the request's context so backend spans nest under its span
+        return await asyncio.get_running_loop().run_in_executor(self.executor, contextvars.copy_context().run, call)
+
+    async def memory(self):
+        """
+        Approximates the memory of each DAO by subsystem, largest first. Runs on the worker pool,
+        since walking large chains takes a while.
+        """
+        return await asyncio.get_running_loop().run_in_executor(self.executor, memory_report, self.daos, self.wallets,
+                                                                  dao_locks.lock_for)
+
+    async def allocations(self, limit=20):
+        """
+        Samples the call sites whose memory grew most since the previous sample. Answers 409
+        unless allocation tracking was started, and runs on the worker pool, since snapshots are slow.
+        """
+        if not allocations.running:
+            raise ServiceError(HTTPStatus.CONFLICT,
+                               "Allocation tracking is not running; set DAO_SUITE_TRACEMALLOC or call allocations.start().")
+        return await asyncio.get_running_loop().run_in_executor(self.executor, allocations.sample, limit)
+
+    def stats(self):
+        """
+        Retrieves the service's counters.
+        """
+        return {
+            "daos": len(self.daos),
+            "pending_writes": sum(len(pending) for pending in self._pending.values()),
+            "blocks_written": self.blocks_written,
+            "transactions_written": self.transactions_written,
+        }
+
+def _build_transaction(dao, wallet, body):
+    """
+    Builds a transaction from a JSON object, using the bulk import column names.
+
+    Args:
+        dao (DAOCreation): The DAO.
+        wallet (MultiSigWallet): The DAO's multisig wallet.
+        body (dict): type, member, amount, and token_price, reason or target_project by type,
+            plus an optional idempotency_key.
+
+    Returns:
+        DAOTransaction: The transaction.
+    """
+    if not isinstance(body, dict):
+        raise ServiceError(HTTPStatus.BAD_REQUEST, "Each transaction must be a JSON object.")
+    tx_type, member, amount, key = body.get("type"), body.get("member"), body.get("amount"), body.get("idempotency_key")
+    if tx_type == "token_sale":
+        return TokenSaleTransaction(dao, member, amount, body.get("token_price", 0), wallet, key)
+    if tx_type == "treasury_contribution":
+        return TreasuryContributionTransaction(dao, member, amount, wallet, key)
+    if tx_type == "fund_distribution":
+        return FundDistributionTransaction(dao, member, amount, body.get("reason", ""), wallet, key)
+    if tx_type == "investment":
+        return InvestmentTransaction(dao, body.get("target_project"), amount, wallet, key)
+    raise ServiceError(HTTPStatus.BAD_REQUEST, f"Unknown transaction type: {tx_type}")
+
+def _integer(value, name, minimum=0):
+    """
+    Reads an integer from a request, answering 400 when it is not one or is below the minimum.
+
+    Args:
+        value: The value from the body, query or headers.
+        name (str): Its name, for the error message.
+        minimum (int): The smallest accepted value.
+
+    Returns:
+        int: The integer.
+    """
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        raise ServiceError(HTTPStatus.BAD_REQUEST, f"{name} must be an integer.")
+    if number < minimum:
+        raise ServiceError(HTTPStatus.BAD_REQUEST, f"{name} must be at least {minimum}.")
+    return number
+
+def _page(query):
+    """
+    Reads the start and limit of a listing; limits above 1000 are capped.
+    """
+    return _integer(query.get("start", 0), "start"), min(_integer(query.get("limit", 100), "limit"), 1000)
+
+class _Request:
+    """
+    A parsed HTTP request.
+    """
+
+    def __init__(self, method, target, version, headers, body):
+        self.method = method
+        url = urlsplit(target)
+        self.path = unquote(url.path)
+        self.query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        self.headers = headers
+        self.body = body
+        connection = headers.get("connection", "").lower()
+        self.keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+    def json(self):
+        try:
+            return json.loads(self.body or b"{}")
+        except ValueError:
+            raise ServiceError(HTTPStatus.BAD_REQUEST, "Body is not valid JSON.")
+
+class DAOHTTPServer:
+    """
+    HTTP/1.1 JSON front end of a DAOService on asyncio streams.
+
+    Connections are kept alive and pipelined: requests are read ahead and handled concurrently,
+    and responses are written in request order. Reading pauses once MAX_PIPELINE_DEPTH responses
+    are outstanding, and requests beyond the connection and in-flight limits get 503.
+    """
+
+    ROUTES = [
+        ("GET", r"/health", "health"),
+        ("GET", r"/stats", "get_stats"),
+        ("GET", r"/stats/memory", "get_memory"),
+        ("GET", r"/stats/allocations", "get_allocations"),
+        ("POST", r"/daos", "post_dao"),
+        ("GET", r"/daos/(?P<dao_id>[^/]+)", "get_dao"),
+        ("GET", r"/daos/(?P<dao_id>[^/]+)/chain", "get_chain"),
+        ("GET", r"/daos/(?P<dao_id>[^/]+)/events", "get_events"),
+        ("POST", r"/daos/(?P<dao_id>[^/]+)/transactions", "post_transactions"),
+        ("POST", r"/daos/(?P<dao_id>[^/]+)/proposals", "post_proposal"),
+        ("POST", r"/daos/(?P<dao_id>[^/]+)/proposals/(?P<title>[^/]+)/votes", "post_vote"),
+        ("POST", r"/daos/(?P<dao_id>[^/]+)/proposals/(?P<title>[^/]+)/result", "post_result"),
+    ]
+
+    def __init__(self, service=None, max_connections=MAX_CONNECTIONS, max_in_flight=MAX_IN_FLIGHT,
+                 max_pipeline_depth=MAX_PIPELINE_DEPTH, max_body_bytes=MAX_BODY_BYTES):
+        """
+        Initializes the server.
+
+        Args:
+            service (DAOService): The service to expose. Defaults to a new, empty service.
+            max_connections (int): Open connections allowed at once.
+            max_in_flight (int): Requests handled at once across all connections.
+            max_pipeline_depth (int): Requests read ahead per connection.
+            max_body_bytes (int): Largest accepted request body.
+        """
+        self.service = service or DAOService()
+        self.max_connections = max_connections
+        self.max_in_flight = max_in_flight
+        self.max_pipeline_depth = max_pipeline_depth
+        self.max_body_bytes = max_body_bytes
+        self.routes = [(method, re.compile(pattern + r"/?"), handler) for method, pattern, handler in self.ROUTES]
+        self.connections = 0
+        self.in_flight = 0
+        self.requests = 0
+        self.rejected = 0
+        self.server = None
+
+    async def start(self, host="127.0.0.1", port=8080):
+        """
+        Starts listening.
+
+        Returns:
+            asyncio.Server: The server; its sockets give the bound port when port is 0.
+        """
+        self.server = await asyncio.start_server(self._handle_connection, host, port, limit=MAX_HEADER_BYTES)
+        return self.server
+
+    async def close(self):
+        """
+        Stops listening and shuts down the worker pool.
+        """
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        self.service.executor.shutdown(wait=False)
+
+    async def _handle_connection(self, reader, writer):
+        if self.connections >= self.max_connections:
+            self.rejected += 1
+            writer.write(_response(HTTPStatus.SERVICE_UNAVAILABLE, {"error": "Too many connections."}, False))
+            await writer.drain()
+            writer.close()
+            return
+        self.connections += 1
+        responses = asyncio.Queue(maxsize=self.max_pipeline_depth)
+        sender = asyncio.create_task(self._send_responses(responses, writer))
+        try:
+            while not sender.done():
+                try:
+                    request = await self._read_request(reader)
+                except ServiceError as exc:
+                    await responses.put((_completed(_response(exc.status, {"error": exc.message}, False)), False))
+                    break
+                if request is None:
+                    break
+                await responses.put((asyncio.create_task(self._respond(request)), request.keep_alive))
+                if not request.keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            await responses.put(None)
+            await sender
+            self.connections -= 1
+            writer.close()
+
+    async def _send_responses(self, responses, writer):
+        """
+        Writes responses in request order as they complete.
+        """
+        while True:
+            item = await responses.get()
+            if item is None:
+                return
+            task, keep_alive = item
+            try:
+                writer.write(await task)
+                await writer.drain()
+            except ConnectionError:
+                return
+            if not keep_alive:
+                return
+
+    async def _read_request(self, reader):
+        """
+        Reads one request.
+
+        Returns:
+            _Request: The request, or None when the client closed the connection.
+        """
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError as exc:
+            if exc.partial.strip():
+                raise ServiceError(HTTPStatus.BAD_REQUEST, "Incomplete request.")
+            return None
+        except asyncio.LimitOverrunError:
+            raise ServiceError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Request headers too large.")
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, version = lines[0].split(" ")
+        except ValueError:
+            raise ServiceError(HTTPStatus.BAD_REQUEST, "Malformed request line.")
+        headers = {}
+        for line in lines[1:]:
+            if line:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            raise ServiceError(HTTPStatus.LENGTH_REQUIRED, "Chunked bodies are not supported; send Content-Length.")
+        length = _integer(headers.get("content-length") or 0, "Content-Length")
+        if length > self.max_body_bytes:
+            raise ServiceError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body too large.")
+        body = await reader.readexactly(length) if length else b""
+        return _Request(method, target, version, headers, body)
+
+    async def _respond(self, request):
+        """
+        Routes a request to its handler.
+
+        Returns:
+            bytes: The encoded response.
+        """
+        self.requests += 1
+        if self.in_flight >= self.max_in_flight:
+            self.rejected += 1
+            return _response(HTTPStatus.SERVICE_UNAVAILABLE, {"error": "Server busy."}, request.keep_alive)
+        self.in_flight += 1
+        with tracer.span("http.request", method=request.method, path=request.path) as span:
+            try:
+                status, payload = await self._dispatch(request)
+            except ServiceError as exc:
+                if exc.status == HTTPStatus.SERVICE_UNAVAILABLE:
+                    self.rejected += 1
+                status, payload = exc.status, {"error": exc.message}
+            except Exception as exc:
+                status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(exc)}
+            finally:
+                self.in_flight -= 1
+            span.set(status=int(status))
+        return _response(status, payload, request.keep_alive)
+
+    async def _dispatch(self, request):
+        path_matched = False
+        for method, pattern, handler in self.routes:
+            match = pattern.fullmatch(request.path)
+            if match:
+                path_matched = True
+                if method == request.method:
+                    return await getattr(self, handler)(request, **match.groupdict())
+        if path_matched:
+            raise ServiceError(HTTPStatus.METHOD_NOT_ALLOWED, "Method not allowed.")
+        raise ServiceError(HTTPStatus.NOT_FOUND, "Not found.")
+
+    async def health(self, request):
+        return HTTPStatus.OK, {"status": "ok"}
+
+    async def get_stats(self, request):
+        return HTTPStatus.OK, {
+            **self.service.stats(),
+            "connections": self.connections,
+            "in_flight": self.in_flight,
+            "requests": self.requests,
+            "rejected": self.rejected,
+        }
+
+    async def get_memory(self, request):
+        return HTTPStatus.OK, {"daos": await self.service.memory()}
+
+    async def get_allocations(self, request):
+        limit = _integer(request.query.get("limit", 20), "limit")
+        return HTTPStatus.OK, {"sites": await self.service.allocations(limit)}
+
+    async def post_dao(self, request):
+        return HTTPStatus.CREATED, await self.service.create_dao(request.json())
+
+    async def get_dao(self, request, dao_id):
+        return HTTPStatus.OK, await self.service.summary(dao_id)
+
+    async def get_chain(self, request, dao_id):
+        start, limit = _page(request.query)
+        return HTTPStatus.OK, await self.service.chain(dao_id, start, limit)
+
+    async def get_events(self, request, dao_id):
+        start, limit = _page(request.query)
+        return HTTPStatus.OK, await self.service.events(dao_id, start, limit)
+
+    async def post_transactions(self, request, dao_id):
+        body = request.json()
+        results = await self.service.submit_transactions(dao_id, body if isinstance(body, list) else [body])
+        return HTTPStatus.OK, {"results": results} if isinstance(body, list) else results[0]
+
+    async def post_proposal(self, request, dao_id):
+        return HTTPStatus.CREATED, await self.service.create_proposal(dao_id, request.json())
+
+    async def post_vote(self, request, dao_id, title):
+        return HTTPStatus.OK, await self.service.cast_vote(dao_id, title, request.json())
+
+    async def post_result(self, request, dao_id, title):
+        return HTTPStatus.OK, await self.service.proposal_result(dao_id, title)
+
+def _response(status, payload, keep_alive):
+    """
+    Encodes a JSON response.
+    """
+    body = json.dumps(payload, default=str).encode()
+    status = HTTPStatus(status)
+    head = (f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n")
+    if status == HTTPStatus.SERVICE_UNAVAILABLE:
+        head += "Retry-After: 1\r\n"
+    return head.encode() + b"\r\n" + body
+
+def _completed(value):
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(value)
+    return future
+
+async def serve(host="127.0.0.1", port=8080, workers=None):
+    """
+    Runs the service until cancelled.
+    """
+    server = DAOHTTPServer(DAOService(workers=workers))
+    await server.start(host, port)
+    print(f"DAO service listening on http://{host}:{port}")
+    try:
+        await server.server.serve_forever()
+    finally:
+        await server.close()
+
+def main(argv=None):
+    """
+    Command-line entry point: python -m Backend.Features.service --port 8080
+    """
+    parser = argparse.ArgumentParser(description="Serve the DAO backend over HTTP/JSON.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--workers", type=int, default=None, help="Threads running backend work.")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,11 @@
-import uuid
 import hashlib
-import time
-import pandas as pd
-import numpy as np
 import re
+import os
+from concurrent.futures import ProcessPoolExecutor
 from Backend.Database import Block, Blockchain
+from Backend.Features.rule_vm import assemble_quorum, assemble_voting_time, assemble_proposal_cost
+
+TIME_UNITS = {"minutes": 60, "hours": 3600, "days": 86400}
 
 def parse_governance_rule(input_str):
     """
@@ -16,23 +17,57 @@ def parse_governance_rule(input_str):
     Returns:
         str: The generated Solidity code or None if no rule is recognized.
     """
+    match = _match_governance_rule(input_str)
+    if match is None:
+        return None
+    rule_type, args = match
+    return RULE_GENERATORS[rule_type][0](*args)
+
+def compile_governance_rule(input_str):
+    """
+    Parses a governance rule from user input and generates both its Solidity code
+    and the rule VM program that evaluates it locally.
+
+    Args:
+        input_str (str): The user input.
+
+    Returns:
+        tuple: (rule_type, solidity_code, RuleProgram) or None if no rule is recognized.
+    """
+    match = _match_governance_rule(input_str)
+    if match is None:
+        return None
+    rule_type, args = match
+    solidity_generator, program_generator = RULE_GENERATORS[rule_type]
+    return rule_type, solidity_generator(*args), program_generator(*args)
+
+def _match_governance_rule(input_str):
+    """
+    Recognizes the rule type and parameters in user input.
+
+    Args:
+        input_str (str): The user input.
+
+    Returns:
+        tuple: (rule_type, args) or None if no rule is recognized.
+    """
     if "quorum" in input_str.lower():
         match = re.search(r"(\d+)%\s*\+?\s*(\d*)", input_str)
         if match:
             percent = int(match.group(1))
             plus = int(match.group(2)) if match.group(2) else 0
-            return generate_solidity_quorum(percent, plus)
+            return "quorum", (percent, plus)
     if "voting time" in input_str.lower():
         match = re.search(r"(\d+)\s*(hours|days|minutes)", input_str)
         if match:
             value = int(match.group(1))
             unit = match.group(2)
-            return generate_solidity_voting_time(value, unit)
+            return "voting_time", (value, unit)
     if "proposal cost" in input_str.lower():
         match = re.search(r"(\d+)", input_str)
         if match:
             cost = int(match.group(1))
-            return generate_solidity_proposal_cost(cost)
+            return "proposal_cost", (cost,)
     return None
 
 def generate_solidity_quorum(percent, plus):
@@ -64,7 +99,7 @@ def generate_solidity_voting_time(value, unit):
     Returns:
         str: The generated Solidity code.
     """
-    seconds = value * {"minutes": 60, "hours": 3600, "days": 86400}[unit]
+    seconds = value * TIME_UNITS[unit]
     return (
         "pragma solidity ^0.8.0;\n\n"
         "contract VotingTimeDeadline {\n\n"
@@ -99,28 +134,117 @@ def generate_solidity_proposal_cost(cost):
     """
 
 def compile_solidity_to_bytecode(solidity_code):
-    # Simulate compilation (in reality, call solc or use web3.py)
-    return f"BYTECODE({hash(solidity_code)})"
+    # Simulate compilation (in reality, call solc or use web3.py).
+    # A content digest keeps the bytecode identical across worker processes.
+    return f"BYTECODE({hashlib.sha256(solidity_code.encode()).hexdigest()})"
 
-def add_contract_to_blockchain(solidity_code, blockchain: Blockchain):
+def generate_program_voting_time(value, unit):
+    """
+    Generates the rule VM program for voting time rules.
+
+    Args:
+        value (int): The time value.
+        unit (str): The time unit (hours, days, minutes).
+
+    Returns:
+        RuleProgram: The rule program.
+    """
+    return assemble_voting_time(value * TIME_UNITS[unit])
+
+# Solidity and rule VM generators per rule type
+RULE_GENERATORS = {
+    "quorum": (generate_solidity_quorum, assemble_quorum),
+    "voting_time": (generate_solidity_voting_time, generate_program_voting_time),
+    "proposal_cost": (generate_solidity_proposal_cost, assemble_proposal_cost),
+}
+
+def add_contract_to_blockchain(solidity_code, blockchain: Blockchain, rule_type=None, program=None):
     """
     Adds a smart contract to the blockchain.
 
     Args:
         solidity_code (str): The Solidity code of the contract.
         blockchain (Blockchain): The blockchain to add the contract to.
+        rule_type (str): Optional rule type of the contract.
+        program (RuleProgram): Optional rule VM program stored alongside the contract.
 
     Returns:
         str: The bytecode of the contract.
     """
     bytecode = compile_solidity_to_bytecode(solidity_code)
     tx = {"type": "smart_contract", "solidity": solidity_code, "bytecode": bytecode}
+    if rule_type is not None:
+        tx["rule_type"] = rule_type
+    if program is not None:
+        tx["rule_bytecode"] = program.to_hex()
     blockchain.add_block([tx])
     return bytecode
 
 def process_user_input_and_add_contract(user_input, blockchain):
-    solidity_code = parse_governance_rule(user_input)
-    if not solidity_code:
+    compiled = compile_governance_rule(user_input)
+    if not compiled:
         return "No recognized governance rule in input."
-    bytecode = add_contract_to_blockchain(solidity_code, blockchain)
+    rule_type, solidity_code, program = compiled
+    bytecode = add_contract_to_blockchain(solidity_code, blockchain, rule_type, program)
     return f"Smart contract added to blockchain. Bytecode: {bytecode}"
+
+def process_user_inputs_and_add_contracts(user_inputs, blockchain, max_workers=None):
+    """
+    Parses and compiles many governance rules in a process pool and appends all
+    recognized contracts to the blockchain in a single block.
+
+    Args:
+        user_inputs (list): The user inputs, one governance rule each.
+        blockchain (Blockchain): The blockchain to add the contracts to.
+        max_workers (int): Number of worker processes. Defaults to the number of CPUs;
+            1 compiles in the calling process.
+
+    Returns:
+        list: One result message per input, in input order.
+    """
+    user_inputs = list(user_inputs)
+    workers = max_workers or os.cpu_count() or 1
+    if workers == 1 or len(user_inputs) < 2:
+        compiled = [_compile_user_input(user_input) for user_input in user_inputs]
+    else:
+        chunksize = max(1, len(user_inputs) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            compiled = list(executor.map(_compile_user_input, user_inputs, chunksize=chunksize))
+    results = []
+    txs = []
+    for item in compiled:
+        if item is None:
+            results.append("No recognized governance rule in input.")
+        elif "error" in item:
+            results.append(f"Error compiling governance rule: {item['error']}")
+        else:
+            txs.append(item)
+            results.append(f"Smart contract added to blockchain. Bytecode: {item['bytecode']}")
+    if txs:
+        blockchain.add_block(txs)
+    return results
+
+def _compile_user_input(user_input):
+    """
+    Compiles one governance rule into a smart contract transaction. Runs in worker processes.
+
+    Args:
+        user_input (str): The user input.
+
+    Returns:
+        dict: The contract transaction, an {"error": message} dict, or None if no rule is recognized.
+    """
+    try:
+        compiled = compile_governance_rule(user_input)
+        if not compiled:
+            return None
+        rule_type, solidity_code, program = compiled
+        return {
+            "type": "smart_contract",
+            "solidity": solidity_code,
+            "bytecode": compile_solidity_to_bytecode(solidity_code),
+            "rule_type": rule_type,
+            "rule_bytecode": program.to_hex(),
+        }
+    except Exception as exc:
+        return {"error": str(exc)}
@@ -0,0 +1,396 @@
+import os
+import sys
+import json
+import mmap
+import zlib
+import struct
+from array import array
+from collections import OrderedDict
+from Backend.Database.blockchain import Block, Blockchain
+from Backend.Database.contract_registry import ContractRegistry
+from Backend.Features.dao_creation import DAOCreation
+from Backend.Features.ledger import TreasuryLedger
+from Backend.Features.idempotency import IdempotencyIndex
+
+# --- Snapshot Format ---
+# A snapshot is a header, a section table and the section data, all little-endian:
+#   header:  magic, format version, flags, section count, CRC-32 of the section table
+#   section: name, codec, CRC-32 of the stored bytes, offset, stored size, raw size
+# Sections start on 8-byte boundaries, so uncompressed numeric columns can be read in place
+# from a memory map. Readers skip sections they do not know, and reject newer format versions.
+MAGIC = b"DAOSNAP\x00"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<8sHHII")
+SECTION = struct.Struct("<16sB3xIQQQ")
+ALIGNMENT = 8
+
+CODEC_RAW = 0
+CODEC_ZLIB = 1
+MIN_COMPRESSED_SIZE = 1024  # Smaller sections are stored raw
+
+# Sections of format version 1
+META = "meta"  # JSON: DAO fields, governance rules, proposals, members, ledger and idempotency state
+CHAIN_TIMESTAMPS = "chain.timestamp"  # float64 per block
+CHAIN_HASHES = "chain.hash"  # 32-byte SHA-256 digest per block
+CHAIN_TRANSACTIONS = "chain.tx"  # JSON array of each block's transactions
+WALLET_MEMBERS = "wallet.member"  # JSON array of member names
+WALLET_BALANCES = "wallet.balance"  # int64 or float64 per member; JSON if ints and floats are mixed
+
+# Tags of the values JSON has no type for, as they appear in encoded sections
+TAGS = (b'"__tuple__"', b'"__set__"', b'"__frozenset__"', b'"__bytes__"', b'"__bytearray__"')
+
+class SnapshotError(ValueError):
+    """
+    Raised when a snapshot is corrupt, truncated, of an unsupported version, or holds unsupported values.
+    """
+
+# --- Writing ---
+def dumps(dao, compress=False):
+    """
+    Serializes a DAO with its blockchain, wallets, ledger, proposals and governance rules.
+
+    Args:
+        dao (DAOCreation): The DAO.
+        compress (bool or int): Compress sections with zlib; an int sets the compression level.
+
+    Returns:
+        bytes: The snapshot.
+    """
+    chain = dao.blockchain.chain
+    balances = list(dao.wallets.values())
+    if all(type(b) is int and -2 ** 63 <= b < 2 ** 63 for b in balances):
+        balance_type = "q"
+    elif all(type(b) is float for b in balances):
+        balance_type = "d"
+    else:
+        balance_type = "json"  # Packing mixed balances into one array would turn ints into floats
+    ledger = dao.ledger
+    meta = {
+        "dao_id": dao.dao_id,
+        "name": dao.name,
+        "founders": dao.founders,
+        "token_name": dao.token_name,
+        "initial_supply": dao.initial_supply,
+        "creation_time": dao.creation_time,
+        "members": list(dao.members),
+        "governance_rules": dao.governance_rules,
+        "proposals": dao.proposals,
+        "chain": {"height": len(chain), "version": dao.blockchain.version, "genesis_previous_hash": chain[0].previous_hash},
+        "wallet_balance_type": balance_type,
+        "ledger": {
+            "treasury_balance": ledger.treasury_balance,
+            "system_balances": ledger.system_balances,
+            "total_supply": ledger.total_supply,
+            "inflow": ledger.inflow,
+            "outflow": ledger.outflow,
+            "sale_proceeds": ledger.sale_proceeds,
+            "posting_count": ledger.posting_count,
+        },
+        "idempotency": {
+            "ttl_seconds": dao.idempotency.ttl_seconds,
+            "max_entries": dao.idempotency.max_entries,
+            # Expiry times are wall-clock seconds, so they stay valid on another host
+            "entries": [[key, expires_at, result] for key, (expires_at, result) in dao.idempotency._entries.items()],
+        },
+    }
+    sections = [
+        (META, _json(meta)),
+        (CHAIN_TIMESTAMPS, _pack_array("d", [block.timestamp for block in chain])),
+        (CHAIN_HASHES, bytes.fromhex("".join(block.hash for block in chain))),
+        (CHAIN_TRANSACTIONS, _json([block.transactions for block in chain])),
+        (WALLET_MEMBERS, _json(list(dao.wallets))),
+        (WALLET_BALANCES, _json(balances) if balance_type == "json" else _pack_array(balance_type, balances)),
+    ]
+    level = compress if not isinstance(compress, bool) else 6
+    return _build(sections, level if compress else None)
+
+def save_snapshot(dao, path, compress=False):
+    """
+    Writes a DAO snapshot to a file, replacing it atomically.
+
+    Args:
+        dao (DAOCreation): The DAO.
+        path (str): The file path.
+        compress (bool or int): Compress sections with zlib; an int sets the compression level.
+
+    Returns:
+        int: The size of the snapshot in bytes.
+    """
+    data = dumps(dao, compress)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as f:
+        f.write(data)
+    os.replace(temporary, path)
+    return len(data)
+
+def _build(sections, level):
+    table = []
+    chunks = []
+    offset = _align(HEADER.size + SECTION.size * len(sections))
+    for name, raw in sections:
+        if len(name.encode()) > 16:
+            raise SnapshotError(f"Section name {name} is longer than 16 bytes.")
+        codec, stored = CODEC_RAW, raw
+        if level is not None and len(raw) >= MIN_COMPRESSED_SIZE:
+            compressed = zlib.compress(raw, level)
+            if len(compressed) < len(raw):
+                codec, stored = CODEC_ZLIB, compressed
+        table.append(SECTION.pack(name.encode(), codec, zlib.crc32(stored), offset, len(stored), len(raw)))
+        padding = _align(len(stored)) - len(stored)
+        chunks.append(stored + b"\x00" * padding)
+        offset += len(stored) + padding
+    table = b"".join(table)
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(sections), zlib.crc32(table))
+    start = header + table
+    return b"".join([start, b"\x00" * (_align(len(start)) - len(start))] + chunks)
+
+# --- Reading ---
+class SnapshotReader:
+    """
+    Reads the sections of a snapshot held in bytes, a memoryview or a memory map.
+
+    Uncompressed sections are returned as memoryviews into the buffer without copying, and
+    every section's checksum is verified on first access.
+    """
+
+    def __init__(self, buffer):
+        """
+        Parses and verifies the header and section table.
+
+        Args:
+            buffer: A bytes-like object with the snapshot.
+
+        Raises:
+            SnapshotError: If the header or table is corrupt, or the format version is newer than supported.
+        """
+        self.buffer = memoryview(buffer).cast("B")
+        if len(self.buffer) < HEADER.size:
+            raise SnapshotError("Snapshot is truncated.")
+        magic, self.version, self.flags, count, table_crc = HEADER.unpack_from(self.buffer)
+        if magic != MAGIC:
+            raise SnapshotError("Not a DAO snapshot.")
+        if self.version > FORMAT_VERSION:
+            raise SnapshotError(f"Snapshot format version {self.version} is newer than the supported version {FORMAT_VERSION}.")
+        table_end = HEADER.size + SECTION.size * count
+        if len(self.buffer) < table_end or zlib.crc32(self.buffer[HEADER.size:table_end]) != table_crc:
+            raise SnapshotError("Snapshot section table is corrupt.")
+        self.sections = {}
+        for i in range(count):
+            name, codec, crc, offset, stored_size, raw_size = SECTION.unpack_from(self.buffer, HEADER.size + i * SECTION.size)
+            name = name.rstrip(b"\x00").decode()
+            if offset + stored_size > len(self.buffer):
+                raise SnapshotError(f"Snapshot is truncated in section {name}.")
+            self.sections[name] = (codec, crc, offset, stored_size, raw_size)
+        self._verified = set()
+
+    def section(self, name):
+        """
+        Retrieves the raw bytes of a section.
+
+        Args:
+            name (str): The section name.
+
+        Returns:
+            memoryview: The section, a view into the buffer unless it was compressed.
+
+        Raises:
+            SnapshotError: If the section is missing or fails its checksum.
+        """
+        if name not in self.sections:
+            raise SnapshotError(f"Snapshot has no section {name}.")
+        codec, crc, offset, stored_size, raw_size = self.sections[name]
+        stored = self.buffer[offset:offset + stored_size]
+        if name not in self._verified:
+            if zlib.crc32(stored) != crc:
+                raise SnapshotError(f"Snapshot section {name} failed its checksum.")
+            self._verified.add(name)
+        if codec == CODEC_RAW:
+            return stored
+        if codec == CODEC_ZLIB:
+            raw = zlib.decompress(stored)
+            if len(raw) != raw_size:
+                raise SnapshotError(f"Snapshot section {name} has the wrong size.")
+            return memoryview(raw)
+        raise SnapshotError(f"Snapshot section {name} uses unknown codec {codec}.")
+
+    def column(self, name, typecode):
+        """
+        Retrieves a numeric section as a typed memoryview, e.g. the block timestamps.
+
+        Args:
+            name (str): The section name.
+            typecode (str): "d" for float64 or "q" for int64.
+
+        Returns:
+            memoryview: The values; zero-copy on little-endian hosts for uncompressed sections.
+        """
+        data = self.section(name)
+        if sys.byteorder == "little":
+            return data.cast(typecode)
+        values = array(typecode)
+        values.frombytes(data)
+        values.byteswap()
+        return memoryview(values)
+
+    def json(self, name):
+        data = bytes(self.section(name))
+        # The object hook costs a call per dict, so it only runs when tagged values are present
+        tagged = any(tag in data for tag in TAGS)
+        return json.loads(data, object_hook=_decode_object if tagged else None)
+
+    @property
+    def meta(self):
+        return self.json(META)
+
+    def to_dao(self):
+        """
+        Rebuilds the DAO. The contract registry is reindexed from the restored blocks.
+
+        Returns:
+            DAOCreation: The restored DAO.
+        """
+        meta = self.meta
+        height = meta["chain"]["height"]
+        timestamps = self.column(CHAIN_TIMESTAMPS, "d").tolist()
+        hashes = bytes(self.section(CHAIN_HASHES)).hex()
+        transactions = self.json(CHAIN_TRANSACTIONS)
+        if not len(timestamps) == len(transactions) == len(hashes) // 64 == height:
+            raise SnapshotError("Snapshot chain sections have inconsistent lengths.")
+
+        blockchain = Blockchain.__new__(Blockchain)
+        blockchain.chain = []
+        blockchain.contract_registry = ContractRegistry()
+        previous_hash = meta["chain"]["genesis_previous_hash"]
+        for index in range(height):
+            block = Block.__new__(Block)
+            block.index = index
+            block.timestamp = timestamps[index]
+            block.transactions = transactions[index]
+            block.previous_hash = previous_hash
+            block.hash = previous_hash = hashes[index * 64:(index + 1) * 64]
+            blockchain.chain.append(block)
+            blockchain.contract_registry.register_block(block)
+        blockchain.version = meta["chain"]["version"]
+
+        members = self.json(WALLET_MEMBERS)
+        balance_type = meta["wallet_balance_type"]
+        if balance_type == "json":
+            balances = self.json(WALLET_BALANCES)
+        else:
+            balances = self.column(WALLET_BALANCES, balance_type).tolist()
+        if len(members) != len(balances):
+            raise SnapshotError("Snapshot wallet sections have inconsistent lengths.")
+
+        dao = DAOCreation.__new__(DAOCreation)
+        dao.dao_id = meta["dao_id"]
+        dao.name = meta["name"]
+        dao.founders = meta["founders"]
+        dao.token_name = meta["token_name"]
+        dao.initial_supply = meta["initial_supply"]
+        dao.creation_time = meta["creation_time"]
+        dao.wallets = dict(zip(members, balances))
+        dao.ledger = TreasuryLedger.__new__(TreasuryLedger)
+        dao.ledger.member_balances = dao.wallets
+        for field, value in meta["ledger"].items():
+            setattr(dao.ledger, field, value)
+        idempotency = meta["idempotency"]
+        dao.idempotency = IdempotencyIndex(idempotency["ttl_seconds"], idempotency["max_entries"])
+        dao.idempotency._entries = OrderedDict((key, (expires_at, result)) for key, expires_at, result in idempotency["entries"])
+        dao.governance_rules = meta["governance_rules"]
+        dao.proposals = meta["proposals"]
+        dao.members = set(meta["members"])
+        dao.blockchain = blockchain
+        return dao
+
+def loads(data):
+    """
+    Restores a DAO from a snapshot.
+
+    Args:
+        data: A bytes-like object with the snapshot.
+
+    Returns:
+        DAOCreation: The restored DAO.
+
+    Raises:
+        SnapshotError: If the snapshot is corrupt or of an unsupported version.
+    """
+    return SnapshotReader(data).to_dao()
+
+def load_snapshot(path):
+    """
+    Restores a DAO from a snapshot file, reading its columns in place through a memory map.
+
+    Args:
+        path (str): The file path.
+
+    Returns:
+        DAOCreation: The restored DAO.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise SnapshotError("Snapshot is truncated.")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            reader = SnapshotReader(mapped)
+            try:
+                return reader.to_dao()
+            finally:
+                reader.buffer.release()  # Views into the map must be gone before it closes
+
+# --- Helpers ---
+def _align(size):
+    return (size + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+def _pack_array(typecode, values):
+    packed = array(typecode, values)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return packed.tobytes()
+
+def _json(value):
+    return json.dumps(_encode_value(value), separators=(",", ":")).encode()
+
+def _encode_value(value):
+    """
+    Converts a value into JSON types without loss, so restored blocks still match their hashes,
+    which cover the repr of their transactions. Tuples, sets, frozensets, bytes and bytearrays
+    are tagged with their own type. Values whose
+    type JSON would change, such as numpy scalars, int or float subclasses and non-string
+    dict keys, are refused rather than coerced.
+    """
+    kind = type(value)
+    if value is None or kind in (str, int, float, bool):
+        return value
+    if kind is list:
+        return [_encode_value(item) for item in value]
+    if kind is dict:
+        for key in value:
+            if type(key) is not str:
+                raise SnapshotError(f"Cannot snapshot a dict key of type {type(key).__name__}.")
+        return {key: _encode_value(item) for key, item in value.items()}
+    if kind is tuple:
+        return {"__tuple__": [_encode_value(item) for item in value]}
+    if kind is set:
+        return {"__set__": [_encode_value(item) for item in value]}
+    if kind is frozenset:
+        return {"__frozenset__": [_encode_value(item) for item in value]}
+    if kind is bytes:
+        return {"__bytes__": value.hex()}
+    if kind is bytearray:
+        return {"__bytearray__": value.hex()}
+    raise SnapshotError(f"Cannot snapshot a value of type {kind.__name__}.")
+
+def _decode_object(obj):
+    if len(obj) == 1:
+        if "__tuple__" in obj:
+            return tuple(obj["__tuple__"])
+        if "__set__" in obj:
+            return set(obj["__set__"])
+        if "__frozenset__" in obj:
+            return frozenset(obj["__frozenset__"])
+        if "__bytes__" in obj:
+            return bytes.fromhex(obj["__bytes__"])
+        if "__bytearray__" in obj:
+            return bytearray.fromhex(obj["__bytearray__"])
+    return obj
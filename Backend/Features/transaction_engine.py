@@ -0,0 +1,183 @@
+import time
+from Backend.Database.blockchain import MultiSigWallet
+from Backend.Features.dao_creation import build_contract
+from Backend.Features.ledger import InsufficientBalanceError
+from Backend.Features.idempotency import MISSING
+from Backend.tracing import tracer
+from Backend.metrics import metrics, TRANSACTIONS, TRANSACTION_SECONDS
+
+# Multisig policies supported by the engine
+PER_BATCH = "per_batch"  # One proposal and approval round for the whole batch
+PER_TRANSACTION = "per_transaction"  # One proposal and approval round per transaction
+
+class TransactionEngine:
+    """
+    Executes batches of mixed DAO transactions with one contract compilation and one block per batch.
+    """
+
+    def __init__(self, dao, multisig_wallet: MultiSigWallet, multisig_policy=PER_BATCH):
+        """
+        Initializes the engine for a DAO.
+
+        Args:
+            dao (DAOCreation): The DAO the transactions belong to.
+            multisig_wallet (MultiSigWallet): The multisig wallet used for approvals.
+            multisig_policy (str): PER_BATCH or PER_TRANSACTION.
+        """
+        if multisig_policy not in (PER_BATCH, PER_TRANSACTION):
+            raise ValueError(f"Unknown multisig policy: {multisig_policy}")
+        self.dao = dao
+        self.multisig_wallet = multisig_wallet
+        self.multisig_policy = multisig_policy
+
+    def execute_batch(self, transactions):
+        """
+        Validates, approves, applies and records a batch of transactions.
+
+        Args:
+            transactions (list): DAOTransaction instances of any type for this DAO.
+
+        Returns:
+            list: One result message per transaction, in input order. Transactions whose
+            idempotency key was already executed, or repeats a key earlier in the batch,
+            get the original result without executing again.
+        """
+        start = time.perf_counter()
+        results = [None] * len(transactions)
+        accepted = []
+        first_seen = {}  # idempotency key -> position of its first occurrence in the batch
+        repeats = []
+        for i, tx in enumerate(transactions):
+            if tx.dao is not self.dao:
+                results[i] = tx.rejection_message("Transaction belongs to a different DAO.")
+                continue
+            previous = self.dao.idempotency.lookup(tx.idempotency_key)
+            if previous is not MISSING:
+                results[i] = previous
+                continue
+            if tx.idempotency_key in first_seen:
+                repeats.append((i, first_seen[tx.idempotency_key]))
+                continue
+            first_seen[tx.idempotency_key] = i
+            valid, reason = tx.validate()
+            if valid:
+                accepted.append((i, tx))
+            else:
+                results[i] = tx.rejection_message(reason)
+
+        executed = []
+        if accepted:
+            with tracer.span("engine.run_batch", dao=self.dao.dao_id, transactions=len(accepted)):
+                executed = self._run(accepted, results)
+        for i, first in repeats:
+            results[i] = results[first]
+        if metrics.enabled:
+            self._record_metrics(transactions, results, executed, time.perf_counter() - start)
+        return results
+
+    def _record_metrics(self, transactions, results, executed, seconds):
+        """
+        Records each transaction's outcome like DAOTransaction.execute does. Committed transactions
+        observe their share of the batch time, since they are executed together.
+
+        Args:
+            transactions (list): The batch.
+            results (list): The result messages, in batch order.
+            executed (list): The transactions committed to the chain.
+            seconds (float): Time taken by the batch.
+        """
+        committed = {id(tx) for tx in executed}
+        for tx, result in zip(transactions, results):
+            if id(tx) in committed:
+                outcome = "executed"
+                TRANSACTION_SECONDS.observe(seconds / len(executed), type=tx.tx_type)
+            elif result == tx.success_message():
+                outcome = "replayed"
+            elif result == tx.failure_message():
+                outcome = "failed"
+            else:
+                outcome = "rejected"
+            TRANSACTIONS.inc(type=tx.tx_type, outcome=outcome)
+        self.dao.record_gauges()
+
+    def _run(self, accepted, results):
+        """
+        Approves, applies and commits the accepted transactions.
+
+        Args:
+            accepted (list): (position, transaction) pairs that passed validation.
+            results (list): The result messages, filled in place.
+
+        Returns:
+            list: The transactions committed to the chain.
+        """
+        with tracer.span("multisig.approve", policy=self.multisig_policy):
+            approved = self._approve(accepted)
+        if not approved:
+            for i, tx in accepted:
+                results[i] = tx.failure_message()
+            return []
+
+        # Postings are applied in batch order, so a contribution can fund a later distribution
+        executed = []
+        with tracer.span("ledger.apply"):
+            for i, tx in accepted:
+                try:
+                    tx.apply()
+                except InsufficientBalanceError as exc:
+                    results[i] = tx.rejection_message(str(exc))
+                    continue
+                executed.append(tx)
+                results[i] = tx.success_message()
+        if executed:
+            self._commit(executed)
+            for tx in executed:
+                self.dao.idempotency.remember(tx.idempotency_key, tx.success_message())
+        return executed
+
+    def _approve(self, accepted):
+        """
+        Runs the multisig step for the accepted transactions.
+
+        Args:
+            accepted (list): (position, transaction) pairs.
+
+        Returns:
+            bool: True if the multisig wallet approved the batch.
+        """
+        if self.multisig_policy == PER_BATCH:
+            proposals = [{
+                "type": "batch",
+                "transactions": [tx.to_dict() for _, tx in accepted],
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+            }]
+        else:
+            proposals = [tx.to_dict() for _, tx in accepted]
+        for proposal in proposals:
+            index = self.multisig_wallet.propose_transaction(proposal)
+            for owner in self.multisig_wallet.owners:
+                self.multisig_wallet.approve_transaction(index, owner)
+            try:
+                self.multisig_wallet.execute_transaction(index)
+            except Exception:
+                return False
+        return True
+
+    def _commit(self, executed):
+        """
+        Compiles the DAO contract once and records the executed transactions as one block.
+
+        Args:
+            executed (list): The applied transactions.
+        """
+        summary, contract, bytecode = build_contract(self.dao)
+        block = [{
+            "type": "smart_contract",
+            "action": f"Executed batch of {len(executed)} transactions",
+            "dao_name": summary["name"],
+            "solidity": contract,
+            "bytecode": bytecode,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        }]
+        block.extend(tx.record(None, bytecode) for tx in executed)
+        self.dao.blockchain.add_block(block)
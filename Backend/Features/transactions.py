@@ -1,78 +1,232 @@
 import uuid
-import hashlib
 import time
-import pandas as pd
-import numpy as np
+import numbers
 from Backend.Database.blockchain import MultiSigWallet
-from Backend.Features.dao_creation import generate_smart_contract_from_summary, compile_solidity_to_bytecode
+from Backend.Features.dao_creation import build_contract
+from Backend.Features.ledger import TREASURY_ACCOUNT, ISSUANCE_ACCOUNT, EXTERNAL_ACCOUNT
+from Backend.Features.idempotency import MISSING
+from Backend.metrics import metrics, TRANSACTIONS, TRANSACTION_SECONDS
+from Backend.tracing import tracer
 
-class TokenSaleTransaction:
+class DAOTransaction:
     """
-    Represents a token sale transaction for a DAO.
+    Base class for DAO transactions approved through a multisig wallet and recorded on the DAO's blockchain.
     """
 
-    def __init__(self, dao, buyer, amount, token_price, multisig_wallet: MultiSigWallet):
+    tx_type = None  # Transaction type recorded on the blockchain
+    label = None  # Human-readable name used in result messages
+
+    def __init__(self, dao, amount, multisig_wallet: MultiSigWallet, idempotency_key=None):
         """
-        Initializes the token sale transaction.
+        Initializes the fields shared by all transaction types.
 
         Args:
             dao: The DAO object associated with the transaction.
-            buyer: The buyer of the tokens.
-            amount: The number of tokens to buy.
-            token_price: The price per token.
+            amount: The amount of the transaction.
             multisig_wallet: The multisig wallet used for transaction approvals.
+            idempotency_key: Key identifying retries of the same transaction. A unique key is generated if omitted.
         """
         self.dao = dao
-        self.buyer = buyer
-        self.amount = amount  # Number of tokens to buy
-        self.token_price = token_price  # Price per token in ETH or other currency
+        self.amount = amount
         self.timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
         self.multisig_wallet = multisig_wallet
+        self.idempotency_key = idempotency_key or str(uuid.uuid4())
+
+    @staticmethod
+    def from_record(dao, record):
+        """
+        Rebuilds an executed transaction from its blockchain record, e.g. to replay it.
+
+        Args:
+            dao: The DAO object the transaction was executed on.
+            record (dict): The record written by record().
+
+        Returns:
+            DAOTransaction: The transaction, without a multisig wallet.
+        """
+        cls = TRANSACTION_CLASSES[record["type"]]
+        tx = cls.__new__(cls)
+        tx.dao = dao
+        tx.multisig_wallet = None
+        tx.idempotency_key = None
+        for name, value in record.items():
+            if name not in ("type", "solidity", "bytecode"):
+                setattr(tx, name, value)  # The type-specific fields, idempotency key and timestamp
+        return tx
+
+    def to_dict(self):
+        """
+        Builds the transaction data proposed to the multisig wallet.
+
+        Returns:
+            dict: The transaction data.
+        """
+        return {"type": self.tx_type, **self.fields(), "idempotency_key": self.idempotency_key, "timestamp": self.timestamp}
+
+    def fields(self):
+        """
+        Returns the type-specific fields of the transaction.
+
+        Returns:
+            dict: The fields, in the order they are recorded.
+        """
+        raise NotImplementedError
+
+    def validate(self):
+        """
+        Checks the transaction before it is proposed.
+
+        Returns:
+            tuple: (True, None) if valid, otherwise (False, reason).
+        """
+        if isinstance(self.amount, bool) or not isinstance(self.amount, numbers.Real):
+            return False, "Amount must be a number."
+        if self.amount <= 0:
+            return False, "Amount must be positive."
+        return True, None
+
+    def postings(self):
+        """
+        Returns the ledger postings of the transaction.
+
+        Returns:
+            list: (debit_account, credit_account, amount) tuples.
+        """
+        raise NotImplementedError
+
+    def apply(self):
+        """
+        Posts the transaction to the DAO's ledger, updating wallets and treasury.
+
+        Raises:
+            InsufficientBalanceError: If an account would be overdrawn.
+        """
+        self.dao.ledger.post(self.tx_type, self.postings())
+
+    def record(self, solidity, bytecode):
+        """
+        Builds the blockchain record of the executed transaction.
+
+        Args:
+            solidity (str): The DAO smart contract, or None when it is recorded once per block.
+            bytecode (str): The compiled DAO smart contract.
+
+        Returns:
+            dict: The blockchain transaction.
+        """
+        record = {"type": self.tx_type, **self.fields()}
+        if solidity is not None:
+            record["solidity"] = solidity
+        record["bytecode"] = bytecode
+        record["idempotency_key"] = self.idempotency_key
+        record["timestamp"] = self.timestamp
+        return record
+
+    def success_message(self):
+        return f"{self.label} executed and recorded on blockchain."
+
+    def failure_message(self):
+        return f"{self.label} failed multisig approval."
+
+    def rejection_message(self, reason):
+        return f"{self.label} rejected: {reason}"
 
     def execute(self):
         """
-        Executes the token sale transaction.
+        Executes the transaction.
 
         Returns:
-            str: A message indicating the success or failure of the transaction.
-        """
-        tx_data = {
-            "type": "token_sale",
-            "buyer": self.buyer,
-            "amount": self.amount,
-            "token_price": self.token_price,
-            "timestamp": self.timestamp
-        }
-        # Propose the transaction to the multisig wallet
-        self.multisig_wallet.propose_transaction(tx_data)
-        # Simulate approvals (in real use, call approve_transaction for each owner)
-        for owner in self.multisig_wallet.owners:
-            self.multisig_wallet.approve_transaction(0, owner)
-        if self.multisig_wallet.execute_transaction(0):
-            # Update DAO wallets and treasury
-            self.dao.wallets[self.buyer] = self.dao.wallets.get(self.buyer, 0) + self.amount
+            str: A message indicating the success or failure of the transaction. Replays of an
+            already executed idempotency key return the original message without executing again.
+        """
+        with tracer.span("transaction.execute", type=self.tx_type, dao=self.dao.dao_id):
+            if not metrics.enabled:
+                return self._execute()
+            start = time.perf_counter()
+            height = len(self.dao.blockchain.chain)
+            result = self._execute()
+            TRANSACTION_SECONDS.observe(time.perf_counter() - start, type=self.tx_type)
+            if result == self.success_message():
+                outcome = "executed" if len(self.dao.blockchain.chain) > height else "replayed"
+            elif result == self.failure_message():
+                outcome = "failed"
+            else:
+                outcome = "rejected"
+            TRANSACTIONS.inc(type=self.tx_type, outcome=outcome)
+            self.dao.record_gauges()
+            return result
+
+    def _execute(self):
+        previous = self.dao.idempotency.lookup(self.idempotency_key)
+        if previous is not MISSING:
+            return previous
+        with tracer.span("transaction.validate"):
+            valid, reason = self.validate()
+            if valid:
+                valid, reason = self.dao.ledger.check(self.postings())
+        if not valid:
+            return self.rejection_message(reason)
+        with tracer.span("multisig.approve"):
+            # Propose the transaction to the multisig wallet
+            index = self.multisig_wallet.propose_transaction(self.to_dict())
+            # Simulate approvals (in real use, call approve_transaction for each owner)
+            for owner in self.multisig_wallet.owners:
+                self.multisig_wallet.approve_transaction(index, owner)
+            approved = self.multisig_wallet.execute_transaction(index)
+        if approved:
+            with tracer.span("ledger.apply"):
+                self.apply()
             # Generate and record smart contract
-            summary = self.dao.get_summary()
-            contract = generate_smart_contract_from_summary(summary)
-            bytecode = compile_solidity_to_bytecode(contract)
-            self.dao.blockchain.add_block([{
-                "type": "token_sale",
-                "buyer": self.buyer,
-                "amount": self.amount,
-                "token_price": self.token_price,
-                "solidity": contract,
-                "bytecode": bytecode,
-                "timestamp": self.timestamp
-            }])
-            return "Token sale executed and recorded on blockchain."
-        return "Token sale failed multisig approval."
-
-class TreasuryContributionTransaction:
+            summary, contract, bytecode = build_contract(self.dao)
+            self.dao.blockchain.add_block([self.record(contract, bytecode)])
+            self.dao.idempotency.remember(self.idempotency_key, self.success_message())
+            return self.success_message()
+        return self.failure_message()
+
+class TokenSaleTransaction(DAOTransaction):
+    """
+    Represents a token sale transaction for a DAO.
+    """
+
+    tx_type = "token_sale"
+    label = "Token sale"
+
+    def __init__(self, dao, buyer, amount, token_price, multisig_wallet: MultiSigWallet, idempotency_key=None):
+        """
+        Initializes the token sale transaction.
+
+        Args:
+            dao: The DAO object associated with the transaction.
+            buyer: The buyer of the tokens.
+            amount: The number of tokens to buy.
+            token_price: The price per token.
+            multisig_wallet: The multisig wallet used for transaction approvals.
+            idempotency_key: Optional key identifying retries of the same transaction.
+        """
+        super().__init__(dao, amount, multisig_wallet, idempotency_key)  # Number of tokens to buy
+        self.buyer = buyer
+        self.token_price = token_price  # Price per token in ETH or other currency
+
+    def fields(self):
+        return {"buyer": self.buyer, "amount": self.amount, "token_price": self.token_price}
+
+    def postings(self):
+        # Newly issued tokens go to the buyer
+        return [(ISSUANCE_ACCOUNT, self.buyer, self.amount)]
+
+    def apply(self):
+        super().apply()
+        self.dao.ledger.record_sale_proceeds(self.amount * self.token_price)
+
+class TreasuryContributionTransaction(DAOTransaction):
     """
     Represents a treasury contribution transaction for a DAO.
     """
 
-    def __init__(self, dao, contributor, amount, multisig_wallet: MultiSigWallet):
+    tx_type = "treasury_contribution"
+    label = "Treasury contribution"
+
+    def __init__(self, dao, contributor, amount, multisig_wallet: MultiSigWallet, idempotency_key=None):
         """
         Initializes the treasury contribution transaction.
 
@@ -81,54 +235,27 @@ def __init__(self, dao, contributor, amount, multisig_wallet: MultiSigWallet):
             contributor: The contributor making the contribution.
             amount: The amount contributed to the treasury.
             multisig_wallet: The multisig wallet used for transaction approvals.
+            idempotency_key: Optional key identifying retries of the same transaction.
         """
-        self.dao = dao
+        super().__init__(dao, amount, multisig_wallet, idempotency_key)
         self.contributor = contributor
-        self.amount = amount
-        self.timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-        self.multisig_wallet = multisig_wallet
 
-    def execute(self):
-        """
-        Executes the treasury contribution transaction.
+    def fields(self):
+        return {"contributor": self.contributor, "amount": self.amount}
 
-        Returns:
-            str: A message indicating the success or failure of the transaction.
-        """
-        tx_data = {
-            "type": "treasury_contribution",
-            "contributor": self.contributor,
-            "amount": self.amount,
-            "timestamp": self.timestamp
-        }
-        # Propose the transaction to the multisig wallet
-        self.multisig_wallet.propose_transaction(tx_data)
-        for owner in self.multisig_wallet.owners:
-            self.multisig_wallet.approve_transaction(0, owner)
-        if self.multisig_wallet.execute_transaction(0):
-            # Update DAO treasury (could be a field in DAO)
-            self.dao.wallets[self.contributor] = self.dao.wallets.get(self.contributor, 0) - self.amount
-            # Generate and record smart contract
-            summary = self.dao.get_summary()
-            contract = generate_smart_contract_from_summary(summary)
-            bytecode = compile_solidity_to_bytecode(contract)
-            self.dao.blockchain.add_block([{
-                "type": "treasury_contribution",
-                "contributor": self.contributor,
-                "amount": self.amount,
-                "solidity": contract,
-                "bytecode": bytecode,
-                "timestamp": self.timestamp
-            }])
-            return "Treasury contribution executed and recorded on blockchain."
-        return "Treasury contribution failed multisig approval."
-
-class FundDistributionTransaction:
+    def postings(self):
+        # Move tokens from the contributor's wallet into the treasury
+        return [(self.contributor, TREASURY_ACCOUNT, self.amount)]
+
+class FundDistributionTransaction(DAOTransaction):
     """
     Represents a fund distribution transaction for a DAO.
     """
 
-    def __init__(self, dao, recipient, amount, reason, multisig_wallet: MultiSigWallet):
+    tx_type = "fund_distribution"
+    label = "Fund distribution"
+
+    def __init__(self, dao, recipient, amount, reason, multisig_wallet: MultiSigWallet, idempotency_key=None):
         """
         Initializes the fund distribution transaction.
 
@@ -138,57 +265,28 @@ def __init__(self, dao, recipient, amount, reason, multisig_wallet: MultiSigWall
             amount: The amount to distribute.
             reason: The reason for the fund distribution.
             multisig_wallet: The multisig wallet used for transaction approvals.
+            idempotency_key: Optional key identifying retries of the same transaction.
         """
-        self.dao = dao
+        super().__init__(dao, amount, multisig_wallet, idempotency_key)
         self.recipient = recipient
-        self.amount = amount
         self.reason = reason
-        self.timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-        self.multisig_wallet = multisig_wallet
 
-    def execute(self):
-        """
-        Executes the fund distribution transaction.
+    def fields(self):
+        return {"recipient": self.recipient, "amount": self.amount, "reason": self.reason}
 
-        Returns:
-            str: A message indicating the success or failure of the transaction.
-        """
-        tx_data = {
-            "type": "fund_distribution",
-            "recipient": self.recipient,
-            "amount": self.amount,
-            "reason": self.reason,
-            "timestamp": self.timestamp
-        }
-        # Propose the transaction to the multisig wallet
-        self.multisig_wallet.propose_transaction(tx_data)
-        for owner in self.multisig_wallet.owners:
-            self.multisig_wallet.approve_transaction(0, owner)
-        if self.multisig_wallet.execute_transaction(0):
-            # Update DAO wallets
-            self.dao.wallets[self.recipient] = self.dao.wallets.get(self.recipient, 0) + self.amount
-            # Generate and record smart contract
-            summary = self.dao.get_summary()
-            contract = generate_smart_contract_from_summary(summary)
-            bytecode = compile_solidity_to_bytecode(contract)
-            self.dao.blockchain.add_block([{
-                "type": "fund_distribution",
-                "recipient": self.recipient,
-                "amount": self.amount,
-                "reason": self.reason,
-                "solidity": contract,
-                "bytecode": bytecode,
-                "timestamp": self.timestamp
-            }])
-            return "Fund distribution executed and recorded on blockchain."
-        return "Fund distribution failed multisig approval."
-
-class InvestmentTransaction:
+    def postings(self):
+        # Pay the recipient out of the treasury
+        return [(TREASURY_ACCOUNT, self.recipient, self.amount)]
+
+class InvestmentTransaction(DAOTransaction):
     """
     Represents an investment transaction for a DAO.
     """
 
-    def __init__(self, dao, target_project, amount, multisig_wallet: MultiSigWallet):
+    tx_type = "investment"
+    label = "Investment"
+
+    def __init__(self, dao, target_project, amount, multisig_wallet: MultiSigWallet, idempotency_key=None):
         """
         Initializes the investment transaction.
 
@@ -197,42 +295,19 @@ def __init__(self, dao, target_project, amount, multisig_wallet: MultiSigWallet)
             target_project: The target project for the investment.
             amount: The amount to invest.
             multisig_wallet: The multisig wallet used for transaction approvals.
+            idempotency_key: Optional key identifying retries of the same transaction.
         """
-        self.dao = dao
+        super().__init__(dao, amount, multisig_wallet, idempotency_key)
         self.target_project = target_project
-        self.amount = amount
-        self.timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-        self.multisig_wallet = multisig_wallet
 
-    def execute(self):
-        """
-        Executes the investment transaction.
+    def fields(self):
+        return {"target_project": self.target_project, "amount": self.amount}
 
-        Returns:
-            str: A message indicating the success or failure of the transaction.
-        """
-        tx_data = {
-            "type": "investment",
-            "target_project": self.target_project,
-            "amount": self.amount,
-            "timestamp": self.timestamp
-        }
-        # Propose the transaction to the multisig wallet
-        self.multisig_wallet.propose_transaction(tx_data)
-        for owner in self.multisig_wallet.owners:
-            self.multisig_wallet.approve_transaction(0, owner)
-        if self.multisig_wallet.execute_transaction(0):
-            # Generate and record smart contract
-            summary = self.dao.get_summary()
-            contract = generate_smart_contract_from_summary(summary)
-            bytecode = compile_solidity_to_bytecode(contract)
-            self.dao.blockchain.add_block([{
-                "type": "investment",
-                "target_project": self.target_project,
-                "amount": self.amount,
-                "solidity": contract,
-                "bytecode": bytecode,
-                "timestamp": self.timestamp
-            }])
-            return "Investment executed and recorded on blockchain."
-        return "Investment failed multisig approval."
\ No newline at end of file
+    def postings(self):
+        # Invested tokens leave the treasury for the external project
+        return [(TREASURY_ACCOUNT, EXTERNAL_ACCOUNT, self.amount)]
+
+# Transaction classes by the type recorded on the blockchain
+TRANSACTION_CLASSES = {cls.tx_type: cls for cls in (
+    TokenSaleTransaction, TreasuryContributionTransaction, FundDistributionTransaction, InvestmentTransaction
+)}
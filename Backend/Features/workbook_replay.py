@@ -0,0 +1,231 @@
+import os
+import csv
+import sys
+import time
+import argparse
+import pandas as pd
+from Backend.Database.blockchain import MultiSigWallet
+from Backend.Features.dao_creation import DAOCreation
+from Backend.Features.proposals import Proposal, start_voting, cast_vote, check_voting_result
+from Backend.Features.bulk_import import IMPORT_COLUMNS, import_transaction_frames
+
+# Sheets of a replay workbook, in the order they are run. Each starts with a header row.
+# `dao_ref` is a workbook-local label for a DAO created on the Creation sheet.
+CREATION_SHEET = "Creation"  # dao_ref, name, founders (comma-separated), token_name, initial_supply
+TRANSACTIONS_SHEET = "Transactions"  # dao_ref plus the bulk import columns
+PROPOSAL_SHEET = "Proposal"  # dao_ref, action (create, vote or result), title, description, member, vote
+
+PROPOSAL_FAILURES = ("Voting not active.",)
+
+class WorkbookReplay:
+    """
+    Replays the DAO operations listed in an .xlsx workbook against the backend, streaming
+    rows in openpyxl read-only mode and executing transactions through the batched import path.
+    """
+
+    def __init__(self, chunksize=10000, batch_size=None):
+        """
+        Initializes the replay.
+
+        Args:
+            chunksize (int): Transaction rows read before they are validated and executed.
+            batch_size (int): Maximum transactions per block. Defaults to one block per DAO per chunk.
+        """
+        self.chunksize = chunksize
+        self.batch_size = batch_size
+        self.daos = {}  # dao_ref -> DAOCreation
+        self.wallets = {}  # dao_ref -> MultiSigWallet
+        self.proposals = {}  # (dao_ref, title) -> Proposal
+        self.failures = []  # (sheet, row, reason)
+        self.counts = {"rows": 0, "daos": 0, "transactions": 0, "proposal_operations": 0, "blocks": 0}
+
+    def run(self, path):
+        """
+        Replays a workbook.
+
+        Args:
+            path (str): The .xlsx path.
+
+        Returns:
+            dict: Row and operation counts, failures, elapsed seconds and rows per second.
+        """
+        from openpyxl import load_workbook
+        start = time.perf_counter()
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        try:
+            sheets = set(workbook.sheetnames)
+            if CREATION_SHEET in sheets:
+                self._replay_creation(_rows(workbook[CREATION_SHEET]))
+            if TRANSACTIONS_SHEET in sheets:
+                self._replay_transactions(_rows(workbook[TRANSACTIONS_SHEET]))
+            if PROPOSAL_SHEET in sheets:
+                self._replay_proposals(_rows(workbook[PROPOSAL_SHEET]))
+        finally:
+            workbook.close()
+        elapsed = time.perf_counter() - start
+        return {
+            **self.counts,
+            "failures": len(self.failures),
+            "elapsed_seconds": elapsed,
+            "rows_per_second": self.counts["rows"] / elapsed if elapsed else 0.0,
+        }
+
+    def _replay_creation(self, rows):
+        for row_number, row in rows:
+            self.counts["rows"] += 1
+            founders = [f.strip() for f in str(row.get("founders") or "").split(",") if f.strip()]
+            if not row.get("dao_ref") or not row.get("name") or not founders:
+                self._fail(CREATION_SHEET, row_number, "dao_ref, name and founders are required.")
+                continue
+            initial_supply = _initial_supply(row.get("initial_supply"))
+            if initial_supply is None:
+                self._fail(CREATION_SHEET, row_number, f"Invalid initial_supply: {row.get('initial_supply')}")
+                continue
+            dao = DAOCreation(row["name"], founders, row.get("token_name") or "REVO", initial_supply)
+            self.daos[row["dao_ref"]] = dao
+            self.wallets[row["dao_ref"]] = MultiSigWallet(list(founders), required_signatures=len(founders))
+            self.counts["daos"] += 1
+
+    def _replay_transactions(self, rows):
+        chunk = []
+        for row_number, row in rows:
+            self.counts["rows"] += 1
+            chunk.append({**row, "sheet_row": row_number})
+            if len(chunk) >= self.chunksize:
+                self._import_chunk(chunk)
+                chunk = []
+        if chunk:
+            self._import_chunk(chunk)
+
+    def _import_chunk(self, chunk):
+        """
+        Validates and executes a chunk of transaction rows, one batched import per DAO.
+        """
+        frame = pd.DataFrame(chunk).reindex(columns=["dao_ref", "sheet_row"] + IMPORT_COLUMNS)
+        for dao_ref, rows in frame.groupby("dao_ref", sort=False, dropna=False):
+            dao = self.daos.get(dao_ref)
+            if dao is None:
+                for row_number in rows["sheet_row"]:
+                    self._fail(TRANSACTIONS_SHEET, row_number, f"Unknown dao_ref: {dao_ref}")
+                continue
+            chain_length = len(dao.blockchain.chain)
+            summary = import_transaction_frames([rows.drop(columns="dao_ref")], dao, self.wallets[dao_ref],
+                                                batch_size=self.batch_size)
+            self.counts["transactions"] += summary["imported"]
+            self.counts["blocks"] += len(dao.blockchain.chain) - chain_length
+            for report_row in summary["report"].itertuples():
+                self._fail(TRANSACTIONS_SHEET, report_row.sheet_row, report_row.reason)
+
+    def _replay_proposals(self, rows):
+        for row_number, row in rows:
+            self.counts["rows"] += 1
+            dao_ref, action, title = row.get("dao_ref"), row.get("action"), row.get("title")
+            dao = self.daos.get(dao_ref)
+            if dao is None:
+                self._fail(PROPOSAL_SHEET, row_number, f"Unknown dao_ref: {dao_ref}")
+                continue
+            if action == "create":
+                proposal = Proposal(title, row.get("description") or "", row.get("member"), dao)
+                start_voting(proposal)
+                self.proposals[(dao_ref, title)] = proposal
+                self.counts["proposal_operations"] += 1
+                continue
+            proposal = self.proposals.get((dao_ref, title))
+            if proposal is None or action not in ("vote", "result"):
+                self._fail(PROPOSAL_SHEET, row_number, "Proposal not found." if proposal is None else f"Unknown action: {action}")
+                continue
+            chain_length = len(dao.blockchain.chain)
+            result = cast_vote(proposal, row.get("member"), row.get("vote")) if action == "vote" else \
+                check_voting_result(proposal, dao)
+            self.counts["blocks"] += len(dao.blockchain.chain) - chain_length
+            if result in PROPOSAL_FAILURES:
+                self._fail(PROPOSAL_SHEET, row_number, result)
+            else:
+                self.counts["proposal_operations"] += 1
+
+    def _fail(self, sheet, row_number, reason):
+        self.failures.append((sheet, int(row_number), str(reason)))
+
+    def write_failures(self, path):
+        """
+        Writes the failures to a CSV file with the columns sheet, row and reason.
+
+        Args:
+            path (str): The CSV path.
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["sheet", "row", "reason"])
+            writer.writerows(self.failures)
+
+def _initial_supply(value):
+    """
+    Reads the initial supply of a Creation row. Blank cells take the default; 0 is kept as recorded.
+
+    Args:
+        value: The cell value.
+
+    Returns:
+        int: The supply, or None when the cell is not a whole non-negative number.
+    """
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return 1000000
+    if isinstance(value, bool):
+        return None
+    if not isinstance(value, int):
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            return None
+        if not number.is_integer():
+            return None
+        value = int(number)
+    return value if value >= 0 else None
+
+def _rows(worksheet):
+    """
+    Streams the rows of a sheet as dicts keyed by the header row, skipping blank rows.
+
+    Yields:
+        tuple: (sheet row number, dict of column -> value).
+    """
+    rows = worksheet.iter_rows(values_only=True)
+    header = next(rows, None)
+    if header is None:
+        return
+    columns = [str(name).strip() if name is not None else None for name in header]
+    for row_number, values in enumerate(rows, start=2):
+        if all(value in (None, "") for value in values):
+            continue
+        yield row_number, {name: value for name, value in zip(columns, values) if name}
+
+def main(argv=None):
+    """
+    Command-line entry point: python -m Backend.Features.workbook_replay operations.xlsx
+    """
+    parser = argparse.ArgumentParser(description="Replay the DAO operations of .xlsx workbooks without Excel.")
+    parser.add_argument("workbooks", nargs="+", help="Workbooks with Creation, Transactions and Proposal sheets.")
+    parser.add_argument("--chunksize", type=int, default=10000, help="Transaction rows validated and executed together.")
+    parser.add_argument("--batch-size", type=int, default=None, help="Maximum transactions per block.")
+    parser.add_argument("--failures", help="CSV file the failed rows are written to.")
+    args = parser.parse_args(argv)
+    failed = False
+    for path in args.workbooks:
+        replay = WorkbookReplay(chunksize=args.chunksize, batch_size=args.batch_size)
+        summary = replay.run(path)
+        print(f"{path}: {summary['rows']} rows in {summary['elapsed_seconds']:.2f}s "
+              f"({summary['rows_per_second']:.0f} rows/s), {summary['daos']} DAOs, "
+              f"{summary['transactions']} transactions, {summary['proposal_operations']} proposal operations, "
+              f"{summary['blocks']} blocks, {summary['failures']} failures")
+        for sheet, row, reason in replay.failures[:20]:
+            print(f"  {sheet}!{row}: {reason}")
+        if args.failures:
+            base, ext = os.path.splitext(args.failures)
+            replay.write_failures(args.failures if len(args.workbooks) == 1 else
+                                  f"{base}-{os.path.splitext(os.path.basename(path))[0]}{ext or '.csv'}")
+        failed = failed or bool(replay.failures)
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
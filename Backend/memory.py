@@ -0,0 +1,217 @@
+import os
+import sys
+import time
+import types
+import tracemalloc
+from collections import deque
+
+# Objects that are shared by the whole process rather than owned by a DAO
+_SHARED_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType)
+_LEAF_TYPES = (str, bytes, int, float, bool, complex, type(None))
+
+# The repository root; allocation sites are reported relative to it
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_DIRS = tuple(os.path.join(ROOT, name) + os.sep for name in ("Backend", "Frontend"))
+
+# Subsystems of a DAO, as reported
+SUBSYSTEMS = ("contracts", "chain", "proposals", "wallets", "members", "idempotency", "multisig")
+# The order their memory is attributed. An object reachable from several subsystems counts for the
+# first: a proposal description also held by the proposal's recorded event counts for "proposals",
+# and a contract string indexed by the contract registry counts for "contracts" rather than "chain".
+ATTRIBUTION_ORDER = ("proposals", "wallets", "members", "idempotency", "multisig", "contracts", "chain")
+
+def deep_sizeof(obj, seen=None):
+    """
+    Approximates the bytes held by an object and everything it references.
+
+    Args:
+        obj: The object.
+        seen (set): IDs of objects already counted, shared between calls to count each object once.
+
+    Returns:
+        int: The bytes reported by sys.getsizeof over the object graph.
+    """
+    seen = set() if seen is None else seen
+    total = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen or isinstance(current, _SHARED_TYPES):
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+        if isinstance(current, _LEAF_TYPES):
+            continue
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset, deque)):
+            stack.extend(current)
+        else:
+            attributes = getattr(current, "__dict__", None)
+            if attributes is not None:
+                stack.append(attributes)
+            for slot in getattr(type(current), "__slots__", ()):
+                if hasattr(current, slot):
+                    stack.append(getattr(current, slot))
+    return total
+
+def dao_memory(dao, multisig_wallet=None):
+    """
+    Approximates the memory of a DAO by subsystem.
+
+    Args:
+        dao (DAOCreation): The DAO.
+        multisig_wallet (MultiSigWallet): The DAO's multisig wallet, whose pending entries count as "multisig".
+
+    Returns:
+        dict: Subsystem -> bytes, plus "total".
+    """
+    seen = {id(dao)}  # Back-references to the DAO, e.g. from proposals, are not followed
+    contracts = [dao.blockchain.contract_registry]
+    for block in dao.blockchain.chain:
+        for tx in block.transactions:
+            if isinstance(tx, dict):
+                contracts.extend(tx[key] for key in ("solidity", "bytecode") if key in tx)
+    parts = {
+        "contracts": contracts,
+        "chain": dao.blockchain,
+        "proposals": dao.proposals,
+        "wallets": (dao.wallets, dao.ledger),
+        "members": (dao.members, dao.founders, dao.governance_rules, dao.name, dao.token_name, dao.creation_time),
+        "idempotency": dao.idempotency,
+        "multisig": multisig_wallet,
+    }
+    measured = {name: deep_sizeof(parts[name], seen) if parts[name] is not None else 0 for name in ATTRIBUTION_ORDER}
+    usage = {name: measured[name] for name in SUBSYSTEMS}
+    usage["total"] = sum(usage.values()) + sys.getsizeof(dao) + sys.getsizeof(vars(dao))
+    return usage
+
+def memory_report(daos, wallets=None, lock_for=None):
+    """
+    Approximates the memory of many DAOs, largest first, e.g. to pick DAOs to evict.
+
+    Args:
+        daos (Mapping): DAO ID -> DAOCreation.
+        wallets (Mapping): DAO ID -> MultiSigWallet.
+        lock_for (callable): DAO ID -> lock held while the DAO is measured, when other threads write to it.
+
+    Returns:
+        list: Dicts with dao_id, name, total and the bytes of each subsystem.
+    """
+    wallets = wallets or {}
+    report = []
+    for dao_id, dao in list(daos.items()):
+        if lock_for is None:
+            usage = dao_memory(dao, wallets.get(dao_id))
+        else:
+            with lock_for(dao_id):
+                usage = dao_memory(dao, wallets.get(dao_id))
+        report.append({"dao_id": dao_id, "name": dao.name, **usage})
+    report.sort(key=lambda row: row["total"], reverse=True)
+    return report
+
+class AllocationTracker:
+    """
+    Diagnostic mode that attributes allocation growth to backend call sites with tracemalloc.
+
+    Each sample snapshots the traced memory and charges every allocation to the innermost
+    frame in Backend or Frontend, so allocations made inside the standard library or pandas
+    count for the backend line that asked for them. Tracing slows the process down severalfold.
+    """
+
+    def __init__(self, frames=25, max_samples=100):
+        """
+        Initializes the tracker.
+
+        Args:
+            frames (int): Frames stored per allocation; deeper call stacks lose their backend frame.
+            max_samples (int): Samples kept in the history.
+        """
+        self.frames = frames
+        self.history = deque(maxlen=max_samples)  # (time, {site: (bytes, blocks)})
+        self._started_tracing = False
+        self._previous = None
+
+    @property
+    def running(self):
+        return self._previous is not None
+
+    def start(self):
+        """
+        Starts tracing allocations, if not already traced, and records the baseline sample.
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_tracing = True
+        self._previous = self._by_site()
+        self.history.append((time.time(), self._previous))
+
+    def stop(self):
+        """
+        Stops tracing, unless tracing was started by someone else.
+        """
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        self._previous = None
+
+    def sample(self, limit=20):
+        """
+        Records a sample and reports the call sites whose memory grew most since the previous one.
+
+        Args:
+            limit (int): Call sites reported.
+
+        Returns:
+            list: Dicts with site, size_diff, count_diff, size and count, largest growth first.
+        """
+        if not self.running:
+            raise RuntimeError("Allocation tracking is not running; call start() first.")
+        current = self._by_site()
+        growth = []
+        for site in current.keys() | self._previous.keys():
+            size, count = current.get(site, (0, 0))
+            old_size, old_count = self._previous.get(site, (0, 0))
+            if size != old_size:
+                growth.append({"site": site, "size_diff": size - old_size, "count_diff": count - old_count,
+                               "size": size, "count": count})
+        growth.sort(key=lambda row: row["size_diff"], reverse=True)
+        self._previous = current
+        self.history.append((time.time(), current))
+        return growth[:limit]
+
+    def _by_site(self):
+        """
+        Returns:
+            dict: "path:line" of the innermost backend frame -> (bytes, blocks) currently allocated.
+        """
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ])
+        sites = {}
+        for stat in snapshot.statistics("traceback"):
+            site = _backend_site(stat.traceback)
+            if site is None:
+                continue
+            size, count = sites.get(site, (0, 0))
+            sites[site] = (size + stat.size, count + stat.count)
+        return sites
+
+def _backend_site(traceback):
+    # Frames run from the oldest to the most recent call
+    for frame in reversed(traceback):
+        if frame.filename == __file__:
+            return None  # The tracker's own bookkeeping
+        if frame.filename.startswith(SOURCE_DIRS):
+            return f"{os.path.relpath(frame.filename, ROOT)}:{frame.lineno}"
+    return None
+
+# The process-wide tracker. Set DAO_SUITE_TRACEMALLOC to a frame count (or 1 for the default)
+# to trace allocations from startup.
+allocations = AllocationTracker()
+if os.environ.get("DAO_SUITE_TRACEMALLOC", "") not in ("", "0", "false"):
+    value = os.environ["DAO_SUITE_TRACEMALLOC"]
+    allocations.frames = int(value) if value.isdigit() and int(value) > 1 else allocations.frames
+    allocations.start()
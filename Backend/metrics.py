@@ -0,0 +1,227 @@
+import os
+import json
+import math
+import atexit
+import threading
+
+# Latency buckets in seconds, from 10 microseconds to 10 seconds
+DEFAULT_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+                   0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+PREFIX = "dao_suite_"
+
+class Metric:
+    """
+    Base class of metrics. Values are kept per label set, e.g. per DAO or transaction type.
+    """
+
+    kind = None
+
+    def __init__(self, name, help_text):
+        self.name = PREFIX + name
+        self.help = help_text
+        self._values = {}  # tuple of sorted (label, value) pairs -> value
+        self._lock = threading.Lock()
+
+    def samples(self):
+        """
+        Returns:
+            list: (labels dict, value) pairs.
+        """
+        with self._lock:
+            return [(dict(key), value) for key, value in self._values.items()]
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+class Counter(Metric):
+    """
+    A monotonically increasing count.
+    """
+
+    kind = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+class Gauge(Metric):
+    """
+    A value that goes up and down, such as the length of a chain.
+    """
+
+    kind = "gauge"
+
+    def set(self, value, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount=1, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+
+class Histogram(Metric):
+    """
+    A distribution of observations, such as latencies, counted into cumulative buckets.
+    """
+
+    kind = "histogram"
+
+    def __init__(self, name, help_text, buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help_text)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = {"buckets": [0] * len(self.buckets), "sum": 0.0, "count": 0}
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    entry["buckets"][i] += 1
+                    break
+            entry["sum"] += value
+            entry["count"] += 1
+
+    def samples(self):
+        with self._lock:
+            return [(dict(key), {"buckets": list(v["buckets"]), "sum": v["sum"], "count": v["count"]})
+                    for key, v in self._values.items()]
+
+class MetricsRegistry:
+    """
+    Holds the metrics of the process. Instrumented code checks `enabled` before measuring
+    anything, so disabled metrics cost one attribute lookup per call site.
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name, help_text):
+        return self._register(Counter, name, help_text)
+
+    def gauge(self, name, help_text):
+        return self._register(Gauge, name, help_text)
+
+    def histogram(self, name, help_text, buckets=DEFAULT_BUCKETS):
+        return self._register(Histogram, name, help_text, buckets)
+
+    def _register(self, cls, name, help_text, *args):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, help_text, *args)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} is already registered as a {metric.kind}.")
+            return metric
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        """
+        Clears every recorded value; the metrics stay registered.
+        """
+        for metric in list(self._metrics.values()):
+            metric.clear()
+
+    def to_json(self):
+        """
+        Returns:
+            dict: Metric name -> kind, help and samples of labels and value.
+        """
+        return {
+            metric.name: {
+                "kind": metric.kind,
+                "help": metric.help,
+                **({"buckets": list(metric.buckets)} if metric.kind == "histogram" else {}),
+                "samples": [{"labels": labels, "value": value} for labels, value in metric.samples()],
+            }
+            for metric in self._metrics.values()
+        }
+
+    def to_prometheus(self):
+        """
+        Returns:
+            str: The metrics in the Prometheus text exposition format.
+        """
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for labels, value in metric.samples():
+                if metric.kind != "histogram":
+                    lines.append(f"{metric.name}{_labels(labels)} {_number(value)}")
+                    continue
+                cumulative = 0
+                for bound, count in zip(metric.buckets, value["buckets"]):
+                    cumulative += count
+                    lines.append(f"{metric.name}_bucket{_labels({**labels, 'le': _number(bound)})} {cumulative}")
+                lines.append(f"{metric.name}_bucket{_labels({**labels, 'le': '+Inf'})} {value['count']}")
+                lines.append(f"{metric.name}_sum{_labels(labels)} {_number(value['sum'])}")
+                lines.append(f"{metric.name}_count{_labels(labels)} {value['count']}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path, fmt=None):
+        """
+        Writes the metrics to a local file, replacing it atomically.
+
+        Args:
+            path (str): The file path.
+            fmt (str): "prometheus" or "json". Defaults to json for .json paths and prometheus otherwise.
+        """
+        fmt = fmt or ("json" if path.endswith(".json") else "prometheus")
+        if fmt not in ("json", "prometheus"):
+            raise ValueError(f"Unsupported metrics format: {fmt}")
+        text = json.dumps(self.to_json(), indent=2) if fmt == "json" else self.to_prometheus()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        temporary = f"{path}.tmp"
+        with open(temporary, "w") as f:
+            f.write(text)
+        os.replace(temporary, path)
+
+def _labels(labels):
+    if not labels:
+        return ""
+    escaped = (str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"') for value in labels.values())
+    return "{" + ",".join(f'{name}="{value}"' for name, value in zip(labels, escaped)) + "}"
+
+def _number(value):
+    if isinstance(value, float) and math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(value) if isinstance(value, float) else str(value)
+
+# The process-wide registry. Set DAO_SUITE_METRICS=1 to enable it at startup, and
+# DAO_SUITE_METRICS_FILE to write it to a .prom or .json file when the process exits.
+metrics = MetricsRegistry(enabled=os.environ.get("DAO_SUITE_METRICS", "") not in ("", "0", "false"))
+if os.environ.get("DAO_SUITE_METRICS_FILE"):
+    atexit.register(metrics.write, os.environ["DAO_SUITE_METRICS_FILE"])
+
+BLOCKS_ADDED = metrics.counter("blocks_added_total", "Blocks appended to any chain.")
+BLOCK_TRANSACTIONS = metrics.counter("block_transactions_total", "Transactions recorded in appended blocks.")
+ADD_BLOCK_SECONDS = metrics.histogram("add_block_seconds", "Time to build, hash and index a block.")
+CONTRACT_BLOCK_SECONDS = metrics.histogram("contract_block_seconds",
+                                           "Time to generate, compile and record a DAO smart contract block.")
+CONTRACT_GENERATION_SECONDS = metrics.histogram("contract_generation_seconds",
+                                                "Time to generate and compile a DAO smart contract.")
+MULTISIG_PROPOSALS = metrics.counter("multisig_proposals_total", "Transactions proposed to multisig wallets.")
+MULTISIG_APPROVALS = metrics.counter("multisig_approvals_total", "Owner approvals given in multisig wallets.")
+MULTISIG_EXECUTIONS = metrics.counter("multisig_executions_total", "Multisig executions by result.")
+MULTISIG_PENDING = metrics.gauge("multisig_pending", "Multisig entries proposed but not executed.")
+TRANSACTIONS = metrics.counter("transactions_total", "Executed DAO transactions by type and outcome.")
+TRANSACTION_SECONDS = metrics.histogram("transaction_execute_seconds", "Time of a transaction execute() by type.")
+VOTING_TALLY_SECONDS = metrics.histogram("voting_tally_seconds", "Time to tally a proposal's votes.")
+CHAIN_LENGTH = metrics.gauge("chain_length", "Blocks on a DAO's chain.")
+DAO_MEMBERS = metrics.gauge("dao_members", "Members of a DAO.")
@@ -0,0 +1,290 @@
+import os
+import json
+import time
+import atexit
+import cProfile
+import functools
+import threading
+import contextvars
+import collections
+import inspect
+
+# The innermost open span of the running thread or asyncio task. Context variables are
+# inherited by tasks and by work submitted with contextvars.copy_context().run, so spans
+# opened in a worker thread nest under the entry point that dispatched it.
+_current_span = contextvars.ContextVar("dao_suite_span", default=None)
+
+class Span:
+    """
+    A timed stage of an operation. Spans opened while another span is open become its children.
+    """
+
+    __slots__ = ("name", "attributes", "parent", "children", "start", "end", "error")
+
+    def __init__(self, name, parent, attributes):
+        self.name = name
+        self.attributes = attributes
+        self.parent = parent
+        self.children = []
+        self.start = time.perf_counter()
+        self.end = None
+        self.error = None
+
+    @property
+    def duration(self):
+        """
+        Returns:
+            float: Seconds from the start to the end of the span, or until now while it is open.
+        """
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+    def set(self, **attributes):
+        """
+        Adds attributes to the span, e.g. a result known only at the end of the stage.
+        """
+        self.attributes.update(attributes)
+
+    def to_dict(self):
+        """
+        Returns:
+            dict: The span tree with names, attributes, durations in seconds and errors.
+        """
+        data = {"name": self.name, "duration": self.duration}
+        if self.attributes:
+            data["attributes"] = {key: _plain(value) for key, value in self.attributes.items()}
+        if self.error:
+            data["error"] = self.error
+        if self.children:
+            data["children"] = [child.to_dict() for child in self.children]
+        return data
+
+    def folded_stacks(self, prefix=""):
+        """
+        Flattens the span tree into the folded stack format read by flamegraph.pl and speedscope.
+
+        Args:
+            prefix (str): The stack of the span's ancestors.
+
+        Returns:
+            dict: "root;child;grandchild" -> self time in microseconds.
+        """
+        stack = f"{prefix};{self.name}" if prefix else self.name
+        stacks = collections.Counter()
+        own = self.duration - sum(child.duration for child in self.children)
+        stacks[stack] += max(int(own * 1e6), 0)
+        for child in self.children:
+            stacks.update(child.folded_stacks(stack))
+        return stacks
+
+class _NullSpan:
+    """
+    Stands in for a span while tracing is disabled.
+    """
+
+    def set(self, **attributes):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NULL_SPAN = _NullSpan()
+
+class _OpenSpan:
+    """
+    Context manager that opens a span under the current one and closes it on exit.
+    """
+
+    __slots__ = ("tracer", "name", "attributes", "span", "token")
+
+    def __init__(self, tracer, name, attributes):
+        self.tracer = tracer
+        self.name = name
+        self.attributes = attributes
+
+    def __enter__(self):
+        parent = _current_span.get()
+        self.span = Span(self.name, parent, self.attributes)
+        if parent is not None:
+            parent.children.append(self.span)
+        self.token = _current_span.set(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb):
+        span = self.span
+        span.end = time.perf_counter()
+        if exc_type is not None:
+            span.error = f"{exc_type.__name__}: {exc}"
+        _current_span.reset(self.token)
+        if span.parent is None:
+            self.tracer._finish(span)
+        return False
+
+class Tracer:
+    """
+    Records nested spans around backend stages and optionally profiles slow entry points.
+
+    Spans cost one attribute check while tracing is disabled. When a profile threshold is set,
+    each entry point runs under cProfile and calls slower than the threshold leave a .prof file
+    and a .folded flame graph file of their spans in the profile directory.
+    """
+
+    def __init__(self, enabled=False, max_traces=256, profile_threshold=None, profile_dir=None):
+        """
+        Initializes the tracer.
+
+        Args:
+            enabled (bool): Record spans.
+            max_traces (int): Finished root spans kept in memory, oldest first out.
+            profile_threshold (float): Seconds above which an entry point's profile is written. None disables profiling.
+            profile_dir (str): Directory of the profile files. Defaults to Data/profiles.
+        """
+        self.enabled = enabled
+        self.profile_threshold = profile_threshold
+        self.profile_dir = profile_dir or os.path.join("Data", "profiles")
+        self._traces = collections.deque(maxlen=max_traces)
+        self._profiling = threading.local()
+        self._lock = threading.Lock()
+        self._sequence = 0
+
+    def enable(self, profile_threshold=None, profile_dir=None):
+        """
+        Starts recording spans.
+
+        Args:
+            profile_threshold (float): Optionally also profile entry points slower than this many seconds.
+            profile_dir (str): Optionally change the directory of the profile files.
+        """
+        self.enabled = True
+        if profile_threshold is not None:
+            self.profile_threshold = profile_threshold
+        if profile_dir is not None:
+            self.profile_dir = profile_dir
+
+    def disable(self):
+        self.enabled = False
+        self.profile_threshold = None
+
+    def span(self, name, **attributes):
+        """
+        Opens a span for a stage: `with tracer.span("contract.compile"): ...`
+
+        Args:
+            name (str): The stage name.
+            **attributes: Details recorded with the span, such as a DAO ID or a batch size.
+
+        Returns:
+            A context manager yielding the span.
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _OpenSpan(self, name, attributes)
+
+    def entry(self, name=None):
+        """
+        Decorates an entry point, such as an xl_func or service handler, so that it opens a span
+        and, in profiling mode, is profiled. Works on functions and coroutine functions.
+
+        Args:
+            name (str): The span name. Defaults to the function name.
+        """
+        def decorate(fn):
+            span_name = name or fn.__name__
+            if inspect.iscoroutinefunction(fn):
+                @functools.wraps(fn)
+                async def async_wrapper(*args, **kwargs):
+                    if not self.enabled:
+                        return await fn(*args, **kwargs)
+                    with self.span(span_name):
+                        return await fn(*args, **kwargs)
+                return async_wrapper
+
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return fn(*args, **kwargs)
+                with self.span(span_name) as span:
+                    if self.profile_threshold is None or getattr(self._profiling, "active", False):
+                        return fn(*args, **kwargs)
+                    return self._profile(span, fn, args, kwargs)
+            return wrapper
+        return decorate
+
+    def _profile(self, span, fn, args, kwargs):
+        """
+        Runs an entry point under cProfile and writes the profile if it was slow.
+        cProfile only sees the calling thread, so one profile runs per thread at a time.
+        """
+        profile = cProfile.Profile()
+        self._profiling.active = True
+        try:
+            profile.enable()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                profile.disable()
+                span.end = time.perf_counter()
+        finally:
+            self._profiling.active = False
+            if span.duration >= self.profile_threshold:
+                self._write_profile(span, profile)
+
+    def _write_profile(self, span, profile):
+        with self._lock:
+            self._sequence += 1
+            sequence = self._sequence
+        os.makedirs(self.profile_dir, exist_ok=True)
+        base = os.path.join(self.profile_dir, f"{span.name}-{time.strftime('%Y%m%dT%H%M%S')}-{sequence}")
+        profile.dump_stats(base + ".prof")
+        with open(base + ".folded", "w") as f:
+            for stack, micros in span.folded_stacks().items():
+                f.write(f"{stack} {micros}\n")
+
+    def _finish(self, span):
+        self._traces.append(span)
+
+    def current(self):
+        """
+        Returns:
+            Span: The innermost open span of the caller, or None.
+        """
+        return _current_span.get()
+
+    def traces(self):
+        """
+        Returns:
+            list: The finished root spans, oldest first.
+        """
+        return list(self._traces)
+
+    def clear(self):
+        self._traces.clear()
+
+    def write(self, path):
+        """
+        Writes the finished traces to a local file, one JSON span tree per line.
+
+        Args:
+            path (str): The file path.
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w") as f:
+            for span in self.traces():
+                f.write(json.dumps(span.to_dict()) + "\n")
+
+def _plain(value):
+    return value if isinstance(value, (str, int, float, bool)) or value is None else str(value)
+
+# The process-wide tracer. Set DAO_SUITE_TRACING=1 to enable it at startup, DAO_SUITE_TRACE_FILE
+# to write its traces when the process exits, and DAO_SUITE_PROFILE_THRESHOLD (seconds) to
+# profile entry points slower than that into DAO_SUITE_PROFILE_DIR.
+tracer = Tracer(
+    enabled=os.environ.get("DAO_SUITE_TRACING", "") not in ("", "0", "false")
+    or bool(os.environ.get("DAO_SUITE_PROFILE_THRESHOLD")),
+    profile_threshold=float(os.environ["DAO_SUITE_PROFILE_THRESHOLD"]) if os.environ.get("DAO_SUITE_PROFILE_THRESHOLD") else None,
+    profile_dir=os.environ.get("DAO_SUITE_PROFILE_DIR"),
+)
+if os.environ.get("DAO_SUITE_TRACE_FILE"):
+    atexit.register(tracer.write, os.environ["DAO_SUITE_TRACE_FILE"])
@@ -0,0 +1,45 @@
+import os
+import sys
+import argparse
+import Benchmarks.cases  # Registers the cases
+from Benchmarks.harness import run, compare, load, save
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+def main(argv=None):
+    """
+    Command-line entry point: python -m Benchmarks [--quick] [--save-baseline]
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the backend hot paths over growing sizes.")
+    parser.add_argument("--quick", action="store_true", help="Small sizes and few operations, for smoke runs.")
+    parser.add_argument("--filter", help="Only run cases whose name contains this text.")
+    parser.add_argument("--number", type=int, help="Operations per repeat.")
+    parser.add_argument("--repeat", type=int, help="Repeats per size.")
+    parser.add_argument("--output", help="JSON file the results are written to.")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="JSON baseline to compare against.")
+    parser.add_argument("--save-baseline", action="store_true", help="Write the results as the new baseline.")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed relative slowdown or memory growth.")
+    args = parser.parse_args(argv)
+
+    def report(key, result):
+        print(f"{key:45s} {result['min_seconds'] * 1e6:12.1f} us/op  {result['peak_bytes'] / 1024:10.1f} KiB peak")
+
+    results = run(quick=args.quick, name_filter=args.filter, number=args.number, repeat=args.repeat, progress=report)
+    if args.output:
+        save(results, args.output)
+    if args.save_baseline:
+        save(results, args.baseline)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one.")
+        return 0
+    regressions = compare(results, load(args.baseline), args.threshold, args.threshold)
+    for key, metric, before, after, change in regressions:
+        print(f"REGRESSION {key} {metric}: {before:.6g} -> {after:.6g} (+{change:.0%})")
+    if not regressions:
+        print("No regressions against the baseline.")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+from Backend.Database.blockchain import Block, Blockchain, MultiSigWallet
+from Backend.Features.dao_creation import DAOCreation
+from Backend.Features.proposals import Proposal, start_voting, cast_vote, check_voting_result
+from Backend.Features.smart_contracts import parse_governance_rule
+from Backend.Features.snapshot import dumps, loads
+from Backend.Features.replay import replay
+from Backend.Features.transactions import (
+    TokenSaleTransaction, TreasuryContributionTransaction,
+    FundDistributionTransaction, InvestmentTransaction
+)
+from Benchmarks.harness import benchmark
+
+CHAIN_LENGTHS = [100, 1000, 10000]
+MEMBER_COUNTS = [10, 100, 1000]
+PROPOSAL_COUNTS = [10, 100, 1000]
+
+def _transaction(i):
+    return {"type": "token_sale", "buyer": f"member{i}", "amount": 10, "token_price": 1.5,
+            "timestamp": "2025-01-01T00:00:00Z"}
+
+def _dao(members=10, chain_length=0):
+    """
+    Builds a DAO with the given number of founders and blocks on its chain.
+    """
+    founders = [f"member{i}" for i in range(members)]
+    dao = DAOCreation("BenchDAO", founders, token_name="BENCH", initial_supply=members * 1000000)
+    for i in range(chain_length):
+        dao.blockchain.add_block([_transaction(i)])
+    return dao
+
+def _wallet(dao):
+    return MultiSigWallet(list(dao.founders[:3]), required_signatures=min(3, len(dao.founders)))
+
+@benchmark("block_hash_block", sizes=[1, 100, 1000], quick_sizes=[10], size_label="transactions")
+def block_hash_block(size):
+    block = Block(1, [_transaction(i) for i in range(size)], "0" * 64)
+    return block.hash_block
+
+@benchmark("blockchain_add_block", sizes=CHAIN_LENGTHS, quick_sizes=[10], size_label="chain_length")
+def blockchain_add_block(size):
+    blockchain = Blockchain()
+    for i in range(size):
+        blockchain.add_block([_transaction(i)])
+    return lambda: blockchain.add_block([_transaction(0)])
+
+@benchmark("dao_add_member", sizes=MEMBER_COUNTS, quick_sizes=[10], size_label="members")
+def dao_add_member(size):
+    dao = _dao(members=size)
+    names = iter(range(10 ** 9))
+    return lambda: dao.add_member(f"new{next(names)}")
+
+@benchmark("dao_vote_on_proposal", sizes=PROPOSAL_COUNTS, quick_sizes=[10], size_label="proposals")
+def dao_vote_on_proposal(size):
+    dao = _dao()
+    proposal_ids = [dao.create_proposal(f"Proposal {i}", "Benchmark", "member0") for i in range(size)]
+    last = proposal_ids[-1]  # The worst case for a scan over proposals
+    return lambda: dao.vote_on_proposal(last, "member1", "yes")
+
+@benchmark("dao_add_smart_contract_block", sizes=MEMBER_COUNTS, quick_sizes=[10], size_label="members")
+def dao_add_smart_contract_block(size):
+    dao = _dao(members=size)
+    return lambda: dao._add_smart_contract_block("Benchmark action")
+
+@benchmark("check_voting_result", sizes=MEMBER_COUNTS, quick_sizes=[10], size_label="members")
+def check_voting_result_case(size):
+    dao = _dao(members=size)
+    proposal = Proposal("Benchmark", "Benchmark", "member0", dao)
+    start_voting(proposal)
+    for member in dao.founders:
+        cast_vote(proposal, member, "yes")
+    return lambda: check_voting_result(proposal, dao)
+
+@benchmark("parse_governance_rule", sizes=[4], size_label="rules")
+def parse_governance_rule_case(size):
+    rules = ["Set quorum to 50% plus 1", "Set voting time to maximum 24 hours",
+             "Set proposal cost to 10 tokens", "Set voting time to 3 days"][:size]
+
+    def parse_all():
+        for rule in rules:
+            parse_governance_rule(rule)
+    return parse_all
+
+@benchmark("token_sale_execute", sizes=CHAIN_LENGTHS, quick_sizes=[10], size_label="chain_length")
+def token_sale_execute(size):
+    dao = _dao(chain_length=size)
+    wallet = _wallet(dao)
+    return lambda: TokenSaleTransaction(dao, "buyer", 10, 1.5, wallet).execute()
+
+@benchmark("treasury_contribution_execute", sizes=CHAIN_LENGTHS, quick_sizes=[10], size_label="chain_length")
+def treasury_contribution_execute(size):
+    dao = _dao(chain_length=size)
+    wallet = _wallet(dao)
+    return lambda: TreasuryContributionTransaction(dao, "member0", 10, wallet).execute()
+
+@benchmark("fund_distribution_execute", sizes=CHAIN_LENGTHS, quick_sizes=[10], size_label="chain_length")
+def fund_distribution_execute(size):
+    dao = _dao(chain_length=size)
+    wallet = _wallet(dao)
+    TreasuryContributionTransaction(dao, "member0", 1000000, wallet).execute()
+    return lambda: FundDistributionTransaction(dao, "recipient", 10, "Benchmark", wallet).execute()
+
+@benchmark("investment_execute", sizes=CHAIN_LENGTHS, quick_sizes=[10], size_label="chain_length")
+def investment_execute(size):
+    dao = _dao(chain_length=size)
+    wallet = _wallet(dao)
+    TreasuryContributionTransaction(dao, "member0", 1000000, wallet).execute()
+    return lambda: InvestmentTransaction(dao, "project", 10, wallet).execute()
+
+@benchmark("snapshot_dumps", sizes=CHAIN_LENGTHS, quick_sizes=[10], size_label="chain_length")
+def snapshot_dumps(size):
+    dao = _dao(chain_length=size)
+    return lambda: dumps(dao)
+
+@benchmark("snapshot_loads", sizes=CHAIN_LENGTHS, quick_sizes=[10], size_label="chain_length")
+def snapshot_loads(size):
+    data = dumps(_dao(chain_length=size))
+    return lambda: loads(data)
+
+@benchmark("dao_replay", sizes=CHAIN_LENGTHS, quick_sizes=[10], size_label="chain_length")
+def dao_replay(size):
+    dao = _dao(chain_length=size)
+    return lambda: replay(dao.blockchain)
@@ -0,0 +1,139 @@
+import gc
+import sys
+import json
+import time
+import platform
+import tracemalloc
+
+# Registered benchmark cases: name -> (factory, sizes, quick sizes, size label)
+CASES = {}
+
+def benchmark(name, sizes, quick_sizes=None, size_label="size"):
+    """
+    Registers a benchmark case.
+
+    The decorated factory takes a size, does its setup, and returns a callable that performs
+    one operation. Setup is excluded from timing and from the peak memory measurement.
+
+    Args:
+        name (str): The case name.
+        sizes (list): The sizes swept in a full run.
+        quick_sizes (list): The sizes swept in a quick run. Defaults to the smallest size.
+        size_label (str): What the size counts, e.g. "members" or "chain_length".
+    """
+    def register(factory):
+        CASES[name] = (factory, list(sizes), list(quick_sizes or sizes[:1]), size_label)
+        return factory
+    return register
+
+def measure(factory, size, number=20, repeat=5):
+    """
+    Times one case at one size.
+
+    Args:
+        factory (callable): The case factory.
+        size (int): The size.
+        number (int): Operations per repeat.
+        repeat (int): Repeats, each with a fresh setup.
+
+    Returns:
+        dict: Best and mean seconds per operation and the peak bytes allocated by `number` operations.
+    """
+    timings = []
+    for _ in range(repeat):
+        operation = factory(size)
+        gc.collect()
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            for _ in range(number):
+                operation()
+            timings.append((time.perf_counter() - start) / number)
+        finally:
+            if gc_enabled:
+                gc.enable()
+    # Memory is measured in a separate pass because tracing slows the operations down
+    operation = factory(size)
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        for _ in range(number):
+            operation()
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+    return {"min_seconds": min(timings), "mean_seconds": sum(timings) / len(timings), "peak_bytes": peak}
+
+def run(quick=False, name_filter=None, number=None, repeat=None, progress=None):
+    """
+    Runs the registered cases over their sizes.
+
+    Args:
+        quick (bool): Use the quick sizes and fewer operations, e.g. in unit tests.
+        name_filter (str): Only run cases whose name contains this text.
+        number (int): Operations per repeat. Defaults to 5 for quick runs and 20 otherwise.
+        repeat (int): Repeats per size. Defaults to 2 for quick runs and 5 otherwise.
+        progress (callable): Called with each result as it completes.
+
+    Returns:
+        dict: The environment under "meta" and the results keyed "case[size]".
+    """
+    number = number or (5 if quick else 20)
+    repeat = repeat or (2 if quick else 5)
+    results = {}
+    for name, (factory, sizes, quick_sizes, size_label) in CASES.items():
+        if name_filter and name_filter not in name:
+            continue
+        for size in quick_sizes if quick else sizes:
+            result = {"case": name, size_label: size, **measure(factory, size, number, repeat)}
+            results[f"{name}[{size}]"] = result
+            if progress:
+                progress(f"{name}[{size}]", result)
+    return {
+        "meta": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "quick": quick,
+            "number": number,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+def compare(current, baseline, time_threshold=0.25, memory_threshold=0.25):
+    """
+    Flags results that got slower or allocate more than the baseline.
+
+    Args:
+        current (dict): A run, as returned by run().
+        baseline (dict): A previous run.
+        time_threshold (float): Allowed relative increase of the best time per operation.
+        memory_threshold (float): Allowed relative increase of the peak memory.
+
+    Returns:
+        list: (key, metric, baseline value, current value, relative change) per regression.
+    """
+    regressions = []
+    for key, result in current["results"].items():
+        previous = baseline.get("results", {}).get(key)
+        if previous is None:
+            continue
+        for metric, threshold in (("min_seconds", time_threshold), ("peak_bytes", memory_threshold)):
+            before, after = previous[metric], result[metric]
+            # Tiny allocations vary with interpreter internals, so memory below 4 KiB is ignored
+            if metric == "peak_bytes" and max(before, after) < 4096:
+                continue
+            if before > 0 and after > before * (1 + threshold):
+                regressions.append((key, metric, before, after, after / before - 1))
+    return regressions
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)
+
+def save(data, path):
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
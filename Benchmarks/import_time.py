@@ -0,0 +1,109 @@
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Startup budgets in seconds: module -> cumulative import time in a fresh interpreter.
+# The Excel add-in host has pyxll loaded before it imports our modules, so its time is excluded.
+BUDGETS = {
+    "Frontend.Input.excel_macros": 0.15,
+    "Frontend.Input.excel_async": 0.15,
+    "Backend.Features": 0.075,
+    "Backend.Database": 0.075,
+    "Backend.Features.service": 0.15,
+}
+PRELOADED = ("pyxll",)
+
+# Dependencies that must stay out of startup; modules that need them import them on first use
+HEAVY_MODULES = ("pandas", "numpy", "openpyxl", "pyarrow")
+
+def measure(module, preload=PRELOADED, repeat=3):
+    """
+    Measures the import of a module in fresh interpreters with `python -X importtime`.
+
+    Args:
+        module (str): The module to import.
+        preload (tuple): Modules imported first and excluded from the measurement.
+        repeat (int): Interpreters started; the fastest import counts.
+
+    Returns:
+        dict: Best cumulative seconds, the slowest imports under the module by self time,
+        and the heavy modules the import loaded.
+    """
+    code = "; ".join([f"import {name}" for name in preload] + [
+        "import sys, json",
+        f"import {module}",
+        f"print(json.dumps(sorted(name for name in {HEAVY_MODULES!r} if name in sys.modules)))",
+    ])
+    best = None
+    for _ in range(repeat):
+        process = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT,
+                                 capture_output=True, text=True, check=True)
+        total, slowest = _parse(process.stderr, module)
+        if best is None or total < best["seconds"]:
+            best = {"seconds": total, "slowest": slowest, "heavy": json.loads(process.stdout.splitlines()[-1])}
+    return best
+
+def _parse(output, module):
+    """
+    Reads the -X importtime report of one top-level import.
+
+    Returns:
+        tuple: (cumulative seconds of the module, up to 5 (name, self seconds) of its slowest imports).
+    """
+    subtree = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "|" not in line or "[us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|", 2)
+        if name.strip() and not name[1:].startswith(" "):
+            if name.strip() == module:
+                slowest = sorted(subtree, key=lambda item: item[1], reverse=True)[:5]
+                return int(cumulative) / 1e6, slowest
+            subtree = []  # A preloaded module's subtree
+            continue
+        subtree.append((name.strip(), int(own) / 1e6))
+    raise ValueError(f"{module} was already imported before it was measured.")
+
+def check(budgets=None, repeat=3):
+    """
+    Measures each budgeted module.
+
+    Args:
+        budgets (dict): Module -> seconds. Defaults to BUDGETS.
+        repeat (int): Interpreters started per module.
+
+    Returns:
+        tuple: (module -> measurement, list of violation messages).
+    """
+    results = {}
+    violations = []
+    for module, budget in (budgets or BUDGETS).items():
+        result = results[module] = measure(module, repeat=repeat)
+        if result["seconds"] > budget:
+            slowest = ", ".join(f"{name} {seconds * 1000:.0f}ms" for name, seconds in result["slowest"])
+            violations.append(f"{module} took {result['seconds'] * 1000:.0f}ms, over its "
+                              f"{budget * 1000:.0f}ms budget (slowest: {slowest})")
+        if result["heavy"]:
+            violations.append(f"{module} loads {', '.join(result['heavy'])} at import time")
+    return results, violations
+
+def main(argv=None):
+    """
+    Command-line entry point: python -m Benchmarks.import_time
+    """
+    parser = argparse.ArgumentParser(description="Check the import time of the add-in and backend modules.")
+    parser.add_argument("--repeat", type=int, default=3, help="Interpreters started per module.")
+    args = parser.parse_args(argv)
+    results, violations = check(repeat=args.repeat)
+    for module, result in results.items():
+        print(f"{module:35s} {result['seconds'] * 1000:8.1f} ms  (budget {BUDGETS[module] * 1000:.0f} ms)")
+    for violation in violations:
+        print(f"OVER BUDGET {violation}")
+    return 1 if violations else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
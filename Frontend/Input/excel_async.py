@@ -0,0 +1,107 @@
+import asyncio
+import weakref
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from pyxll import xl_func
+from Backend.Features.concurrency import dao_locks
+from Backend.tracing import tracer
+from Frontend.Input.excel_creation import excel_finalize_dao
+from Frontend.Input.excel_transactions import (
+    excel_token_sale, excel_treasury_contribution,
+    excel_fund_distribution, excel_investment, _idempotency_key
+)
+from Frontend.Input.excel_smart_contracts import excel_add_smart_contract
+
+# Backend calls run here instead of on Excel's calculation thread
+MAX_WORKERS = 4
+# Calls allowed in flight at once; further calls wait for a free slot
+MAX_CONCURRENT_CALLS = 16
+
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="excel-async")
+_limits = weakref.WeakKeyDictionary()  # event loop -> Semaphore capping calls in flight on it
+
+def _limit():
+    """
+    Retrieves the semaphore that caps the calls in flight on the running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _limits.get(loop)
+    if semaphore is None:
+        semaphore = _limits[loop] = asyncio.Semaphore(MAX_CONCURRENT_CALLS)
+    return semaphore
+
+async def _offload(key, fn, *args):
+    """
+    Runs a blocking Excel function on the worker pool while holding the lock of its DAO or session.
+
+    Args:
+        key (str): The DAO or session ID the call operates on.
+        fn (callable): The blocking function.
+        *args: The function's arguments.
+
+    Returns:
+        The function's result.
+    """
+    async with _limit():
+        loop = asyncio.get_running_loop()
+        # Run in a copy of the caller's context so backend spans nest under the entry point's span
+        return await loop.run_in_executor(_executor, contextvars.copy_context().run, _call_locked, key, fn, args)
+
+# The transaction wrappers build their idempotency key before offloading: xlfCaller() only
+# knows the calling cell on Excel's thread, so keys built on a worker would lose it.
+
+def _call_locked(key, fn, args):
+    with dao_locks.lock_for(key):
+        return fn(*args)
+
+@xl_func("string session_id: string")
+@tracer.entry()
+async def excel_finalize_dao_async(session_id):
+    """
+    Finalizes the DAO creation process without blocking Excel. See excel_finalize_dao.
+    """
+    return await _offload(session_id, excel_finalize_dao, session_id)
+
+@xl_func("string dao_id, string buyer, int amount, float token_price, string idempotency_key: string")
+@tracer.entry()
+async def excel_token_sale_async(dao_id, buyer, amount, token_price, idempotency_key=None):
+    """
+    Executes a token sale without blocking Excel. See excel_token_sale.
+    """
+    key = _idempotency_key(idempotency_key, dao_id, "token_sale", buyer, amount, token_price)
+    return await _offload(dao_id, excel_token_sale, dao_id, buyer, amount, token_price, key)
+
+@xl_func("string dao_id, string contributor, int amount, string idempotency_key: string")
+@tracer.entry()
+async def excel_treasury_contribution_async(dao_id, contributor, amount, idempotency_key=None):
+    """
+    Handles a treasury contribution without blocking Excel. See excel_treasury_contribution.
+    """
+    key = _idempotency_key(idempotency_key, dao_id, "treasury_contribution", contributor, amount)
+    return await _offload(dao_id, excel_treasury_contribution, dao_id, contributor, amount, key)
+
+@xl_func("string dao_id, string recipient, int amount, string reason, string idempotency_key: string")
+@tracer.entry()
+async def excel_fund_distribution_async(dao_id, recipient, amount, reason, idempotency_key=None):
+    """
+    Distributes funds without blocking Excel. See excel_fund_distribution.
+    """
+    key = _idempotency_key(idempotency_key, dao_id, "fund_distribution", recipient, amount, reason)
+    return await _offload(dao_id, excel_fund_distribution, dao_id, recipient, amount, reason, key)
+
+@xl_func("string dao_id, string target_project, int amount, string idempotency_key: string")
+@tracer.entry()
+async def excel_investment_async(dao_id, target_project, amount, idempotency_key=None):
+    """
+    Executes an investment without blocking Excel. See excel_investment.
+    """
+    key = _idempotency_key(idempotency_key, dao_id, "investment", target_project, amount)
+    return await _offload(dao_id, excel_investment, dao_id, target_project, amount, key)
+
+@xl_func("string session_id, string contract_string: string")
+@tracer.entry()
+async def excel_add_smart_contract_async(session_id, contract_string):
+    """
+    Adds a smart contract to the session's blockchain without blocking Excel. See excel_add_smart_contract.
+    """
+    return await _offload(session_id, excel_add_smart_contract, session_id, contract_string)
@@ -1,8 +1,12 @@
 from pyxll import xl_func
 from Backend.Features.dao_creation import DAOCreation
+from Frontend.Input.session_store import SessionStore
+from Frontend.Input.registry import database
+from Backend.tracing import tracer
 
-# Temporary storage for DAO creation steps (in-memory, per session)
-dao_creation_steps = {}
+# Temporary storage for DAO creation steps (in-memory, per session).
+# Abandoned sessions expire after an hour of inactivity; at most 1000 are kept.
+dao_creation_steps = SessionStore(max_sessions=1000, ttl_seconds=3600)
 
 @xl_func("string session_id, string name: string")
 def excel_set_dao_name(session_id, name):
@@ -31,10 +35,11 @@ def excel_set_num_founders(session_id, num_founders):
     Returns:
         str: Confirmation message or error message.
     """
-    if session_id not in dao_creation_steps:
+    step = dao_creation_steps.get(session_id)
+    if step is None:
         return "Please set DAO name first."
-    dao_creation_steps[session_id]["num_founders"] = num_founders
-    dao_creation_steps[session_id]["founders"] = []
+    step["num_founders"] = num_founders
+    step["founders"] = []
     return f"Number of founders set to {num_founders}. Now add founders one by one."
 
 @xl_func("string session_id, string founder_username: string")
@@ -49,11 +54,12 @@ def excel_add_founder(session_id, founder_username):
     Returns:
         str: Confirmation message or error message.
     """
-    if session_id not in dao_creation_steps or "num_founders" not in dao_creation_steps[session_id]:
+    step = dao_creation_steps.get(session_id)
+    if step is None or "num_founders" not in step:
         return "Please set DAO name and number of founders first."
-    founders = dao_creation_steps[session_id]["founders"]
+    founders = step["founders"]
     founders.append(founder_username)
-    if len(founders) < dao_creation_steps[session_id]["num_founders"]:
+    if len(founders) < step["num_founders"]:
         return f"{founder_username} added. Add the next one."
     else:
         return f"All founders added. Now set token name and initial supply."
@@ -71,16 +77,18 @@ def excel_set_token_and_supply(session_id, token_name, initial_supply):
     Returns:
         str: Confirmation message or error message.
     """
-    if session_id not in dao_creation_steps or len(dao_creation_steps[session_id].get("founders", [])) != dao_creation_steps[session_id].get("num_founders", 0):
+    step = dao_creation_steps.get(session_id)
+    if step is None or len(step.get("founders", [])) != step.get("num_founders", 0):
         return "Please add all founders first."
-    dao_creation_steps[session_id]["token_name"] = token_name
-    dao_creation_steps[session_id]["initial_supply"] = initial_supply
+    step["token_name"] = token_name
+    step["initial_supply"] = initial_supply
     return f"Token '{token_name}' and initial supply {initial_supply} set. Now finalize DAO creation."
 
-# Store DAOs in a global dictionary for session persistence
-daos = {}
+# Store DAOs in the persistent registry; only recently used DAOs stay in memory
+daos = database.registry("daos")
 
 @xl_func("string session_id: string")
+@tracer.entry()
 def excel_finalize_dao(session_id):
     """
     Finalizes the DAO creation process.
@@ -102,5 +110,5 @@ def excel_finalize_dao(session_id):
     )
     daos[dao.dao_id] = dao
     # Optionally clear the session
-    del dao_creation_steps[session_id]
+    dao_creation_steps.pop(session_id, None)
     return f"{dao.dao_id}"
\ No newline at end of file
@@ -1,3 +1,4 @@
+import uuid
 from pyxll import xl_macro, xl_app
 from Frontend.Input.excel_creation import (
     excel_set_dao_name,
@@ -9,104 +10,115 @@
 from Frontend.Input.excel_proposals import (
     excel_create_proposal,
     excel_cast_vote,
-    excel_check_proposal_result
+    excel_check_proposal_result,
+    excel_batch_cast_votes
 )
 from Frontend.Input.excel_transactions import (
     excel_token_sale,
     excel_treasury_contribution,
     excel_fund_distribution,
     excel_investment,
-    excel_get_blockchain_info
+    excel_get_blockchain_info,
+    excel_batch_token_sales,
+    excel_batch_treasury_contributions,
+    excel_batch_fund_distributions,
+    excel_batch_investments
 )
 from Frontend.Input.excel_smart_contracts import (
     excel_add_smart_contract,
     excel_get_smart_contracts,
 )
+from Frontend.Input.sheet_io import SheetIO
+
+# Operation tables on the Batch sheet: (table range, first result cell, batch function).
+# Each table is read and its results written with one call; rows run as one backend batch.
+BATCH_TABLES = {
+    "token_sales": ("A3:D1002", "E3", excel_batch_token_sales),  # buyer, amount, token price, key
+    "treasury_contributions": ("G3:I1002", "J3", excel_batch_treasury_contributions),  # contributor, amount, key
+    "fund_distributions": ("L3:O1002", "P3", excel_batch_fund_distributions),  # recipient, amount, reason, key
+    "investments": ("R3:T1002", "U3", excel_batch_investments),  # target project, amount, key
+    "votes": ("W3:Y1002", "Z3", excel_batch_cast_votes),  # title, member, vote
+}
+
+def _dao_id(app):
+    """Read the DAO ID from Creation!P42, where macro_finalize_dao writes it."""
+    return SheetIO(app, "Creation").read_fields({"dao_id": "P42"})["dao_id"]
 
 @xl_macro()
 def macro_set_dao_name():
     """Set the DAO name using values from Creation!P13 (session_id) and Creation!R13 (name)."""
-    app = xl_app()
-    session_id = app.Worksheets("Creation").Range("P13").Value
-    name = app.Worksheets("Creation").Range("R13").Value
-    result = excel_set_dao_name(session_id, name)
-    app.Worksheets("Creation").Range("P17").Value = result
+    creation = SheetIO(xl_app(), "Creation")
+    values = creation.read_fields({"session_id": "P13", "name": "R13"})
+    result = excel_set_dao_name(values["session_id"], values["name"])
+    creation.write_fields({"P17": result})
 
 @xl_macro()
 def macro_set_num_founders():
     """Set the number of founders using Creation!P13 (session_id) and Creation!P20 (num_founders)."""
-    app = xl_app()
-    session_id = app.Worksheets("Creation").Range("P13").Value
-    num_founders = int(app.Worksheets("Creation").Range("P20").Value)
-    result = excel_set_num_founders(session_id, num_founders)
-    app.Worksheets("Creation").Range("P24").Value = result
+    creation = SheetIO(xl_app(), "Creation")
+    values = creation.read_fields({"session_id": "P13", "num_founders": "P20"})
+    result = excel_set_num_founders(values["session_id"], int(values["num_founders"]))
+    creation.write_fields({"P24": result})
 
 @xl_macro()
 def macro_add_founder():
     """Add a founder using Creation!P13 (session_id) and Creation!P26 (founder name)."""
-    app = xl_app()
-    session_id = app.Worksheets("Creation").Range("P13").Value
-    founder = app.Worksheets("Creation").Range("P26").Value
-    result = excel_add_founder(session_id, founder)
-    app.Worksheets("Creation").Range("P30").Value = result
+    creation = SheetIO(xl_app(), "Creation")
+    values = creation.read_fields({"session_id": "P13", "founder": "P26"})
+    result = excel_add_founder(values["session_id"], values["founder"])
+    creation.write_fields({"P30": result})
 
 @xl_macro()
 def macro_set_token_and_supply():
     """Set the DAO token and initial supply using Creation!P13 (session_id), Creation!P33 (token), Creation!R33 (supply)."""
-    app = xl_app()
-    session_id = app.Worksheets("Creation").Range("P13").Value
-    token_name = app.Worksheets("Creation").Range("P33").Value
-    initial_supply = int(app.Worksheets("Creation").Range("R33").Value)
-    result = excel_set_token_and_supply(session_id, token_name, initial_supply)
-    app.Worksheets("Creation").Range("P37").Value = result
+    creation = SheetIO(xl_app(), "Creation")
+    values = creation.read_fields({"session_id": "P13", "token_name": "P33", "initial_supply": "R33"})
+    result = excel_set_token_and_supply(values["session_id"], values["token_name"], int(values["initial_supply"]))
+    creation.write_fields({"P37": result})
 
 @xl_macro()
 def macro_finalize_dao():
     """Finalize DAO creation using Creation!P13 (session_id)."""
-    app = xl_app()
-    session_id = app.Worksheets("Creation").Range("P13").Value
-    result = excel_finalize_dao(session_id)
-    app.Worksheets("Creation").Range("P42").Value = result
+    creation = SheetIO(xl_app(), "Creation")
+    values = creation.read_fields({"session_id": "P13"})
+    result = excel_finalize_dao(values["session_id"])
+    creation.write_fields({"P42": result})
 
 @xl_macro()
 def macro_create_proposal():
     """Create a proposal using Proposal!P12 (dao_id), Proposal!R15 (title), Proposal!P18 (description), Proposal!R16 (proposer)."""
     app = xl_app()
-    dao_id = app.Worksheets("Creation").Range("P42").Value
-    title = app.Worksheets("Proposal").Range("R15").Value
-    description = app.Worksheets("Proposal").Range("P18").Value
-    proposer = app.Worksheets("Proposal").Range("R16").Value
-    result = excel_create_proposal(dao_id, title, description, proposer)
-    app.Worksheets("Proposal").Range("P22").Value = result
+    proposal = SheetIO(app, "Proposal")
+    values = proposal.read_fields({"title": "R15", "description": "P18", "proposer": "R16"})
+    result = excel_create_proposal(_dao_id(app), values["title"], values["description"], values["proposer"])
+    proposal.write_fields({"P22": result})
 
 @xl_macro()
 def macro_cast_vote():
     """Cast a vote using Proposal!P12 (dao_id), Proposal!R15 (title), Proposal!E14 (member), Proposal!E15 (vote)."""
     app = xl_app()
-    dao_id = app.Worksheets("Creation").Range("P42").Value
-    title = app.Worksheets("Proposal").Range("R15").Value
-    member = app.Worksheets("Proposal").Range("P25").Value
-    vote = app.Worksheets("Proposal").Range("S25").Value
-    result = excel_cast_vote(dao_id, title, member, vote)
-    app.Worksheets("Proposal").Range("P29").Value = result
+    proposal = SheetIO(app, "Proposal")
+    values = proposal.read_fields({"title": "R15", "member": "P25", "vote": "S25"})
+    result = excel_cast_vote(_dao_id(app), values["title"], values["member"], values["vote"])
+    proposal.write_fields({"P29": result})
 
 @xl_macro()
 def macro_check_proposal_result():
     """Check proposal result using Proposal!P12 (dao_id) and Proposal!R15 (title)."""
     app = xl_app()
-    dao_id = app.Worksheets("Creation").Range("P42").Value
-    title = app.Worksheets("Proposal").Range("R15").Value
-    result = excel_check_proposal_result(dao_id, title)
-    app.Worksheets("Proposal").Range("P30").Value = result
+    proposal = SheetIO(app, "Proposal")
+    values = proposal.read_fields({"title": "R15"})
+    result = excel_check_proposal_result(_dao_id(app), values["title"])
+    proposal.write_fields({"P30": result})
 
 @xl_macro()
 def macro_add_smart_contract():
     """Add a smart contract using Proposal!P12 (dao_id) and Proposal!E18 (contract string)."""
     app = xl_app()
-    dao_id = app.Worksheets("Creation").Range("P42").Value
-    contract_string = app.Worksheets("Proposal").Range("P18").Value
-    result = excel_add_smart_contract(dao_id, contract_string)
-    app.Worksheets("Proposal").Range("P34").Value = result
+    proposal = SheetIO(app, "Proposal")
+    values = proposal.read_fields({"contract_string": "P18"})
+    result = excel_add_smart_contract(_dao_id(app), values["contract_string"])
+    proposal.write_fields({"P34": result})
 
 @xl_macro()
 def macro_get_smart_contracts():
@@ -115,9 +127,8 @@ def macro_get_smart_contracts():
     Reads DAO ID from Creation!P42 and writes the result to Proposal!V10.
     """
     app = xl_app()
-    dao_id = app.Worksheets("Creation").Range("P42").Value
-    result = excel_get_smart_contracts(dao_id)
-    app.Worksheets("Proposal").Range("V10").Value = result
+    result = excel_get_smart_contracts(_dao_id(app))
+    SheetIO(app, "Proposal").write_fields({"V10": result})
 
 @xl_macro()
 def macro_token_sale():
@@ -127,12 +138,11 @@ def macro_token_sale():
     and token price from Transactions!R17. Writes the result to Transactions!P20.
     """
     app = xl_app()
-    dao_id = app.Worksheets("Creation").Range("P42").Value
-    buyer = app.Worksheets("Transactions").Range("R15").Value
-    amount = int(app.Worksheets("Transactions").Range("R16").Value)
-    token_price = float(app.Worksheets("Transactions").Range("R17").Value)
-    result = excel_token_sale(dao_id, buyer, amount, token_price)
-    app.Worksheets("Transactions").Range("P20").Value = result
+    transactions = SheetIO(app, "Transactions")
+    values = transactions.read_fields({"buyer": "R15", "amount": "R16", "token_price": "R17"})
+    result = excel_token_sale(_dao_id(app), values["buyer"], int(values["amount"]), float(values["token_price"]),
+                              str(uuid.uuid4()))  # Each click is a new sale
+    transactions.write_fields({"P20": result})
 
 @xl_macro()
 def macro_treasury_contribution():
@@ -141,12 +151,10 @@ def macro_treasury_contribution():
     Reads DAO ID from Transactions!D20, contributor from Transactions!E24,
     and amount from Transactions!E25. Writes the result to Transactions!E26.
     """
-    app = xl_app()
-    dao_id = app.Worksheets("Transactions").Range("D20").Value
-    contributor = app.Worksheets("Transactions").Range("E24").Value
-    amount = int(app.Worksheets("Transactions").Range("E25").Value)
-    result = excel_treasury_contribution(dao_id, contributor, amount)
-    app.Worksheets("Transactions").Range("E26").Value = result
+    transactions = SheetIO(xl_app(), "Transactions")
+    values = transactions.read_fields({"dao_id": "D20", "contributor": "E24", "amount": "E25"})
+    result = excel_treasury_contribution(values["dao_id"], values["contributor"], int(values["amount"]), str(uuid.uuid4()))
+    transactions.write_fields({"E26": result})
 
 @xl_macro()
 def macro_fund_distribution():
@@ -156,13 +164,11 @@ def macro_fund_distribution():
     amount from Transactions!E28, and reason from Transactions!E29.
     Writes the result to Transactions!E30.
     """
-    app = xl_app()
-    dao_id = app.Worksheets("Transactions").Range("D20").Value
-    recipient = app.Worksheets("Transactions").Range("E27").Value
-    amount = int(app.Worksheets("Transactions").Range("E28").Value)
-    reason = app.Worksheets("Transactions").Range("E29").Value
-    result = excel_fund_distribution(dao_id, recipient, amount, reason)
-    app.Worksheets("Transactions").Range("E30").Value = result
+    transactions = SheetIO(xl_app(), "Transactions")
+    values = transactions.read_fields({"dao_id": "D20", "recipient": "E27", "amount": "E28", "reason": "E29"})
+    result = excel_fund_distribution(values["dao_id"], values["recipient"], int(values["amount"]), values["reason"],
+                                     str(uuid.uuid4()))
+    transactions.write_fields({"E30": result})
 
 @xl_macro()
 def macro_investment():
@@ -171,12 +177,10 @@ def macro_investment():
     Reads DAO ID from Transactions!D20, target project from Transactions!E31,
     and amount from Transactions!E32. Writes the result to Transactions!E33.
     """
-    app = xl_app()
-    dao_id = app.Worksheets("Transactions").Range("D20").Value
-    target_project = app.Worksheets("Transactions").Range("E31").Value
-    amount = int(app.Worksheets("Transactions").Range("E32").Value)
-    result = excel_investment(dao_id, target_project, amount)
-    app.Worksheets("Transactions").Range("E33").Value = result
+    transactions = SheetIO(xl_app(), "Transactions")
+    values = transactions.read_fields({"dao_id": "D20", "target_project": "E31", "amount": "E32"})
+    result = excel_investment(values["dao_id"], values["target_project"], int(values["amount"]), str(uuid.uuid4()))
+    transactions.write_fields({"E33": result})
 
 @xl_macro()
 def macro_get_blockchain_info():
@@ -184,7 +188,46 @@ def macro_get_blockchain_info():
     Get blockchain info.
     Reads DAO ID from Transactions!D20 and writes the result to Transactions!E34.
     """
+    transactions = SheetIO(xl_app(), "Transactions")
+    values = transactions.read_fields({"dao_id": "D20"})
+    result = excel_get_blockchain_info(values["dao_id"])
+    transactions.write_fields({"E34": result})
+
+def _run_batch_table(name):
+    """
+    Runs one operation table of the Batch sheet and writes its result column.
+
+    Args:
+        name (str): The key of the table in BATCH_TABLES.
+    """
     app = xl_app()
-    dao_id = app.Worksheets("Transactions").Range("D20").Value
-    result = excel_get_blockchain_info(dao_id)
-    app.Worksheets("Transactions").Range("E34").Value = result
\ No newline at end of file
+    table, results_cell, batch_function = BATCH_TABLES[name]
+    batch = SheetIO(app, "Batch")
+    rows = batch.read_table(table)
+    if rows:
+        batch.write_column(results_cell, batch_function(_dao_id(app), rows))
+
+@xl_macro()
+def macro_batch_token_sales():
+    """Execute every token sale in Batch!A3:D (buyer, amount, token price, key); results in column E."""
+    _run_batch_table("token_sales")
+
+@xl_macro()
+def macro_batch_treasury_contributions():
+    """Execute every treasury contribution in Batch!G3:I (contributor, amount, key); results in column J."""
+    _run_batch_table("treasury_contributions")
+
+@xl_macro()
+def macro_batch_fund_distributions():
+    """Execute every fund distribution in Batch!L3:O (recipient, amount, reason, key); results in column P."""
+    _run_batch_table("fund_distributions")
+
+@xl_macro()
+def macro_batch_investments():
+    """Execute every investment in Batch!R3:T (target project, amount, key); results in column U."""
+    _run_batch_table("investments")
+
+@xl_macro()
+def macro_batch_cast_votes():
+    """Cast every vote in Batch!W3:Y (title, member, vote); results in column Z."""
+    _run_batch_table("votes")
\ No newline at end of file
@@ -1,11 +1,33 @@
 from pyxll import xl_func
 from Backend.Features.proposals import Proposal, start_voting, cast_vote, check_voting_result
+import pickle
 from Frontend.Input.excel_creation import daos  # Use the global DAOs dict
+from Frontend.Input.registry import database
+from Backend.tracing import tracer
 
-# Store proposals by session or DAO
-excel_proposals = {}
+def _dump_proposal(proposal):
+    """
+    Serializes a proposal, storing its DAO by ID so the DAO itself is only persisted in `daos`.
+    """
+    state = dict(vars(proposal))
+    state["dao"] = getattr(proposal.dao, "dao_id", None)
+    return pickle.dumps(state)
+
+def _load_proposal(data):
+    """
+    Deserializes a proposal and re-links it to its DAO from `daos`.
+    """
+    state = pickle.loads(data)
+    proposal = Proposal.__new__(Proposal)
+    vars(proposal).update(state)
+    proposal.dao = daos.get(state["dao"])
+    return proposal
+
+# Store proposals by DAO and title in the persistent registry
+excel_proposals = database.registry("proposals", dump=_dump_proposal, load=_load_proposal)
 
 @xl_func("string dao_id, string title, string description, string proposer: string")
+@tracer.entry()
 def excel_create_proposal(dao_id, title, description, proposer):
     """
     Creates a proposal for the specified DAO.
@@ -29,6 +51,7 @@ def excel_create_proposal(dao_id, title, description, proposer):
     return f"Proposal '{title}' created."
 
 @xl_func("string dao_id, string title, string member, string vote: string")
+@tracer.entry()
 def excel_cast_vote(dao_id, title, member, vote):
     """
     Casts a vote on a proposal.
@@ -49,6 +72,7 @@ def excel_cast_vote(dao_id, title, member, vote):
     return cast_vote(proposal, member, vote)
 
 @xl_func("string dao_id, string title: string")
+@tracer.entry()
 def excel_check_proposal_result(dao_id, title):
     """
     Checks the result of a proposal.
@@ -65,4 +89,30 @@ def excel_check_proposal_result(dao_id, title):
     proposal = excel_proposals.get(key)
     if not proposal:
         return "Proposal not found."
-    return check_voting_result(proposal, dao)
\ No newline at end of file
+    return check_voting_result(proposal, dao)
+
+@xl_func("string dao_id, var[][] rows: string[][]")
+@tracer.entry()
+def excel_batch_cast_votes(dao_id, rows):
+    """
+    Casts the votes of a range in one call.
+
+    Args:
+        dao_id (str): The DAO ID.
+        rows (list): Rows of proposal title, member and vote ("yes" or "no").
+
+    Returns:
+        list: The result message of each row, as a column; blank rows give "".
+    """
+    results = []
+    proposals = {}  # title -> proposal, so each proposal is looked up once
+    for row in rows:
+        title, member, vote = (list(row) + [None] * 3)[:3]
+        if all(cell in (None, "") for cell in (title, member, vote)):
+            results.append([""])
+            continue
+        if title not in proposals:
+            proposals[title] = excel_proposals.get(f"{dao_id}:{title}")
+        proposal = proposals[title]
+        results.append([cast_vote(proposal, member, vote) if proposal else "Proposal not found."])
+    return results
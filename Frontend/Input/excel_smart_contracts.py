@@ -1,11 +1,17 @@
 from pyxll import xl_func
 from Backend.Database import Blockchain
 from Backend.Features.smart_contracts import process_user_input_and_add_contract
+from Backend.Features.concurrency import dao_locks
+from Frontend.Input.registry import database
+from Frontend.Input.excel_creation import daos
+from Frontend.Input.result_cache import read_results
+from Backend.tracing import tracer
 
-# Optionally, store blockchains by DAO or session if needed
-excel_blockchains = {}
+# Store blockchains by session in the persistent registry
+excel_blockchains = database.registry("blockchains")
 
 @xl_func("string session_id, string contract_string: string")
+@tracer.entry()
 def excel_add_smart_contract(session_id, contract_string):
     """
     Adds a smart contract to the blockchain for the given session.
@@ -17,12 +23,17 @@ def excel_add_smart_contract(session_id, contract_string):
     Returns:
         str: Result message.
     """
-    # Get or create a blockchain for this session/DAO
+    # A DAO's rule contracts go on its own chain, where proposal checks read them
+    dao = daos.get(session_id)
+    if dao is not None:
+        with dao_locks.lock_for(session_id):
+            return process_user_input_and_add_contract(contract_string, dao.blockchain)
     bc = excel_blockchains.setdefault(session_id, Blockchain())
     result = process_user_input_and_add_contract(contract_string, bc)
     return result
 
 @xl_func("string session_id: string")
+@tracer.entry()
 def excel_get_smart_contracts(session_id):
     """
     Returns a summary of smart contracts on the blockchain for the given session.
@@ -33,14 +44,27 @@ def excel_get_smart_contracts(session_id):
     Returns:
         str: Summary of contracts.
     """
-    bc = excel_blockchains.get(session_id)
+    dao = daos.peek(session_id)
+    bc = dao.blockchain if dao is not None else excel_blockchains.peek(session_id)
     if not bc:
         return "No blockchain found for this session."
+    # Recalculations reuse the summary until a block is added
+    return read_results.get_or_compute("excel_get_smart_contracts", session_id, bc, lambda: _contracts_summary(bc))
+
+def _contracts_summary(bc):
+    """
+    Builds the summary of the smart contracts on a blockchain.
+
+    Args:
+        bc (Blockchain): The blockchain.
+
+    Returns:
+        str: Summary of contracts.
+    """
     contracts = []
-    for block in bc.chain:
-        for tx in block.transactions:
-            if tx.get("type") == "smart_contract":
-                contracts.append(tx.get("action", str(tx)))
+    for block_index, tx in bc.contract_registry.contracts():
+        label = tx.get("action") or f"{tx.get('rule_type', 'dao')} rule (block {block_index}): {tx['bytecode']}"
+        contracts.append(label)
     if not contracts:
         return "No smart contracts found."
     return "\n".join(contracts)
\ No newline at end of file
@@ -1,16 +1,71 @@
-from pyxll import xl_func
+from pyxll import xl_func, xlfCaller
 from Backend.Features.transactions import (
     TokenSaleTransaction, TreasuryContributionTransaction,
     FundDistributionTransaction, InvestmentTransaction
 )
+from Backend.Features.transaction_engine import TransactionEngine
 from Backend.Database.blockchain import MultiSigWallet
+from Backend.Features.idempotency import MISSING
+from Backend.Features.concurrency import dao_locks
 from Frontend.Input.excel_creation import daos
+from Frontend.Input.registry import database
+from Frontend.Input.result_cache import read_results
+from Backend.tracing import tracer
+from Backend.memory import SUBSYSTEMS, memory_report, allocations
 
-# Store multisig wallets by DAO
-excel_wallets = {}
+# Store multisig wallets by DAO in the persistent registry
+excel_wallets = database.registry("wallets")
 
-@xl_func("string dao_id, string buyer, int amount, float token_price: string")
-def excel_token_sale(dao_id, buyer, amount, token_price):
+def _idempotency_key(idempotency_key, dao_id, tx_type, *args):
+    """
+    Returns the idempotency key of an Excel transaction call.
+
+    Excel re-fires functions on recalculation, so calls without an explicit key are keyed on the
+    calling cell and their arguments: a cell recalculating with the same arguments within the DAO's
+    idempotency window is a replay, while the same call from another cell is a new transaction.
+    Calls made outside a worksheet cell, such as from macros, should pass a fresh key.
+
+    Args:
+        idempotency_key (str): The key passed by the caller, if any.
+        dao_id (str): The DAO ID.
+        tx_type (str): The transaction type.
+        *args: The transaction arguments.
+
+    Returns:
+        str: The idempotency key.
+    """
+    if idempotency_key:
+        return idempotency_key
+    cell = _calling_cell()
+    prefix = (cell, dao_id, tx_type) if cell else (dao_id, tx_type)
+    return "excel:" + ":".join(str(part) for part in prefix + args)
+
+def _calling_cell():
+    """
+    Returns the address of the worksheet cell calling the function, or None outside a cell call.
+    """
+    try:
+        return xlfCaller().address
+    except Exception:  # Not called from a cell, or not running in Excel
+        return None
+
+def _execute(tx):
+    """
+    Executes a transaction under its DAO's lock, telling replays of an already executed idempotency key apart.
+    The lock is reentrant, so calls offloaded by excel_async, which already hold it, do not deadlock.
+
+    Returns:
+        str: The transaction's result, or the original result marked as already executed.
+    """
+    with dao_locks.lock_for(tx.dao.dao_id):
+        previous = tx.dao.idempotency.lookup(tx.idempotency_key)
+        if previous is not MISSING:
+            return f"Already executed (idempotency key {tx.idempotency_key}): {previous}"
+        return tx.execute()
+
+@xl_func("string dao_id, string buyer, int amount, float token_price, string idempotency_key: string")
+@tracer.entry()
+def excel_token_sale(dao_id, buyer, amount, token_price, idempotency_key=None):
     """
     Executes a token sale transaction for the specified DAO.
 
@@ -19,6 +74,7 @@ def excel_token_sale(dao_id, buyer, amount, token_price):
         buyer (str): The buyer of the tokens.
         amount (int): The number of tokens to buy.
         token_price (float): The price per token.
+        idempotency_key (str): Optional key; when omitted, recalculations of the calling cell are deduplicated.
 
     Returns:
         str: Confirmation message or error message.
@@ -27,11 +83,13 @@ def excel_token_sale(dao_id, buyer, amount, token_price):
     if not dao:
         return "DAO not found."
     wallet = excel_wallets.setdefault(dao_id, MultiSigWallet(list(dao.founders), required_signatures=len(dao.founders)))
-    tx = TokenSaleTransaction(dao, buyer, amount, token_price, wallet)
-    return tx.execute()
+    key = _idempotency_key(idempotency_key, dao_id, "token_sale", buyer, amount, token_price)
+    tx = TokenSaleTransaction(dao, buyer, amount, token_price, wallet, key)
+    return _execute(tx)
 
-@xl_func("string dao_id, string contributor, int amount: string")
-def excel_treasury_contribution(dao_id, contributor, amount):
+@xl_func("string dao_id, string contributor, int amount, string idempotency_key: string")
+@tracer.entry()
+def excel_treasury_contribution(dao_id, contributor, amount, idempotency_key=None):
     """
     Handles a treasury contribution transaction for the specified DAO.
 
@@ -39,6 +97,7 @@ def excel_treasury_contribution(dao_id, contributor, amount):
         dao_id (str): The DAO ID.
         contributor (str): The contributor.
         amount (int): The contribution amount.
+        idempotency_key (str): Optional key; when omitted, recalculations of the calling cell are deduplicated.
 
     Returns:
         str: Confirmation message or error message.
@@ -47,11 +106,13 @@ def excel_treasury_contribution(dao_id, contributor, amount):
     if not dao:
         return "DAO not found."
     wallet = excel_wallets.setdefault(dao_id, MultiSigWallet(list(dao.founders), required_signatures=len(dao.founders)))
-    tx = TreasuryContributionTransaction(dao, contributor, amount, wallet)
-    return tx.execute()
+    key = _idempotency_key(idempotency_key, dao_id, "treasury_contribution", contributor, amount)
+    tx = TreasuryContributionTransaction(dao, contributor, amount, wallet, key)
+    return _execute(tx)
 
-@xl_func("string dao_id, string recipient, int amount, string reason: string")
-def excel_fund_distribution(dao_id, recipient, amount, reason):
+@xl_func("string dao_id, string recipient, int amount, string reason, string idempotency_key: string")
+@tracer.entry()
+def excel_fund_distribution(dao_id, recipient, amount, reason, idempotency_key=None):
     """
     Distributes funds for the specified DAO.
 
@@ -60,6 +121,7 @@ def excel_fund_distribution(dao_id, recipient, amount, reason):
         recipient (str): The recipient of the funds.
         amount (int): The amount to distribute.
         reason (str): The reason for the distribution.
+        idempotency_key (str): Optional key; when omitted, recalculations of the calling cell are deduplicated.
 
     Returns:
         str: Confirmation message or error message.
@@ -68,11 +130,13 @@ def excel_fund_distribution(dao_id, recipient, amount, reason):
     if not dao:
         return "DAO not found."
     wallet = excel_wallets.setdefault(dao_id, MultiSigWallet(list(dao.founders), required_signatures=len(dao.founders)))
-    tx = FundDistributionTransaction(dao, recipient, amount, reason, wallet)
-    return tx.execute()
+    key = _idempotency_key(idempotency_key, dao_id, "fund_distribution", recipient, amount, reason)
+    tx = FundDistributionTransaction(dao, recipient, amount, reason, wallet, key)
+    return _execute(tx)
 
-@xl_func("string dao_id, string target_project, int amount: string")
-def excel_investment(dao_id, target_project, amount):
+@xl_func("string dao_id, string target_project, int amount, string idempotency_key: string")
+@tracer.entry()
+def excel_investment(dao_id, target_project, amount, idempotency_key=None):
     """
     Executes an investment transaction for the specified DAO.
 
@@ -80,6 +144,7 @@ def excel_investment(dao_id, target_project, amount):
         dao_id (str): The DAO ID.
         target_project (str): The target project for the investment.
         amount (int): The investment amount.
+        idempotency_key (str): Optional key; when omitted, recalculations of the calling cell are deduplicated.
 
     Returns:
         str: Confirmation message or error message.
@@ -88,10 +153,126 @@ def excel_investment(dao_id, target_project, amount):
     if not dao:
         return "DAO not found."
     wallet = excel_wallets.setdefault(dao_id, MultiSigWallet(list(dao.founders), required_signatures=len(dao.founders)))
-    tx = InvestmentTransaction(dao, target_project, amount, wallet)
-    return tx.execute()
+    key = _idempotency_key(idempotency_key, dao_id, "investment", target_project, amount)
+    tx = InvestmentTransaction(dao, target_project, amount, wallet, key)
+    return _execute(tx)
+
+def _amount(value):
+    """
+    Converts an amount read from a cell, which Excel passes as a float, to int when it is whole.
+    """
+    value = float(value)
+    return int(value) if value.is_integer() else value
+
+def _execute_rows(dao_id, rows, tx_type, columns, build):
+    """
+    Builds one transaction per row of a range and executes them as a single batch under the DAO's lock.
+
+    Rows without an idempotency key are keyed on the calling cell and their position and contents,
+    so recalculating the same range replays the earlier results while identical rows in the range stay distinct.
+
+    Args:
+        dao_id (str): The DAO ID.
+        rows (list): The rows of the range; cells beyond `columns` hold an optional idempotency key.
+        tx_type (str): The transaction type.
+        columns (int): Number of argument columns per row.
+        build (callable): Builds a transaction from (dao, wallet, key, *row arguments).
+
+    Returns:
+        list: One single-cell row per input row with its result message; blank rows give "".
+    """
+    dao = daos.get(dao_id)
+    if not dao:
+        return [["DAO not found."]]
+    wallet = excel_wallets.setdefault(dao_id, MultiSigWallet(list(dao.founders), required_signatures=len(dao.founders)))
+    results = [[""] for _ in rows]
+    transactions = []
+    positions = []
+    for i, row in enumerate(rows):
+        row = list(row) + [None] * (columns + 1 - len(row))
+        if all(cell in (None, "") for cell in row):
+            continue
+        args = row[:columns]
+        try:
+            key = _idempotency_key(row[columns], dao_id, tx_type, f"row{i}", *args)
+            transactions.append(build(dao, wallet, key, *args))
+        except (TypeError, ValueError):
+            results[i] = [f"Invalid row: {args}"]
+            continue
+        positions.append(i)
+    if transactions:
+        with dao_locks.lock_for(dao_id):
+            batch_results = TransactionEngine(dao, wallet).execute_batch(transactions)
+        for i, result in zip(positions, batch_results):
+            results[i] = [result]
+    return results
+
+@xl_func("string dao_id, var[][] rows: string[][]")
+@tracer.entry()
+def excel_batch_token_sales(dao_id, rows):
+    """
+    Executes the token sales of a range as one batch recorded in a single block.
+
+    Args:
+        dao_id (str): The DAO ID.
+        rows (list): Rows of buyer, amount, token price and an optional idempotency key.
+
+    Returns:
+        list: The result message of each row, as a column.
+    """
+    return _execute_rows(dao_id, rows, "token_sale", 3, lambda dao, wallet, key, buyer, amount, price:
+                         TokenSaleTransaction(dao, str(buyer), _amount(amount), float(price), wallet, key))
+
+@xl_func("string dao_id, var[][] rows: string[][]")
+@tracer.entry()
+def excel_batch_treasury_contributions(dao_id, rows):
+    """
+    Executes the treasury contributions of a range as one batch recorded in a single block.
+
+    Args:
+        dao_id (str): The DAO ID.
+        rows (list): Rows of contributor, amount and an optional idempotency key.
+
+    Returns:
+        list: The result message of each row, as a column.
+    """
+    return _execute_rows(dao_id, rows, "treasury_contribution", 2, lambda dao, wallet, key, contributor, amount:
+                         TreasuryContributionTransaction(dao, str(contributor), _amount(amount), wallet, key))
+
+@xl_func("string dao_id, var[][] rows: string[][]")
+@tracer.entry()
+def excel_batch_fund_distributions(dao_id, rows):
+    """
+    Executes the fund distributions of a range as one batch recorded in a single block.
+
+    Args:
+        dao_id (str): The DAO ID.
+        rows (list): Rows of recipient, amount, reason and an optional idempotency key.
+
+    Returns:
+        list: The result message of each row, as a column.
+    """
+    return _execute_rows(dao_id, rows, "fund_distribution", 3, lambda dao, wallet, key, recipient, amount, reason:
+                         FundDistributionTransaction(dao, str(recipient), _amount(amount), reason or "", wallet, key))
+
+@xl_func("string dao_id, var[][] rows: string[][]")
+@tracer.entry()
+def excel_batch_investments(dao_id, rows):
+    """
+    Executes the investments of a range as one batch recorded in a single block.
+
+    Args:
+        dao_id (str): The DAO ID.
+        rows (list): Rows of target project, amount and an optional idempotency key.
+
+    Returns:
+        list: The result message of each row, as a column.
+    """
+    return _execute_rows(dao_id, rows, "investment", 2, lambda dao, wallet, key, target_project, amount:
+                         InvestmentTransaction(dao, str(target_project), _amount(amount), wallet, key))
 
 @xl_func("string dao_id: string")
+@tracer.entry()
 def excel_get_blockchain_info(dao_id):
     """
     Retrieves and displays blockchain information for the specified DAO.
@@ -102,7 +283,47 @@ def excel_get_blockchain_info(dao_id):
     Returns:
         str: Blockchain information or an error message.
     """
-    dao = daos.get(dao_id)
+    dao = daos.peek(dao_id)
     if not dao:
         return "DAO not found."
-    return f"Blockchain length: {len(dao.blockchain.chain)}"
\ No newline at end of file
+    return read_results.get_or_compute("excel_get_blockchain_info", dao_id, dao.blockchain,
+                                       lambda: f"Blockchain length: {len(dao.blockchain.chain)}")
+
+@xl_func(": string[][]")
+def excel_get_read_cache_stats():
+    """
+    Retrieves the hit and miss counters of the cache behind the Excel read functions.
+
+    Returns:
+        list: Rows of counter name and value.
+    """
+    return [[name, str(value)] for name, value in read_results.stats().items()]
+
+@xl_func(": string[][]")
+def excel_get_memory_report():
+    """
+    Reports the approximate memory of each DAO loaded in memory, largest first.
+
+    Returns:
+        list: A header row, then one row per DAO with its ID, name, total bytes and bytes per subsystem.
+    """
+    report = memory_report(daos.cached(), excel_wallets.cached(), dao_locks.lock_for)
+    columns = ["dao_id", "name", "total", *SUBSYSTEMS]
+    return [columns] + [[str(row[column]) for column in columns] for row in report]
+
+@xl_func("int limit: string[][]")
+def excel_get_allocation_report(limit=20):
+    """
+    Reports the Backend and Frontend source lines whose memory grew most since the previous sample.
+
+    Args:
+        limit (int): Source lines reported.
+
+    Returns:
+        list: A header row, then one row per source line with its growth and current size,
+        or a message when allocation tracking is not running.
+    """
+    if not allocations.running:
+        return [["Allocation tracking is not running; set DAO_SUITE_TRACEMALLOC or call allocations.start()."]]
+    columns = ["site", "size_diff", "count_diff", "size", "count"]
+    return [columns] + [[str(row[column]) for column in columns] for row in allocations.sample(limit or 20)]
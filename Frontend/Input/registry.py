@@ -0,0 +1,262 @@
+import os
+import re
+import time
+import atexit
+import pickle
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import MutableMapping
+
+# Registry file; set DAO_SUITE_REGISTRY (e.g. in pyxll.cfg) to move it, or to ":memory:" to keep nothing.
+DEFAULT_REGISTRY_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "Data", "dao_registry.sqlite3")
+
+class RegistryDatabase:
+    """
+    A local SQLite file shared by several persistent registries.
+    """
+
+    def __init__(self, path):
+        """
+        Opens (or creates) the database.
+
+        Args:
+            path (str): The SQLite file path, or ":memory:".
+        """
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL" if path != ":memory:" else "PRAGMA journal_mode=MEMORY")
+        self.lock = threading.RLock()  # Serializes access to the connection
+        self.registries = []
+
+    def registry(self, table, **kwargs):
+        """
+        Creates a registry stored in a table of this database.
+
+        Args:
+            table (str): The table name.
+            **kwargs: Options passed to PersistentRegistry.
+
+        Returns:
+            PersistentRegistry: The registry.
+        """
+        registry = PersistentRegistry(self, table, **kwargs)
+        self.registries.append(registry)
+        return registry
+
+    def flush_all(self):
+        """
+        Writes the pending changes of every registry.
+        """
+        for registry in self.registries:
+            registry.flush()
+
+class PersistentRegistry(MutableMapping):
+    """
+    Dict-like registry of objects stored in SQLite, with lazy loading, an LRU cache of hot
+    objects and write-behind batched commits.
+
+    Objects are mutated in place by callers, so every object that is stored or read is
+    considered dirty and written back on the next flush or when it leaves the cache.
+    """
+
+    def __init__(self, database, table, cache_size=128, batch_size=64, flush_interval=5.0,
+                 dump=pickle.dumps, load=pickle.loads, clock=time.monotonic):
+        """
+        Initializes the registry.
+
+        Args:
+            database (RegistryDatabase): The database holding the table.
+            table (str): The table name.
+            cache_size (int): Maximum number of objects kept in memory.
+            batch_size (int): Number of dirty objects that triggers a commit.
+            flush_interval (float): Seconds after which pending changes are committed on the next access.
+            dump (callable): Serializes an object to bytes.
+            load (callable): Deserializes an object from bytes.
+            clock (callable): Returns the current time in seconds.
+        """
+        if not re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", table):
+            raise ValueError(f"Invalid table name: {table}")
+        self.database = database
+        self.table = table
+        self.cache_size = cache_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dump = dump
+        self.load = load
+        self.clock = clock
+        self._cache = OrderedDict()  # key -> object, least recently used first
+        self._dirty = set()
+        self._last_flush = clock()
+        self.hits = 0
+        self.misses = 0
+        with database.lock:
+            database.connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} (key TEXT PRIMARY KEY, value BLOB NOT NULL)")
+            database.connection.commit()
+
+    def __getitem__(self, key):
+        with self.database.lock:
+            if key in self._cache:
+                self.hits += 1
+                self._cache.move_to_end(key)
+                value = self._cache[key]
+            else:
+                row = self.database.connection.execute(
+                    f"SELECT value FROM {self.table} WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    self.misses += 1
+                    raise KeyError(key)
+                self.misses += 1
+                value = self.load(row[0])
+                self._cache_put(key, value)
+            self._dirty.add(key)
+            self._maybe_flush()
+            return value
+
+    def peek(self, key, default=None):
+        """
+        Retrieves an object for reading only. Unlike get, the object is not marked dirty, so
+        read-only callers do not cause it to be written back.
+
+        Args:
+            key (str): The key.
+            default: Returned when the key is not stored.
+
+        Returns:
+            The object, or default.
+        """
+        with self.database.lock:
+            if key in self._cache:
+                self.hits += 1
+                self._cache.move_to_end(key)
+                return self._cache[key]
+            row = self.database.connection.execute(
+                f"SELECT value FROM {self.table} WHERE key = ?", (key,)).fetchone()
+            self.misses += 1
+            if row is None:
+                return default
+            value = self.load(row[0])
+            self._cache_put(key, value)
+            return value
+
+    def __setitem__(self, key, value):
+        with self.database.lock:
+            self._cache_put(key, value)
+            self._dirty.add(key)
+            self._maybe_flush()
+
+    def __delitem__(self, key):
+        with self.database.lock:
+            cached = self._cache.pop(key, None) is not None
+            self._dirty.discard(key)
+            cursor = self.database.connection.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+            if not cached and cursor.rowcount == 0:
+                raise KeyError(key)
+            self._maybe_flush()
+
+    def __contains__(self, key):
+        with self.database.lock:
+            if key in self._cache:
+                return True
+            return self.database.connection.execute(
+                f"SELECT 1 FROM {self.table} WHERE key = ?", (key,)).fetchone() is not None
+
+    def __iter__(self):
+        with self.database.lock:
+            self.flush()
+            keys = [row[0] for row in self.database.connection.execute(f"SELECT key FROM {self.table}")]
+        return iter(keys)
+
+    def __len__(self):
+        with self.database.lock:
+            self.flush()
+            return self.database.connection.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+    def clear(self):
+        with self.database.lock:
+            self._cache.clear()
+            self._dirty.clear()
+            self.database.connection.execute(f"DELETE FROM {self.table}")
+            self.database.connection.commit()
+
+    def flush(self):
+        """
+        Writes every dirty cached object and commits in one transaction.
+        """
+        with self.database.lock:
+            if self._dirty:
+                rows = [(key, self.dump(self._cache[key])) for key in self._dirty if key in self._cache]
+                self.database.connection.executemany(
+                    f"INSERT OR REPLACE INTO {self.table} (key, value) VALUES (?, ?)", rows)
+                self._dirty.clear()
+            self.database.connection.commit()
+            self._last_flush = self.clock()
+
+    def cached(self):
+        """
+        Retrieves the objects currently held in memory, without loading any from the database.
+
+        Returns:
+            dict: Key -> object, least recently used first.
+        """
+        with self.database.lock:
+            return dict(self._cache)
+
+    def evict(self, key):
+        """
+        Writes an object back if it changed and drops it from memory, e.g. to release a large DAO.
+        It is loaded again on its next access.
+
+        Args:
+            key (str): The key.
+
+        Returns:
+            bool: True if the object was in memory.
+        """
+        with self.database.lock:
+            if key not in self._cache:
+                return False
+            value = self._cache.pop(key)
+            if key in self._dirty:
+                self._dirty.discard(key)
+                self.database.connection.execute(
+                    f"INSERT OR REPLACE INTO {self.table} (key, value) VALUES (?, ?)", (key, self.dump(value)))
+                self.database.connection.commit()
+            return True
+
+    def stats(self):
+        """
+        Retrieves the registry's cache counters.
+
+        Returns:
+            dict: Cached objects, pending writes, hits and misses.
+        """
+        return {"cached": len(self._cache), "dirty": len(self._dirty), "hits": self.hits, "misses": self.misses}
+
+    def _cache_put(self, key, value):
+        """
+        Adds an object to the cache, writing back the least recently used objects beyond the cache size.
+
+        Args:
+            key (str): The key.
+            value: The object.
+        """
+        self._cache[key] = value
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            old_key, old_value = self._cache.popitem(last=False)
+            if old_key in self._dirty:
+                self._dirty.discard(old_key)
+                self.database.connection.execute(
+                    f"INSERT OR REPLACE INTO {self.table} (key, value) VALUES (?, ?)", (old_key, self.dump(old_value)))
+
+    def _maybe_flush(self):
+        if len(self._dirty) >= self.batch_size or self.clock() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+# Database shared by the Excel layer's registries
+database = RegistryDatabase(os.environ.get("DAO_SUITE_REGISTRY", DEFAULT_REGISTRY_PATH))
+atexit.register(database.flush_all)
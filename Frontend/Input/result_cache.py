@@ -0,0 +1,64 @@
+from collections import OrderedDict
+
+class ResultCache:
+    """
+    Caches the results of Excel read functions until the blockchain they are derived from changes.
+
+    Entries are stamped with the chain's identity (its genesis hash) and version, which
+    Blockchain.add_block bumps, so a result is reused only while the chain is unchanged.
+    """
+
+    def __init__(self, max_entries=4096):
+        """
+        Initializes the cache.
+
+        Args:
+            max_entries (int): Maximum number of cached results; the least recently used are evicted first.
+        """
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # (function name, id) -> (stamp, result)
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, name, key, blockchain, compute):
+        """
+        Returns the cached result for the current chain state, computing it on a miss.
+
+        Args:
+            name (str): The function name.
+            key (str): The DAO or session ID.
+            blockchain (Blockchain): The chain the result is derived from.
+            compute (callable): Computes the result when it is not cached.
+
+        Returns:
+            The result.
+        """
+        entry_key = (name, key)
+        stamp = (blockchain.chain[0].hash, blockchain.version)
+        entry = self._entries.get(entry_key)
+        if entry is not None and entry[0] == stamp:
+            self.hits += 1
+            self._entries.move_to_end(entry_key)
+            return entry[1]
+        self.misses += 1
+        result = compute()
+        self._entries[entry_key] = (stamp, result)
+        self._entries.move_to_end(entry_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return result
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self):
+        """
+        Retrieves the cache's counters.
+
+        Returns:
+            dict: Current size, hits and misses.
+        """
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+# Shared by the Excel read functions
+read_results = ResultCache()
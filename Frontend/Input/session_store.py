@@ -0,0 +1,95 @@
+import time
+from collections import OrderedDict
+from collections.abc import MutableMapping
+
+class SessionStore(MutableMapping):
+    """
+    Dict-like store of wizard sessions with a size limit, LRU eviction and an idle TTL.
+    """
+
+    def __init__(self, max_sessions=1000, ttl_seconds=3600, clock=time.monotonic):
+        """
+        Initializes the store.
+
+        Args:
+            max_sessions (int): Maximum number of sessions; the least recently used are evicted first.
+            ttl_seconds (float): Sessions not used for this long are dropped.
+            clock (callable): Returns the current time in seconds. Tests can inject a fake clock.
+        """
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._sessions = OrderedDict()  # session_id -> (last_used, state), least recently used first
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0  # Sessions dropped because the store was full
+        self.expirations = 0  # Sessions dropped because they were idle too long
+
+    def __getitem__(self, session_id):
+        now = self.clock()
+        self._expire(now)
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            self.misses += 1
+            raise KeyError(session_id)
+        self.hits += 1
+        self._sessions[session_id] = (now, entry[1])
+        self._sessions.move_to_end(session_id)
+        return entry[1]
+
+    def __setitem__(self, session_id, state):
+        now = self.clock()
+        self._sessions[session_id] = (now, state)
+        self._sessions.move_to_end(session_id)
+        self._expire(now)
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+            self.evictions += 1
+
+    def __delitem__(self, session_id):
+        del self._sessions[session_id]
+
+    def __contains__(self, session_id):
+        self._expire(self.clock())
+        return session_id in self._sessions
+
+    def __iter__(self):
+        self._expire(self.clock())
+        return iter(list(self._sessions))
+
+    def __len__(self):
+        self._expire(self.clock())
+        return len(self._sessions)
+
+    def clear(self):
+        self._sessions.clear()
+
+    def stats(self):
+        """
+        Retrieves the store's counters.
+
+        Returns:
+            dict: Current size, hits, misses, evictions and expirations.
+        """
+        return {
+            "size": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations
+        }
+
+    def _expire(self, now):
+        """
+        Drops sessions that have been idle longer than the TTL, oldest first.
+
+        Args:
+            now (float): The current time.
+        """
+        sessions = self._sessions
+        while sessions:
+            last_used, _ = next(iter(sessions.values()))
+            if now - last_used < self.ttl_seconds:
+                break
+            sessions.popitem(last=False)
+            self.expirations += 1
@@ -0,0 +1,141 @@
+import re
+
+def parse_cell(address):
+    """
+    Converts an A1-style cell address to row and column numbers.
+
+    Args:
+        address (str): The cell address, e.g. "P13".
+
+    Returns:
+        tuple: (row, column), both starting at 1.
+    """
+    match = re.fullmatch(r"\$?([A-Za-z]+)\$?(\d+)", address.strip())
+    if not match:
+        raise ValueError(f"Invalid cell address: {address}")
+    column = 0
+    for letter in match.group(1).upper():
+        column = column * 26 + ord(letter) - ord("A") + 1
+    return int(match.group(2)), column
+
+def cell_address(row, column):
+    """
+    Converts row and column numbers to an A1-style cell address.
+
+    Args:
+        row (int): The row, starting at 1.
+        column (int): The column, starting at 1.
+
+    Returns:
+        str: The cell address.
+    """
+    letters = ""
+    while column:
+        column, remainder = divmod(column - 1, 26)
+        letters = chr(ord("A") + remainder) + letters
+    return f"{letters}{row}"
+
+def range_address(top, left, bottom, right):
+    """
+    Builds the address of a rectangular range.
+    """
+    first, last = cell_address(top, left), cell_address(bottom, right)
+    return first if first == last else f"{first}:{last}"
+
+def _as_rows(value):
+    """
+    Normalizes a COM Range value to a list of rows; a single cell comes back as a scalar.
+    """
+    if isinstance(value, (tuple, list)):
+        return [list(row) if isinstance(row, (tuple, list)) else [row] for row in value]
+    return [[value]]
+
+def _is_blank(row):
+    return all(cell in (None, "") for cell in row)
+
+class SheetIO:
+    """
+    Reads and writes a worksheet in as few COM round trips as possible: named input cells
+    are read as one block, outputs are written per contiguous run, and tables are read and
+    their results written with one call each.
+    """
+
+    def __init__(self, app, sheet):
+        """
+        Initializes the sheet I/O.
+
+        Args:
+            app: The Excel application object, e.g. from pyxll.xl_app().
+            sheet (str): The worksheet name.
+        """
+        self.worksheet = app.Worksheets(sheet)
+
+    def read_fields(self, fields):
+        """
+        Reads named cells with a single Range read over their bounding block.
+
+        Args:
+            fields (dict): Field name -> cell address.
+
+        Returns:
+            dict: Field name -> cell value.
+        """
+        cells = {name: parse_cell(address) for name, address in fields.items()}
+        top = min(row for row, _ in cells.values())
+        left = min(column for _, column in cells.values())
+        bottom = max(row for row, _ in cells.values())
+        right = max(column for _, column in cells.values())
+        block = _as_rows(self.worksheet.Range(range_address(top, left, bottom, right)).Value)
+        return {name: block[row - top][column - left] for name, (row, column) in cells.items()}
+
+    def write_fields(self, values):
+        """
+        Writes values to cells, with one Range write per run of vertically adjacent cells.
+        Cells between outputs are never touched.
+
+        Args:
+            values (dict): Cell address -> value.
+        """
+        cells = sorted((parse_cell(address)[::-1], value) for address, value in values.items())
+        run = []
+        for (column, row), value in cells:
+            if run and (column != run[0][0] or row != run[-1][1] + 1):
+                self._write_run(run)
+                run = []
+            run.append((column, row, value))
+        if run:
+            self._write_run(run)
+
+    def read_table(self, address):
+        """
+        Reads a table of operations with a single Range read, dropping trailing blank rows.
+
+        Args:
+            address (str): The table range, e.g. "A3:D1002".
+
+        Returns:
+            list: The rows, each a list of cell values.
+        """
+        rows = _as_rows(self.worksheet.Range(address).Value)
+        while rows and _is_blank(rows[-1]):
+            rows.pop()
+        return rows
+
+    def write_column(self, top_left, values):
+        """
+        Writes a column of values downwards from a cell with a single Range write.
+
+        Args:
+            top_left (str): The first cell.
+            values (list): The values, or single-cell rows as returned by array functions.
+        """
+        if not values:
+            return
+        row, column = parse_cell(top_left)
+        rows = [value if isinstance(value, (tuple, list)) else [value] for value in values]
+        self.worksheet.Range(range_address(row, column, row + len(rows) - 1, column)).Value = rows
+
+    def _write_run(self, run):
+        column, row, value = run[0]
+        target = self.worksheet.Range(range_address(row, column, run[-1][1], column))
+        target.Value = value if len(run) == 1 else [[value] for _, _, value in run]
@@ -1 +1,4 @@
-# This file can be empty
\ No newline at end of file
+import os
+
+# Keep the Excel registries in memory so test runs never touch Data/
+os.environ.setdefault("DAO_SUITE_REGISTRY", ":memory:")
@@ -0,0 +1,99 @@
+import unittest
+import numpy as np
+from Backend.Features.dao_creation import DAOCreation
+from Backend.Database.blockchain import MultiSigWallet
+from Backend.Features.analytics import DAOAnalytics, gini, top_n_share
+from Backend.Features.transaction_engine import TransactionEngine
+from Backend.Features.transactions import (
+    TokenSaleTransaction,
+    TreasuryContributionTransaction,
+    FundDistributionTransaction,
+    InvestmentTransaction
+)
+
+class TestAnalytics(unittest.TestCase):
+    """
+    Unit tests for vectorized DAO analytics.
+    """
+
+    def setUp(self):
+        """
+        Set up a DAO with a mix of transactions.
+        """
+        founders = ["Mihail", "Ben"]
+        self.dao = DAOCreation("TestDAO", founders, initial_supply=1000)
+        self.wallet = MultiSigWallet(founders, required_signatures=2)
+        TokenSaleTransaction(self.dao, "Alice", 100, 1.0, self.wallet).execute()
+        TokenSaleTransaction(self.dao, "Carol", 300, 3.0, self.wallet).execute()
+        TreasuryContributionTransaction(self.dao, "Mihail", 200, self.wallet).execute()
+        FundDistributionTransaction(self.dao, "Alice", 50, "Grant", self.wallet).execute()
+        InvestmentTransaction(self.dao, "CoolProject", 30, self.wallet).execute()
+        self.analytics = DAOAnalytics(self.dao)
+
+    def test_gini_and_top_share(self):
+        """
+        Test the concentration measures on known distributions.
+        """
+        self.assertAlmostEqual(gini([5, 5, 5, 5]), 0.0)
+        self.assertAlmostEqual(gini([0, 0, 0, 10]), 0.75)
+        self.assertAlmostEqual(top_n_share([1, 2, 3, 4], n=2), 0.7)
+        self.assertEqual(top_n_share([], n=2), 0.0)
+        self.assertEqual(top_n_share([1, 2, 3, 4], n=0), 0.0)
+        self.assertEqual(top_n_share([1, 2, 3, 4], n=-1), 0.0)
+        concentration = self.analytics.holder_concentration(n=1)
+        self.assertEqual(concentration["holders"], 4)
+        self.assertAlmostEqual(concentration["top_1_share"], 500 / 1250)
+        print("test_gini_and_top_share passed.")
+
+    def test_balance_time_series(self):
+        """
+        Test that balance series start at the opening balances and end at the current wallets.
+        """
+        series = self.analytics.balance_time_series()
+        self.assertEqual(series.iloc[0]["Mihail"], 500)
+        self.assertEqual(series.iloc[0]["Alice"], 0)
+        last = series.iloc[-1]
+        for member, balance in self.dao.wallets.items():
+            self.assertEqual(last[member], balance)
+        daily = self.analytics.balance_time_series(freq="D")
+        self.assertEqual(daily.iloc[-1]["Alice"], 150)
+        print("test_balance_time_series passed.")
+
+    def test_treasury_flows(self):
+        """
+        Test treasury inflow and outflow aggregation per period.
+        """
+        flows = self.analytics.treasury_flows(freq="D")
+        self.assertEqual(flows["inflow"].sum(), 200)
+        self.assertEqual(flows["outflow"].sum(), 80)
+        self.assertEqual(flows["net"].sum(), self.dao.ledger.treasury_balance)
+        print("test_treasury_flows passed.")
+
+    def test_token_sale_price_stats(self):
+        """
+        Test token sale price statistics.
+        """
+        stats = self.analytics.token_sale_price_stats()
+        self.assertEqual(stats["count"], 2)
+        self.assertEqual(stats["proceeds"], 1000.0)
+        self.assertEqual(stats["vwap"], 2.5)
+        self.assertEqual(stats["median"], 2.0)
+        print("test_token_sale_price_stats passed.")
+
+    def test_incremental_refresh_at_scale(self):
+        """
+        Test that analytics pick up new batched blocks incrementally.
+        """
+        self.analytics.refresh()
+        engine = TransactionEngine(self.dao, self.wallet)
+        engine.execute_batch([TokenSaleTransaction(self.dao, f"buyer{i}", 1, float(i % 5), self.wallet)
+                              for i in range(5000)])
+        stats = self.analytics.token_sale_price_stats()
+        self.assertEqual(stats["count"], 5002)
+        self.assertEqual(stats["max"], 4.0)
+        self.assertEqual(len(self.analytics.frames["token_sale"]), 5002)
+        self.assertTrue(np.isclose(self.analytics.holder_concentration()["gini"], gini(list(self.dao.wallets.values()))))
+        print("test_incremental_refresh_at_scale passed.")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import os
+import copy
+import shutil
+import tempfile
+import unittest
+from Benchmarks.__main__ import main
+from Benchmarks.harness import CASES, run, compare
+from Benchmarks.import_time import check, measure
+
+class TestBenchmarks(unittest.TestCase):
+    """
+    Smoke tests for the benchmark harness; the timings themselves are not asserted.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_every_case_runs(self):
+        """
+        Test that every registered case runs and records time and peak memory.
+        """
+        results = run(quick=True, number=1, repeat=1)["results"]
+        self.assertEqual({result["case"] for result in results.values()}, set(CASES))
+        for result in results.values():
+            self.assertGreater(result["min_seconds"], 0)
+            self.assertGreaterEqual(result["peak_bytes"], 0)
+        print("test_every_case_runs passed.")
+
+    def test_compare_flags_regressions(self):
+        """
+        Test that slower or more memory-hungry results are flagged against the baseline.
+        """
+        baseline = run(quick=True, name_filter="block_hash_block", number=1, repeat=1)
+        current = copy.deepcopy(baseline)
+        key = next(iter(current["results"]))
+        self.assertEqual(compare(current, baseline), [])
+        current["results"][key]["min_seconds"] = baseline["results"][key]["min_seconds"] * 2
+        current["results"][key]["peak_bytes"] = 10 ** 6
+        self.assertEqual([(k, metric) for k, metric, *_ in compare(current, baseline)],
+                         [(key, "min_seconds"), (key, "peak_bytes")])
+        print("test_compare_flags_regressions passed.")
+
+    def test_cli_saves_and_checks_baseline(self):
+        """
+        Test saving a baseline and comparing a later run against it.
+        """
+        baseline = os.path.join(self.directory, "baseline.json")
+        options = ["--quick", "--filter", "parse_governance_rule", "--number", "1", "--repeat", "1", "--baseline", baseline]
+        self.assertEqual(main(options + ["--save-baseline"]), 0)
+        self.assertTrue(os.path.exists(baseline))
+        self.assertEqual(main(options + ["--threshold", "1000"]), 0)
+        print("test_cli_saves_and_checks_baseline passed.")
+
+    def test_import_budgets(self):
+        """
+        Test that the add-in and backend modules import within budget and without heavy dependencies.
+        """
+        results, violations = check(repeat=2)
+        self.assertEqual(violations, [])
+        self.assertTrue(all(result["seconds"] > 0 for result in results.values()))
+        self.assertIn("pandas", measure("Backend.Features.analytics", repeat=1)["heavy"])
+        print("test_import_budgets passed.")
+
+if __name__ == "__main__":
+    unittest.main()
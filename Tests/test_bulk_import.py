@@ -0,0 +1,84 @@
+import os
+import tempfile
+import unittest
+import pandas as pd
+from Backend.Features.dao_creation import DAOCreation
+from Backend.Database.blockchain import MultiSigWallet
+from Backend.Features.bulk_import import import_transactions, import_transaction_frames, validate_chunk
+
+class TestBulkImport(unittest.TestCase):
+    """
+    Unit tests for the streaming bulk transaction import.
+    """
+
+    def setUp(self):
+        """
+        Set up a DAO and multisig wallet for testing.
+        """
+        founders = ["Mihail", "Ben", "Moritz"]
+        self.dao = DAOCreation("TestDAO", founders, token_name="REVO", initial_supply=900)
+        self.wallet = MultiSigWallet(owners=founders, required_signatures=3)
+
+    def test_validate_chunk(self):
+        """
+        Test the vectorized checks for unknown members, bad amounts and balances.
+        """
+        chunk = pd.DataFrame({
+            "type": ["token_sale", "treasury_contribution", "treasury_contribution", "fund_distribution",
+                     "bogus", "treasury_contribution", "token_sale", "treasury_contribution", "investment"],
+            "member": ["Alice", "Mihail", "Frank", "Bob", "Mihail", "Ben", "Ben", "Ben", None],
+            "amount": [10, 100, 5, 150, 1, -3, 50, 340, 1000],
+            "token_price": [1.0, None, None, None, None, None, 2.0, None, None],
+            "target_project": [None] * 8 + ["CoolProject"],
+        })
+        reasons = validate_chunk(chunk, self.dao).tolist()
+        self.assertTrue(pd.isna(reasons[0]) and pd.isna(reasons[1]) and pd.isna(reasons[6]))
+        self.assertEqual(reasons[2], "Unknown member.")
+        self.assertEqual(reasons[3], "Insufficient treasury balance.")
+        self.assertEqual(reasons[4], "Unknown transaction type.")
+        self.assertEqual(reasons[5], "Amount must be positive.")
+        self.assertTrue(pd.isna(reasons[7]))  # 300 + 50 bought earlier covers 340
+        self.assertEqual(reasons[8], "Insufficient treasury balance.")
+        print("test_validate_chunk passed.")
+
+    def test_import_csv_in_chunks(self):
+        """
+        Test importing a CSV file with one block per chunk and a rejection report.
+        """
+        rows = [{"type": "token_sale", "member": f"buyer{i}", "amount": 1, "token_price": 2.5} for i in range(25)]
+        rows.append({"type": "treasury_contribution", "member": "Mihail", "amount": 100})
+        rows.append({"type": "fund_distribution", "member": "Bob", "amount": 60, "reason": "Grant"})
+        rows.append({"type": "fund_distribution", "member": "Eve", "amount": 60, "reason": "Grant"})
+        rows.append({"type": "investment", "amount": 5, "target_project": "CoolProject"})
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "transactions.csv")
+            pd.DataFrame(rows).to_csv(path, index=False)
+            report_path = os.path.join(tmp, "report", "rejected.csv")
+            chain_len = len(self.dao.blockchain.chain)
+            summary = import_transactions(path, self.dao, self.wallet, chunksize=10, report_path=report_path)
+            self.assertTrue(os.path.exists(report_path))
+        self.assertEqual(summary["imported"], 28)
+        self.assertEqual(summary["rejected"], 1)
+        self.assertEqual(summary["blocks"], 3)
+        self.assertEqual(len(self.dao.blockchain.chain), chain_len + 3)
+        report = summary["report"]
+        self.assertEqual(report.loc[0, "row"], 27)
+        self.assertIn("Insufficient balance in 'treasury'", report.loc[0, "reason"])
+        self.assertEqual(self.dao.wallets["Bob"], 60)
+        self.assertEqual(self.dao.ledger.treasury_balance, 35)
+        print("test_import_csv_in_chunks passed.")
+
+    def test_import_frames_batch_size(self):
+        """
+        Test splitting valid rows into blocks of a maximum size.
+        """
+        frame = pd.DataFrame({"type": ["token_sale"] * 5, "member": list("abcde"), "amount": [1] * 5,
+                              "token_price": [1.0] * 5})
+        summary = import_transaction_frames([frame], self.dao, self.wallet, batch_size=2)
+        self.assertEqual(summary["imported"], 5)
+        self.assertEqual(summary["blocks"], 3)
+        self.assertTrue(summary["report"].empty)
+        print("test_import_frames_batch_size passed.")
+
+if __name__ == "__main__":
+    unittest.main()
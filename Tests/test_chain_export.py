@@ -0,0 +1,101 @@
+import importlib.util
+import os
+import tempfile
+import unittest
+from unittest import mock
+import pandas as pd
+from Backend.Features.dao_creation import DAOCreation
+from Backend.Database.blockchain import MultiSigWallet
+from Backend.Features.chain_export import ChainExporter, read_export
+from Backend.Features.transactions import TokenSaleTransaction, TreasuryContributionTransaction
+
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+class TestChainExport(unittest.TestCase):
+    """
+    Unit tests for the columnar chain exporter.
+    """
+
+    def setUp(self):
+        """
+        Set up a DAO with a few transactions.
+        """
+        founders = ["Mihail", "Ben"]
+        self.dao = DAOCreation("TestDAO", founders, initial_supply=1000)
+        self.wallet = MultiSigWallet(founders, required_signatures=2)
+        TokenSaleTransaction(self.dao, "Alice", 100, 1.5, self.wallet).execute()
+        TreasuryContributionTransaction(self.dao, "Mihail", 50, self.wallet).execute()
+
+    def test_typed_frames(self):
+        """
+        Test that each transaction type is exported with typed columns.
+        """
+        frames = ChainExporter(self.dao.blockchain).export()
+        self.assertEqual(set(frames), {"smart_contract", "token_sale", "treasury_contribution"})
+        sales = frames["token_sale"]
+        self.assertEqual(sales.loc[0, "buyer"], "Alice")
+        self.assertEqual(str(sales["amount"].dtype), "float64")
+        self.assertEqual(sales.loc[0, "token_price"], 1.5)
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(sales["timestamp"]))
+        self.assertEqual(sales.loc[0, "block_index"], 2)
+        self.assertEqual(frames["smart_contract"].loc[0, "action"], "DAO initialized")
+        print("test_typed_frames passed.")
+
+    def test_incremental_export(self):
+        """
+        Test that repeat exports only contain blocks added since the previous export.
+        """
+        exporter = ChainExporter(self.dao.blockchain)
+        exporter.export()
+        self.assertEqual(exporter.export(), {})
+        TokenSaleTransaction(self.dao, "Carol", 7, 2.0, self.wallet).execute()
+        frames = exporter.export()
+        self.assertEqual(list(frames), ["token_sale"])
+        self.assertEqual(frames["token_sale"]["buyer"].tolist(), ["Carol"])
+        print("test_incremental_export passed.")
+
+    def test_unknown_transactions(self):
+        """
+        Test that transactions without a known type are exported as JSON payloads.
+        """
+        self.dao.blockchain.add_block([{"from": "alice", "to": "bob", "amount": 5}])
+        frames = ChainExporter(self.dao.blockchain, exported_height=4).export()
+        self.assertIn('"from": "alice"', frames["other"].loc[0, "payload"])
+        print("test_unknown_transactions passed.")
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+    def test_export_to_parquet_resumes(self):
+        """
+        Test that file exports resume from the stored height in a fresh exporter.
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            ChainExporter(self.dao.blockchain).export_to(tmp)
+            TokenSaleTransaction(self.dao, "Carol", 7, 2.0, self.wallet).execute()
+            paths = ChainExporter(self.dao.blockchain).export_to(tmp)
+            self.assertEqual(len(paths), 1)
+            sales = read_export(tmp, "token_sale")
+            self.assertEqual(sales["buyer"].tolist(), ["Alice", "Carol"])
+        print("test_export_to_parquet_resumes passed.")
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+    def test_failed_export_is_retried(self):
+        """
+        Test that a failed write leaves the exported height in place, so a retry exports every block.
+        """
+        exporter = ChainExporter(self.dao.blockchain)
+        with tempfile.TemporaryDirectory() as tmp:
+            with mock.patch.object(pd.DataFrame, "to_parquet", side_effect=OSError("No space left on device")):
+                with self.assertRaises(OSError):
+                    exporter.export_to(tmp)
+            self.assertEqual(exporter.exported_height, 0)
+            self.assertEqual(os.listdir(os.path.join(tmp, "smart_contract")), [])
+            TokenSaleTransaction(self.dao, "Carol", 7, 2.0, self.wallet).execute()
+            exporter.export_to(tmp)
+            self.assertEqual(exporter.exported_height, len(self.dao.blockchain.chain))
+            self.assertEqual(read_export(tmp, "token_sale")["buyer"].tolist(), ["Alice", "Carol"])
+            self.assertEqual(read_export(tmp, "treasury_contribution")["contributor"].tolist(), ["Mihail"])
+            self.assertEqual(read_export(tmp, "smart_contract")["block_index"].tolist()[0], 1)
+        print("test_failed_export_is_retried passed.")
+
+if __name__ == "__main__":
+    unittest.main()
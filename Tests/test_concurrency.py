@@ -0,0 +1,113 @@
+import threading
+import unittest
+from Backend.Features.dao_creation import DAOCreation
+from Backend.Database.blockchain import MultiSigWallet
+from Backend.Features.concurrency import ConcurrentExecutor, DAOLockRegistry, locked
+from Backend.Features.transactions import TokenSaleTransaction, TreasuryContributionTransaction
+
+class TestConcurrency(unittest.TestCase):
+    """
+    Unit tests for concurrent multi-DAO execution.
+    """
+
+    def setUp(self):
+        """
+        Set up several DAOs with their multisig wallets.
+        """
+        self.daos = []
+        for i in range(8):
+            founders = [f"founder{i}a", f"founder{i}b"]
+            dao = DAOCreation(f"DAO{i}", founders, initial_supply=1000)
+            self.daos.append((dao, MultiSigWallet(founders, required_signatures=2)))
+
+    def test_execute_transactions_across_daos(self):
+        """
+        Test that transactions for many DAOs run concurrently and keep per-DAO order.
+        """
+        transactions = []
+        for n in range(50):
+            for dao, wallet in self.daos:
+                transactions.append(TokenSaleTransaction(dao, "buyer", 1, 1.0, wallet))
+        with ConcurrentExecutor(max_workers=4) as executor:
+            results = executor.execute_transactions(transactions)
+        self.assertEqual(len(results), 400)
+        self.assertTrue(all("executed and recorded on blockchain" in r for r in results))
+        for dao, _ in self.daos:
+            self.assertEqual(dao.wallets["buyer"], 50)
+            self.assertEqual(len(dao.blockchain.chain), 52)  # genesis + init block + 50 sales
+            chain = dao.blockchain.chain
+            self.assertTrue(all(chain[i].previous_hash == chain[i - 1].hash for i in range(1, len(chain))))
+        print("test_execute_transactions_across_daos passed.")
+
+    def test_batched_execution_order(self):
+        """
+        Test that batched execution records one block per DAO and applies transactions in order.
+        """
+        dao, wallet = self.daos[0]
+        transactions = [
+            TreasuryContributionTransaction(dao, "founder0a", 500, wallet),
+            TreasuryContributionTransaction(dao, "founder0a", 1, wallet),
+        ]
+        with ConcurrentExecutor(max_workers=2) as executor:
+            results = executor.execute_transactions(transactions, batched=True)
+        self.assertIn("executed", results[0])
+        self.assertIn("Insufficient balance", results[1])
+        self.assertEqual(len(dao.blockchain.chain), 3)
+        print("test_batched_execution_order passed.")
+
+    def test_submit_holds_dao_lock(self):
+        """
+        Test that submitted calls for the same DAO never overlap.
+        """
+        dao, _ = self.daos[0]
+        active = []
+        overlaps = []
+        guard = threading.Lock()
+
+        def work():
+            with guard:
+                active.append(1)
+                overlaps.append(len(active) > 1)
+            dao.add_member(f"m{threading.get_ident()}")
+            with guard:
+                active.pop()
+
+        with ConcurrentExecutor(max_workers=4) as executor:
+            futures = [executor.submit(dao, work) for _ in range(20)]
+            for future in futures:
+                future.result()
+        self.assertFalse(any(overlaps))
+        print("test_submit_holds_dao_lock passed.")
+
+    def test_busy_dao_does_not_starve_others(self):
+        """
+        Test that calls waiting for a locked DAO occupy one worker, so other DAOs keep running.
+        """
+        locks = DAOLockRegistry()
+        (dao_a, _), (dao_b, _) = self.daos[0], self.daos[1]
+        order = []
+        with ConcurrentExecutor(max_workers=2, locks=locks) as executor:
+            with locks.lock_for(dao_a.dao_id):
+                waiting = [executor.submit(dao_a, order.append, i) for i in range(4)]
+                self.assertEqual(executor.submit(dao_b, dao_b.add_member, "Zoe").result(timeout=5), "Member 'Zoe' added.")
+                self.assertEqual(order, [])
+            for future in waiting:
+                future.result(timeout=5)
+        self.assertEqual(order, [0, 1, 2, 3])
+        print("test_busy_dao_does_not_starve_others passed.")
+
+    def test_lock_registry(self):
+        """
+        Test that locks are per DAO and reentrant.
+        """
+        locks = DAOLockRegistry()
+        dao_a, dao_b = self.daos[0][0], self.daos[1][0]
+        self.assertIs(locks.lock_for(dao_a.dao_id), locks.lock_for(dao_a.dao_id))
+        self.assertIsNot(locks.lock_for(dao_a.dao_id), locks.lock_for(dao_b.dao_id))
+        with locked(dao_a, locks):
+            with locked(dao_a, locks):
+                pass
+        print("test_lock_registry passed.")
+
+if __name__ == "__main__":
+    unittest.main()
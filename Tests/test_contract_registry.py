@@ -0,0 +1,91 @@
+import threading
+import unittest
+from Backend.Features.concurrency import dao_locks
+from Backend.Database import Blockchain
+from Backend.Database.contract_registry import contract_digest
+from Backend.Features.dao_creation import DAOCreation
+from Backend.Features.smart_contracts import process_user_input_and_add_contract
+from Frontend.Input.excel_creation import daos
+from Frontend.Input.excel_smart_contracts import excel_add_smart_contract, excel_get_smart_contracts, excel_blockchains
+
+class TestContractRegistry(unittest.TestCase):
+    """
+    Unit tests for the contract registry maintained alongside the blockchain.
+    """
+
+    def tearDown(self):
+        """
+        Clear the global `excel_blockchains` dictionary after each test.
+        """
+        excel_blockchains.clear()
+        daos.clear()
+
+    def test_active_rule_by_type(self):
+        """
+        Test that the latest contract of each rule type is the active one.
+        """
+        bc = Blockchain()
+        process_user_input_and_add_contract("Set quorum to 50% +1", bc)
+        process_user_input_and_add_contract("Set voting time to 48 hours", bc)
+        process_user_input_and_add_contract("Set quorum to 60%", bc)
+        active = bc.contract_registry.active_rule("quorum")
+        self.assertEqual(active["blocks"], [3])
+        self.assertIn("60", active["transaction"]["solidity"])
+        self.assertEqual(bc.contract_registry.active_rule("voting_time")["blocks"], [2])
+        self.assertIsNone(bc.contract_registry.active_rule("proposal_cost"))
+        print("test_active_rule_by_type passed.")
+
+    def test_lookup_by_digest(self):
+        """
+        Test looking up a contract by bytecode digest and recording repeated appearances.
+        """
+        bc = Blockchain()
+        process_user_input_and_add_contract("Set proposal cost to 10", bc)
+        process_user_input_and_add_contract("Set proposal cost to 10", bc)
+        bytecode = bc.chain[1].transactions[0]["bytecode"]
+        entry = bc.contract_registry.get(contract_digest(bytecode))
+        self.assertEqual(entry["rule_type"], "proposal_cost")
+        self.assertEqual(entry["blocks"], [1, 2])
+        print("test_lookup_by_digest passed.")
+
+    def test_dao_contracts_registered(self):
+        """
+        Test that DAO summary contracts are registered under the "dao" rule type.
+        """
+        dao = DAOCreation("TestDAO", ["Mihail", "Ben"])
+        dao.add_member("Alice")
+        active = dao.blockchain.contract_registry.active_rule("dao")
+        self.assertEqual(active["transaction"]["action"], "Added member: Alice")
+        self.assertEqual(len(dao.blockchain.contract_registry.contracts()), 2)
+        print("test_dao_contracts_registered passed.")
+
+    def test_excel_get_smart_contracts(self):
+        """
+        Test that contracts added from Excel are listed by the read function.
+        """
+        excel_add_smart_contract("session", "Set quorum to 50% +1")
+        summary = excel_get_smart_contracts("session")
+        self.assertIn("quorum rule (block 1): BYTECODE(", summary)
+        self.assertEqual(excel_get_smart_contracts("missing"), "No blockchain found for this session.")
+        print("test_excel_get_smart_contracts passed.")
+
+    def test_excel_dao_contract_takes_dao_lock(self):
+        """
+        Test that a contract added to a DAO's own chain waits for the DAO's lock.
+        """
+        dao = DAOCreation("TestDAO", ["Alice"])
+        daos[dao.dao_id] = dao
+        height = len(dao.blockchain.chain)
+        results = []
+        with dao_locks.lock_for(dao.dao_id):
+            worker = threading.Thread(target=lambda: results.append(excel_add_smart_contract(dao.dao_id, "Set quorum to 50% +1")))
+            worker.start()
+            worker.join(0.1)
+            self.assertEqual(len(dao.blockchain.chain), height)
+        worker.join()
+        self.assertEqual(len(dao.blockchain.chain), height + 1)
+        self.assertIsNotNone(dao.blockchain.contract_registry.active_rule("quorum"))
+        print("test_excel_dao_contract_takes_dao_lock passed.")
+
+if __name__ == "__main__":
+    unittest.main()
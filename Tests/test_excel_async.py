@@ -0,0 +1,113 @@
+import time
+import asyncio
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+import Frontend.Input.excel_async as excel_async
+from Backend.Features.dao_creation import DAOCreation
+from Frontend.Input.excel_creation import daos, excel_set_dao_name, excel_set_num_founders, excel_add_founder, \
+    excel_set_token_and_supply
+from Frontend.Input.excel_transactions import excel_wallets
+from Frontend.Input.excel_smart_contracts import excel_blockchains
+
+class TestExcelAsync(unittest.TestCase):
+    """
+    Unit tests for the async Excel functions, run on a plain asyncio loop instead of Excel's.
+    """
+
+    def setUp(self):
+        self.dao = DAOCreation("TestDAO", ["Mihail", "Ben"], token_name="REVO", initial_supply=1000)
+        daos[self.dao.dao_id] = self.dao
+
+    def tearDown(self):
+        daos.clear()
+        excel_wallets.clear()
+        excel_blockchains.clear()
+
+    def test_transactions_resolve_off_the_calling_thread(self):
+        """
+        Test that concurrent async transactions on one DAO all execute, in their own blocks.
+        """
+        dao_id = self.dao.dao_id
+
+        async def run():
+            return await asyncio.gather(*[
+                excel_async.excel_token_sale_async(dao_id, f"Buyer{i}", 10, 1.0) for i in range(10)
+            ])
+
+        chain_length = len(self.dao.blockchain.chain)
+        results = asyncio.run(run())
+        self.assertTrue(all("executed and recorded" in result for result in results))
+        self.assertEqual(len(self.dao.blockchain.chain), chain_length + 10)
+        print("test_transactions_resolve_off_the_calling_thread passed.")
+
+    def test_transactions_keyed_on_calling_cell(self):
+        """
+        Test that identical async calls from different cells both execute, since the calling cell
+        is read before the call leaves Excel's thread.
+        """
+        dao_id = self.dao.dao_id
+        calling_thread = threading.current_thread()
+        cells = iter(["Sheet1!A1", "Sheet1!A2"])
+
+        def caller():
+            if threading.current_thread() is not calling_thread:
+                raise RuntimeError("xlfCaller is only available on Excel's thread")
+            return SimpleNamespace(address=next(cells))
+
+        async def run():
+            return await asyncio.gather(*[excel_async.excel_token_sale_async(dao_id, "Alice", 10, 1.0) for _ in range(2)])
+
+        with patch("Frontend.Input.excel_transactions.xlfCaller", side_effect=caller):
+            results = asyncio.run(run())
+        self.assertTrue(all("executed and recorded" in result for result in results))
+        self.assertEqual(self.dao.wallets["Alice"], 20)
+        print("test_transactions_keyed_on_calling_cell passed.")
+
+    def test_finalize_dao_and_add_contract(self):
+        """
+        Test the async DAO finalization and smart contract functions.
+        """
+        excel_set_dao_name("session", "AsyncDAO")
+        excel_set_num_founders("session", 1)
+        excel_add_founder("session", "Alice")
+        excel_set_token_and_supply("session", "ASY", 100)
+
+        async def run():
+            dao_id = await excel_async.excel_finalize_dao_async("session")
+            contract = await excel_async.excel_add_smart_contract_async(dao_id, "Set voting time to maximum 24 hours")
+            return dao_id, contract
+
+        dao_id, contract = asyncio.run(run())
+        self.assertIn(dao_id, daos)
+        self.assertIn("added", contract.lower())
+        print("test_finalize_dao_and_add_contract passed.")
+
+    def test_concurrency_is_capped(self):
+        """
+        Test that no more than MAX_CONCURRENT_CALLS calls run at once.
+        """
+        running = []
+        peak = []
+        guard = threading.Lock()
+
+        def slow():
+            with guard:
+                running.append(1)
+                peak.append(len(running))
+            time.sleep(0.02)
+            with guard:
+                running.pop()
+
+        async def run():
+            await asyncio.gather(*[excel_async._offload(f"key{i}", slow) for i in range(8)])
+
+        with patch.object(excel_async, "MAX_CONCURRENT_CALLS", 2):
+            asyncio.run(run())
+        self.assertEqual(len(peak), 8)
+        self.assertLessEqual(max(peak), 2)
+        print("test_concurrency_is_capped passed.")
+
+if __name__ == "__main__":
+    unittest.main()
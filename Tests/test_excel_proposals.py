@@ -5,6 +5,7 @@
     excel_create_proposal,
     excel_cast_vote,
     excel_check_proposal_result,
+    excel_batch_cast_votes,
     excel_proposals
 )
 from Frontend.Input.excel_creation import daos
@@ -79,6 +80,18 @@ def test_excel_check_proposal_result_proposal_not_found(self):
         self.assertIn("Proposal not found", result)
         print("test_excel_check_proposal_result_proposal_not_found passed.")
 
+    def test_excel_batch_cast_votes(self):
+        """
+        Test casting a range of votes in one call.
+        """
+        excel_create_proposal(self.dao_id, "Increase Supply", "We want more tokens", "Mihail")
+        rows = [["Increase Supply", "Mihail", "yes"], ["Increase Supply", "Ben", "yes"],
+                [None, None, None], ["Unknown", "Moritz", "no"]]
+        results = excel_batch_cast_votes(self.dao_id, rows)
+        self.assertEqual(results, [["Mihail voted yes"], ["Ben voted yes"], [""], ["Proposal not found."]])
+        self.assertIn("Proposal passed", excel_check_proposal_result(self.dao_id, "Increase Supply"))
+        print("test_excel_batch_cast_votes passed.")
+
     def test_excel_create_proposal_dao_not_found(self):
         """
         Test the scenario where the DAO for the proposal does not exist.
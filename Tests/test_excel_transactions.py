@@ -1,4 +1,6 @@
+import threading
 import unittest
+from Backend.Features.concurrency import dao_locks
 from Backend.Features.dao_creation import DAOCreation
 from Frontend.Input.excel_transactions import (
     excel_token_sale,
@@ -6,6 +8,9 @@
     excel_fund_distribution,
     excel_investment,
     excel_get_blockchain_info,
+    excel_batch_token_sales,
+    excel_batch_treasury_contributions,
+    excel_batch_fund_distributions,
     excel_wallets
 )
 from Frontend.Input.excel_creation import daos
@@ -55,6 +60,7 @@ def test_excel_fund_distribution(self):
         """
         Test executing a fund distribution transaction.
         """
+        excel_treasury_contribution(self.dao_id, "Mihail", 200)  # Fund the treasury
         result = excel_fund_distribution(self.dao_id, "Bob", 75, "Grant for project")
         self.assertIn("executed and recorded on blockchain", result)
         self.assertEqual(self.dao.wallets["Bob"], 75)
@@ -64,6 +70,7 @@ def test_excel_investment(self):
         """
         Test executing an investment transaction.
         """
+        excel_treasury_contribution(self.dao_id, "Mihail", 200)  # Fund the treasury
         result = excel_investment(self.dao_id, "CoolProject", 120)
         self.assertIn("executed and recorded on blockchain", result)
         print("test_excel_investment passed.")
@@ -85,5 +92,61 @@ def test_excel_token_sale_dao_not_found(self):
         self.assertIn("DAO not found", result)
         print("test_excel_token_sale_dao_not_found passed.")
 
+    def test_transactions_take_the_dao_lock(self):
+        """
+        Test that single and batch calls wait for the DAO's lock and can run while the caller holds it.
+        """
+        lock = dao_locks.lock_for(self.dao_id)
+        results = []
+        lock.acquire()
+        try:
+            workers = [threading.Thread(target=lambda: results.append(excel_token_sale(self.dao_id, "Alice", 10, 1.0, "k1"))),
+                       threading.Thread(target=lambda: results.append(excel_batch_token_sales(self.dao_id, [["Bob", 5, 1.0]])))]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join(0.1)
+            self.assertEqual(results, [])  # Both wait for the lock
+            self.assertIn("executed and recorded", excel_token_sale(self.dao_id, "Carol", 1, 1.0, "k2"))  # Reentrant
+        finally:
+            lock.release()
+        for worker in workers:
+            worker.join()
+        self.assertEqual((self.dao.wallets["Alice"], self.dao.wallets["Bob"]), (10, 5))
+        print("test_transactions_take_the_dao_lock passed.")
+
+    def test_excel_batch_token_sales(self):
+        """
+        Test that a range of token sales is executed in one block with one result per row.
+        """
+        chain_length = len(self.dao.blockchain.chain)
+        rows = [["Alice", 100.0, 1.5, None], [None, None, None, None], ["Bob", 50.0, 2.0, None], ["Carol", -1.0, 1.0, None]]
+        results = excel_batch_token_sales(self.dao_id, rows)
+        self.assertEqual(len(results), 4)
+        self.assertIn("executed and recorded", results[0][0])
+        self.assertEqual(results[1][0], "")
+        self.assertIn("executed and recorded", results[2][0])
+        self.assertIn("rejected", results[3][0])
+        self.assertEqual(len(self.dao.blockchain.chain), chain_length + 1)
+        self.assertEqual(self.dao.wallets["Alice"], 100)
+        # Recalculating the same range replays the results instead of selling again
+        self.assertEqual(excel_batch_token_sales(self.dao_id, rows), results)
+        self.assertEqual(self.dao.wallets["Alice"], 100)
+        print("test_excel_batch_token_sales passed.")
+
+    def test_excel_batch_contribution_funds_distribution(self):
+        """
+        Test batched contributions and distributions, including invalid rows.
+        """
+        excel_batch_treasury_contributions(self.dao_id, [["Mihail", 300.0], ["Ben", 200.0]])
+        self.assertEqual(self.dao.ledger.treasury_balance, 500)
+        results = excel_batch_fund_distributions(self.dao_id, [["Alice", 400.0, "Grant"], ["Bob", "abc", "Grant"],
+                                                               ["Carol", 400.0, "Grant"]])
+        self.assertIn("executed and recorded", results[0][0])
+        self.assertIn("Invalid row", results[1][0])
+        self.assertIn("Insufficient balance", results[2][0])
+        self.assertEqual(excel_batch_token_sales("fake_dao_id", [["Alice", 1.0, 1.0]]), [["DAO not found."]])
+        print("test_excel_batch_contribution_funds_distribution passed.")
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
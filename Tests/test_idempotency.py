@@ -0,0 +1,141 @@
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+from Backend.Features.dao_creation import DAOCreation
+from Backend.Database.blockchain import MultiSigWallet
+from Backend.Features.idempotency import IdempotencyIndex, MISSING
+from Backend.Features.transaction_engine import TransactionEngine
+from Backend.Features.transactions import TokenSaleTransaction, FundDistributionTransaction
+from Frontend.Input.excel_transactions import excel_token_sale, excel_wallets
+from Frontend.Input.excel_creation import daos
+
+class FakeClock:
+    """
+    A controllable clock for testing time-based eviction.
+    """
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+class TestIdempotency(unittest.TestCase):
+    """
+    Unit tests for idempotency keys and replay deduplication.
+    """
+
+    def setUp(self):
+        """
+        Set up a DAO and multisig wallet for testing.
+        """
+        founders = ["Mihail", "Ben", "Moritz"]
+        self.dao = DAOCreation("TestDAO", founders, token_name="REVO", initial_supply=900)
+        self.wallet = MultiSigWallet(owners=founders, required_signatures=3)
+
+    def tearDown(self):
+        """
+        Clear the global `daos` and `excel_wallets` dictionaries after each test.
+        """
+        daos.clear()
+        excel_wallets.clear()
+
+    def test_index_time_eviction(self):
+        """
+        Test that keys expire after the TTL.
+        """
+        clock = FakeClock()
+        index = IdempotencyIndex(ttl_seconds=60, clock=clock)
+        index.remember("a", "done")
+        clock.now += 59
+        self.assertEqual(index.lookup("a"), "done")
+        clock.now += 2
+        self.assertIs(index.lookup("a"), MISSING)
+        self.assertEqual(len(index), 0)
+        self.assertEqual((index.hits, index.misses), (1, 1))
+        print("test_index_time_eviction passed.")
+
+    def test_index_size_bound(self):
+        """
+        Test that the oldest keys are evicted beyond the size limit.
+        """
+        index = IdempotencyIndex(max_entries=3, clock=FakeClock())
+        for key in "abcd":
+            index.remember(key, key.upper())
+        self.assertEqual(len(index), 3)
+        self.assertIs(index.lookup("a"), MISSING)
+        self.assertEqual(index.lookup("d"), "D")
+        print("test_index_size_bound passed.")
+
+    def test_transaction_replay(self):
+        """
+        Test that replaying an idempotency key returns the original result without a new block.
+        """
+        first = TokenSaleTransaction(self.dao, "Alice", 100, 1.5, self.wallet, idempotency_key="sale-1").execute()
+        chain_len = len(self.dao.blockchain.chain)
+        replay = TokenSaleTransaction(self.dao, "Alice", 100, 1.5, self.wallet, idempotency_key="sale-1").execute()
+        self.assertEqual(replay, first)
+        self.assertEqual(self.dao.wallets["Alice"], 100)
+        self.assertEqual(len(self.dao.blockchain.chain), chain_len)
+        self.assertEqual(self.dao.blockchain.chain[-1].transactions[0]["idempotency_key"], "sale-1")
+        print("test_transaction_replay passed.")
+
+    def test_rejected_transactions_can_be_retried(self):
+        """
+        Test that only executed transactions are remembered.
+        """
+        tx = FundDistributionTransaction(self.dao, "Bob", 10, "Grant", self.wallet, idempotency_key="grant-1")
+        self.assertIn("rejected", tx.execute())
+        self.dao.ledger.post("treasury_contribution", [("Mihail", "__treasury__", 10)])
+        self.assertIn("executed", tx.execute())
+        print("test_rejected_transactions_can_be_retried passed.")
+
+    def test_engine_deduplicates(self):
+        """
+        Test that the engine skips keys already executed or repeated within the batch.
+        """
+        engine = TransactionEngine(self.dao, self.wallet)
+        engine.execute_batch([TokenSaleTransaction(self.dao, "Alice", 5, 1.0, self.wallet, idempotency_key="k1")])
+        results = engine.execute_batch([
+            TokenSaleTransaction(self.dao, "Alice", 5, 1.0, self.wallet, idempotency_key="k1"),
+            TokenSaleTransaction(self.dao, "Carol", 7, 1.0, self.wallet, idempotency_key="k2"),
+            TokenSaleTransaction(self.dao, "Carol", 7, 1.0, self.wallet, idempotency_key="k2"),
+        ])
+        self.assertTrue(all("executed" in r for r in results))
+        self.assertEqual(self.dao.wallets["Alice"], 5)
+        self.assertEqual(self.dao.wallets["Carol"], 7)
+        self.assertEqual(len(self.dao.blockchain.chain[-1].transactions), 2)  # contract + one sale
+        print("test_engine_deduplicates passed.")
+
+    def test_excel_recalculation_replay(self):
+        """
+        Test that Excel re-firing the same call does not create a second transaction.
+        """
+        daos[self.dao.dao_id] = self.dao
+        excel_token_sale(self.dao.dao_id, "Alice", 100, 1.5)
+        chain_len = len(self.dao.blockchain.chain)
+        excel_token_sale(self.dao.dao_id, "Alice", 100, 1.5)
+        self.assertEqual(self.dao.wallets["Alice"], 100)
+        self.assertEqual(len(self.dao.blockchain.chain), chain_len)
+        excel_token_sale(self.dao.dao_id, "Alice", 100, 1.5, "second-sale")
+        self.assertEqual(self.dao.wallets["Alice"], 200)
+        print("test_excel_recalculation_replay passed.")
+
+    def test_excel_calls_keyed_on_calling_cell(self):
+        """
+        Test that the same call from another cell is a new transaction and a replay is reported as one.
+        """
+        daos[self.dao.dao_id] = self.dao
+        with mock.patch("Frontend.Input.excel_transactions.xlfCaller", return_value=SimpleNamespace(address="Sheet1!$A$1")):
+            first = excel_token_sale(self.dao.dao_id, "Alice", 100, 1.5)
+            replay = excel_token_sale(self.dao.dao_id, "Alice", 100, 1.5)
+        with mock.patch("Frontend.Input.excel_transactions.xlfCaller", return_value=SimpleNamespace(address="Sheet1!$A$2")):
+            other_cell = excel_token_sale(self.dao.dao_id, "Alice", 100, 1.5)
+        self.assertIn("executed and recorded", first)
+        self.assertTrue(replay.startswith("Already executed"))
+        self.assertIn("executed and recorded", other_cell)
+        self.assertEqual(self.dao.wallets["Alice"], 200)
+        print("test_excel_calls_keyed_on_calling_cell passed.")
+
+if __name__ == "__main__":
+    unittest.main()
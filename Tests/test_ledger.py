@@ -0,0 +1,86 @@
+import unittest
+from Backend.Features.dao_creation import DAOCreation
+from Backend.Database.blockchain import MultiSigWallet
+from Backend.Features.ledger import (
+    TreasuryLedger, InsufficientBalanceError, TREASURY_ACCOUNT, ISSUANCE_ACCOUNT
+)
+from Backend.Features.replay import replay
+from Backend.Features.transactions import (
+    TokenSaleTransaction,
+    TreasuryContributionTransaction,
+    FundDistributionTransaction,
+    InvestmentTransaction
+)
+
+class TestTreasuryLedger(unittest.TestCase):
+    """
+    Unit tests for the double-entry treasury ledger.
+    """
+
+    def setUp(self):
+        """
+        Set up a DAO and multisig wallet for testing.
+        """
+        founders = ["Mihail", "Ben", "Moritz"]
+        self.dao = DAOCreation("TestDAO", founders, token_name="REVO", initial_supply=900)
+        self.wallet = MultiSigWallet(owners=founders, required_signatures=3)
+
+    def test_running_aggregates(self):
+        """
+        Test that reports reflect every transaction type without replaying the chain.
+        """
+        TokenSaleTransaction(self.dao, "Alice", 100, 2.0, self.wallet).execute()
+        TreasuryContributionTransaction(self.dao, "Mihail", 200, self.wallet).execute()
+        FundDistributionTransaction(self.dao, "Bob", 50, "Grant", self.wallet).execute()
+        InvestmentTransaction(self.dao, "CoolProject", 30, self.wallet).execute()
+        report = self.dao.ledger.report()
+        self.assertEqual(report["total_supply"], 1000)
+        self.assertEqual(report["treasury_balance"], 120)
+        self.assertEqual(report["invested"], 30)
+        self.assertEqual(report["circulating_supply"], 850)
+        self.assertEqual(report["inflow"], {"treasury_contribution": 200})
+        self.assertEqual(report["outflow"], {"fund_distribution": 50, "investment": 30})
+        self.assertEqual(report["sale_proceeds"], 200.0)
+        self.assertTrue(report["solvent"])
+        self.assertEqual(sum(self.dao.wallets.values()) + report["treasury_balance"] + report["invested"],
+                         report["total_supply"])
+        print("test_running_aggregates passed.")
+
+    def test_adding_holder_keeps_balance(self):
+        """
+        Test that adding a member who already holds tokens keeps their wallet, live and replayed.
+        """
+        TokenSaleTransaction(self.dao, "Alice", 100, 2.0, self.wallet).execute()
+        self.dao.add_member("Alice")
+        self.assertEqual(self.dao.wallets["Alice"], 100)
+        self.assertEqual(sum(self.dao.wallets.values()), self.dao.ledger.total_supply)
+        rebuilt = replay(self.dao.blockchain)
+        self.assertEqual(rebuilt.wallets, self.dao.wallets)
+        self.assertEqual(rebuilt.ledger.report(), self.dao.ledger.report())
+        print("test_adding_holder_keeps_balance passed.")
+
+    def test_postings_are_atomic(self):
+        """
+        Test that a multi-leg posting is rejected as a whole when one leg overdraws.
+        """
+        ledger = TreasuryLedger({"a": 10, "b": 0})
+        with self.assertRaises(InsufficientBalanceError):
+            ledger.post("transfer", [("a", TREASURY_ACCOUNT, 5), ("b", TREASURY_ACCOUNT, 1)])
+        self.assertEqual(ledger.balance("a"), 10)
+        self.assertEqual(ledger.balance(TREASURY_ACCOUNT), 0)
+        ledger.post("transfer", [("a", "b", 4), ("b", TREASURY_ACCOUNT, 3)])
+        self.assertEqual((ledger.balance("a"), ledger.balance("b"), ledger.balance(TREASURY_ACCOUNT)), (6, 1, 3))
+        print("test_postings_are_atomic passed.")
+
+    def test_issuance_is_unbounded(self):
+        """
+        Test that minting never fails and increases the total supply.
+        """
+        ledger = TreasuryLedger({})
+        ledger.post("token_sale", [(ISSUANCE_ACCOUNT, "a", 5)])
+        self.assertEqual(ledger.total_supply, 5)
+        self.assertEqual(ledger.balance(ISSUANCE_ACCOUNT), -5)
+        print("test_issuance_is_unbounded passed.")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+import threading
+import unittest
+from Backend.Database.blockchain import MultiSigWallet
+from Backend.Features.dao_creation import DAOCreation
+from Backend.Features.concurrency import dao_locks
+from Backend.memory import SUBSYSTEMS, AllocationTracker, allocations, deep_sizeof, dao_memory, memory_report
+from Frontend.Input.excel_creation import daos
+from Frontend.Input.excel_transactions import (
+    excel_wallets, excel_token_sale, excel_get_memory_report, excel_get_allocation_report
+)
+
+class TestMemoryAccounting(unittest.TestCase):
+    """
+    Unit tests for the per-DAO memory accounting and the allocation tracker.
+    """
+
+    def setUp(self):
+        self.dao = DAOCreation("TestDAO", ["Alice", "Bob"], "TT", 1000)
+        self.wallet = MultiSigWallet(["Alice", "Bob"], required_signatures=2)
+
+    def tearDown(self):
+        daos.clear()
+        excel_wallets.clear()
+
+    def test_deep_sizeof_counts_shared_objects_once(self):
+        """
+        Test that an object referenced twice is counted once.
+        """
+        shared = "x" * 10000
+        self.assertLess(deep_sizeof([shared, shared]), deep_sizeof(shared) + 1000)
+        seen = set()
+        deep_sizeof(shared, seen)
+        self.assertLess(deep_sizeof([shared], seen), 1000)
+        print("test_deep_sizeof_counts_shared_objects_once passed.")
+
+    def test_subsystems_grow_with_their_state(self):
+        """
+        Test that proposals, blocks and pending multisig entries are charged to their subsystems.
+        """
+        before = dao_memory(self.dao, self.wallet)
+        self.assertEqual(set(before), set(SUBSYSTEMS) | {"total"})
+        self.assertGreater(before["contracts"], 0)
+        self.dao.create_proposal("Grow", "Grow the treasury " * 100, "Alice")
+        self.wallet.propose_transaction({"type": "note", "memo": "m" * 5000})
+        after = dao_memory(self.dao, self.wallet)
+        self.assertGreater(after["proposals"], before["proposals"] + 1800)
+        self.assertGreater(after["multisig"], before["multisig"] + 5000)
+        self.assertGreater(after["contracts"], before["contracts"])  # create_proposal records a contract block
+        self.assertGreater(after["chain"], before["chain"])
+        self.assertGreaterEqual(after["total"], sum(after[name] for name in SUBSYSTEMS))
+        print("test_subsystems_grow_with_their_state passed.")
+
+    def test_report_largest_first(self):
+        """
+        Test that the report lists the largest DAO first, also through the Excel function.
+        """
+        small = DAOCreation("SmallDAO", ["Carol"], "SM", 10)
+        for i in range(20):
+            self.dao.add_member(f"member{i}")
+        report = memory_report({small.dao_id: small, self.dao.dao_id: self.dao}, {self.dao.dao_id: self.wallet})
+        self.assertEqual([row["name"] for row in report], ["TestDAO", "SmallDAO"])
+        self.assertEqual(report[1]["multisig"], 0)
+
+        daos[self.dao.dao_id] = self.dao
+        daos[small.dao_id] = small
+        excel_token_sale(self.dao.dao_id, "Dave", 10, 1.0)
+        rows = excel_get_memory_report()
+        self.assertEqual(rows[0], ["dao_id", "name", "total", *SUBSYSTEMS])
+        self.assertEqual([row[1] for row in rows[1:]], ["TestDAO", "SmallDAO"])
+        print("test_report_largest_first passed.")
+
+    def test_excel_report_waits_for_dao_lock(self):
+        """
+        Test that the Excel memory report measures a DAO only while holding its lock.
+        """
+        daos[self.dao.dao_id] = self.dao
+        rows = []
+        lock = dao_locks.lock_for(self.dao.dao_id)
+        with lock:
+            worker = threading.Thread(target=lambda: rows.extend(excel_get_memory_report()))
+            worker.start()
+            worker.join(0.1)
+            self.assertEqual(rows, [])
+        worker.join()
+        self.assertEqual(rows[1][1], "TestDAO")
+        print("test_excel_report_waits_for_dao_lock passed.")
+
+    def test_excel_allocation_report(self):
+        """
+        Test that the Excel allocation report samples the process-wide tracker once it runs.
+        """
+        self.assertIn("not running", excel_get_allocation_report()[0][0])
+        allocations.start()
+        try:
+            for i in range(200):
+                self.dao.add_member(f"member{i}")
+            rows = excel_get_allocation_report(5)
+        finally:
+            allocations.stop()
+        self.assertEqual(rows[0], ["site", "size_diff", "count_diff", "size", "count"])
+        self.assertTrue(1 < len(rows) <= 6)
+        self.assertTrue(all(row[0].startswith(("Backend", "Frontend")) for row in rows[1:]))
+        print("test_excel_allocation_report passed.")
+
+    def test_allocation_growth_is_attributed_to_backend_sites(self):
+        """
+        Test that the tracker charges allocation growth to backend source lines.
+        """
+        tracker = AllocationTracker(frames=10)
+        tracker.start()
+        try:
+            for i in range(200):
+                self.dao.add_member(f"member{i}")
+            growth = tracker.sample()
+        finally:
+            tracker.stop()
+        self.assertTrue(growth)
+        self.assertTrue(all(row["site"].startswith(("Backend", "Frontend")) for row in growth))
+        self.assertTrue(any(row["site"].startswith("Backend") and row["size_diff"] > 0 for row in growth))
+        self.assertEqual(len(tracker.history), 2)
+        self.assertFalse(tracker.running)
+        print("test_allocation_growth_is_attributed_to_backend_sites passed.")
+
+if __name__ == "__main__":
+    unittest.main()
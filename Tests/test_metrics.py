@@ -0,0 +1,119 @@
+import os
+import json
+import shutil
+import tempfile
+import unittest
+from Backend.Database.blockchain import MultiSigWallet
+from Backend.Features.dao_creation import DAOCreation
+from Backend.Features.transaction_engine import TransactionEngine
+from Backend.Features.transactions import TokenSaleTransaction, FundDistributionTransaction
+from Backend.metrics import (
+    metrics, MetricsRegistry, TRANSACTIONS, TRANSACTION_SECONDS, BLOCKS_ADDED, MULTISIG_PENDING, CHAIN_LENGTH
+)
+
+class TestMetricsRegistry(unittest.TestCase):
+    """
+    Unit tests for counters, gauges, histograms and their exports.
+    """
+
+    def setUp(self):
+        self.registry = MetricsRegistry(enabled=True)
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_prometheus_export(self):
+        """
+        Test the Prometheus text format of each metric kind.
+        """
+        self.registry.counter("requests_total", "Requests.").inc(2, route="a")
+        self.registry.gauge("queue", "Queue length.").set(5)
+        latency = self.registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+        latency.observe(0.05)
+        latency.observe(0.5)
+        latency.observe(5)
+        text = self.registry.to_prometheus()
+        self.assertIn("# TYPE dao_suite_requests_total counter", text)
+        self.assertIn('dao_suite_requests_total{route="a"} 2', text)
+        self.assertIn("dao_suite_queue 5", text)
+        self.assertIn('dao_suite_latency_seconds_bucket{le="0.1"} 1', text)
+        self.assertIn('dao_suite_latency_seconds_bucket{le="1.0"} 2', text)
+        self.assertIn('dao_suite_latency_seconds_bucket{le="+Inf"} 3', text)
+        self.assertIn("dao_suite_latency_seconds_count 3", text)
+        print("test_prometheus_export passed.")
+
+    def test_json_file_export(self):
+        """
+        Test writing the metrics to a JSON file.
+        """
+        self.registry.counter("requests_total", "Requests.").inc()
+        path = os.path.join(self.directory, "metrics.json")
+        self.registry.write(path)
+        with open(path) as f:
+            data = json.load(f)
+        self.assertEqual(data["dao_suite_requests_total"]["samples"], [{"labels": {}, "value": 1}])
+        with self.assertRaises(ValueError):
+            self.registry.gauge("requests_total", "Clash.")
+        print("test_json_file_export passed.")
+
+class TestInstrumentation(unittest.TestCase):
+    """
+    Unit tests for the metrics recorded by the backend hot paths.
+    """
+
+    def setUp(self):
+        metrics.reset()
+        metrics.enable()
+
+    def tearDown(self):
+        metrics.disable()
+        metrics.reset()
+
+    def test_transaction_metrics(self):
+        """
+        Test that a transaction records its outcome, blocks, multisig and DAO gauges.
+        """
+        dao = DAOCreation("TestDAO", ["Alice", "Bob"], "TT", 1000)
+        wallet = MultiSigWallet(["Alice", "Bob"], required_signatures=2)
+        TokenSaleTransaction(dao, "Carol", 10, 1.0, wallet, "sale-1").execute()
+        TokenSaleTransaction(dao, "Carol", 10, 1.0, wallet, "sale-1").execute()
+        TokenSaleTransaction(dao, "Carol", -1, 1.0, wallet).execute()
+        outcomes = {labels["outcome"]: value for labels, value in TRANSACTIONS.samples()}
+        self.assertEqual(outcomes, {"executed": 1, "replayed": 1, "rejected": 1})
+        self.assertEqual(BLOCKS_ADDED.samples(), [({}, 2)])  # DAO creation and the sale
+        self.assertEqual(MULTISIG_PENDING.samples(), [({}, 0)])
+        self.assertIn(({"dao": dao.dao_id}, len(dao.blockchain.chain)), CHAIN_LENGTH.samples())
+        print("test_transaction_metrics passed.")
+
+    def test_batch_metrics(self):
+        """
+        Test that a batch records each transaction's outcome and timing by type, and the DAO gauges.
+        """
+        dao = DAOCreation("TestDAO", ["Alice", "Bob"], "TT", 1000)
+        wallet = MultiSigWallet(["Alice", "Bob"], required_signatures=2)
+        TransactionEngine(dao, wallet).execute_batch([
+            TokenSaleTransaction(dao, "Carol", 10, 1.0, wallet, "sale-1"),
+            TokenSaleTransaction(dao, "Carol", 10, 1.0, wallet, "sale-1"),
+            TokenSaleTransaction(dao, "Dave", 5, 1.0, wallet),
+            FundDistributionTransaction(dao, "Erin", 1, "Grant", wallet),
+        ])
+        counts = {(labels["type"], labels["outcome"]): value for labels, value in TRANSACTIONS.samples()}
+        self.assertEqual(counts, {("token_sale", "executed"): 2, ("token_sale", "replayed"): 1,
+                                  ("fund_distribution", "rejected"): 1})
+        timings = {labels["type"]: value["count"] for labels, value in TRANSACTION_SECONDS.samples()}
+        self.assertEqual(timings, {"token_sale": 2})
+        self.assertIn(({"dao": dao.dao_id}, len(dao.blockchain.chain)), CHAIN_LENGTH.samples())
+        print("test_batch_metrics passed.")
+
+    def test_disabled_records_nothing(self):
+        """
+        Test that nothing is recorded while metrics are disabled.
+        """
+        metrics.disable()
+        DAOCreation("TestDAO", ["Alice"], "TT", 1000)
+        self.assertEqual(BLOCKS_ADDED.samples(), [])
+        print("test_disabled_records_nothing passed.")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 import unittest
 import time
 from Backend.Features.dao_creation import DAOCreation
+from Backend.Features.smart_contracts import process_user_input_and_add_contract
 from Backend.Features.proposals import (
     Proposal, draft_proposal_step_by_step, parse_proposal_keywords,
     validate_proposal, start_voting, cast_vote, check_voting_result
@@ -130,5 +131,26 @@ def test_voting_time_expired(self):
         self.assertEqual(len(self.dao.blockchain.chain), prev_chain_len)
         print("test_voting_time_expired passed.")
 
+    def test_recorded_rule_contracts_decide(self):
+        """
+        Test that rule contracts recorded on the DAO's chain override governance_rules.
+        """
+        proposal = Proposal("Increase Supply", "We want more tokens", "Mihail", self.dao)
+        start_voting(proposal)
+        cast_vote(proposal, "Mihail", "yes")
+        cast_vote(proposal, "Ben", "yes")
+        process_user_input_and_add_contract("Set quorum to 100%", self.dao.blockchain)  # All 3 members
+        self.assertEqual(check_voting_result(proposal, self.dao), "Quorum not met.")
+        cast_vote(proposal, "Moritz", "yes")
+        process_user_input_and_add_contract("Set voting time to 10 minutes", self.dao.blockchain)
+        proposal.created_at -= 1200  # Within the 1 hour rule, past the 10 minute contract
+        self.assertEqual(check_voting_result(proposal, self.dao), "Voting time expired.")
+
+        process_user_input_and_add_contract("Set proposal cost to 50", self.dao.blockchain)
+        valid, msg = validate_proposal(Proposal("Spend", "Spend tokens", "Mihail", self.dao), self.dao)
+        self.assertFalse(valid)  # Mihail holds 33 tokens
+        self.assertIn("Insufficient tokens", msg)
+        print("test_recorded_rule_contracts_decide passed.")
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,144 @@
+import os
+import shutil
+import tempfile
+import unittest
+from Backend.Features.dao_creation import DAOCreation
+from Backend.Features.proposals import Proposal
+from Frontend.Input.registry import RegistryDatabase
+from Frontend.Input.excel_proposals import _dump_proposal, _load_proposal
+from Frontend.Input.excel_creation import daos
+
+class TestPersistentRegistry(unittest.TestCase):
+    """
+    Unit tests for the SQLite-backed registry with its write-behind LRU cache.
+    """
+
+    def setUp(self):
+        """
+        Set up a registry in a temporary database file.
+        """
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "registry.sqlite3")
+        self.database = RegistryDatabase(self.path)
+        self.registry = self.database.registry("daos", cache_size=2, batch_size=100, flush_interval=3600)
+
+    def tearDown(self):
+        """
+        Close the database and remove the temporary directory.
+        """
+        self.database.connection.close()
+        shutil.rmtree(self.directory)
+
+    def reopen(self):
+        """
+        Flush, close and reopen the database as a new process would.
+        """
+        self.database.flush_all()
+        self.database.connection.close()
+        self.database = RegistryDatabase(self.path)
+        return self.database.registry("daos", cache_size=2)
+
+    def test_objects_survive_restart(self):
+        """
+        Test that stored DAOs, including in-place changes, are loaded lazily after a restart.
+        """
+        dao = DAOCreation("TestDAO", ["Alice", "Bob"], "TT", 1000)
+        self.registry[dao.dao_id] = dao
+        self.registry[dao.dao_id].wallets["Alice"] = 42
+        registry = self.reopen()
+        self.assertEqual(registry.stats()["cached"], 0)
+        loaded = registry[dao.dao_id]
+        self.assertEqual(loaded.wallets["Alice"], 42)
+        self.assertIs(loaded.ledger.member_balances, loaded.wallets)
+        self.assertEqual(len(loaded.blockchain.chain), len(dao.blockchain.chain))
+        print("test_objects_survive_restart passed.")
+
+    def test_lru_eviction_writes_back(self):
+        """
+        Test that only the most recently used objects stay cached and evicted ones are written back.
+        """
+        for key in ["a", "b", "c"]:
+            self.registry[key] = {"name": key}
+        self.assertEqual(self.registry.stats()["cached"], 2)
+        self.assertEqual(self.registry["a"], {"name": "a"})
+        self.assertEqual(self.registry.stats()["misses"], 1)
+        self.assertEqual(sorted(self.registry), ["a", "b", "c"])
+        print("test_lru_eviction_writes_back passed.")
+
+    def test_mapping_operations(self):
+        """
+        Test get, setdefault, membership, deletion and clear.
+        """
+        self.assertIsNone(self.registry.get("missing"))
+        self.assertEqual(self.registry.setdefault("a", [1]), [1])
+        self.assertEqual(self.registry.setdefault("a", [2]), [1])
+        self.assertIn("a", self.registry)
+        del self.registry["a"]
+        self.assertNotIn("a", self.registry)
+        with self.assertRaises(KeyError):
+            del self.registry["a"]
+        self.registry["b"] = 1
+        self.registry.clear()
+        self.assertEqual(len(self.registry), 0)
+        print("test_mapping_operations passed.")
+
+    def test_peek_does_not_mark_dirty(self):
+        """
+        Test that read-only access does not schedule a write-back.
+        """
+        self.registry["a"] = {"name": "a"}
+        self.registry.flush()
+        self.assertEqual(self.registry.peek("a"), {"name": "a"})
+        self.assertIsNone(self.registry.peek("missing"))
+        self.assertEqual(self.registry.stats()["dirty"], 0)
+        print("test_peek_does_not_mark_dirty passed.")
+
+    def test_evict_writes_back_and_releases(self):
+        """
+        Test that evicting an object writes its changes and drops it from memory.
+        """
+        self.registry["a"] = {"name": "a"}
+        self.registry["b"] = {"name": "b"}
+        self.assertEqual(list(self.registry.cached()), ["a", "b"])
+        self.assertTrue(self.registry.evict("a"))
+        self.assertFalse(self.registry.evict("a"))
+        self.assertEqual(list(self.registry.cached()), ["b"])
+        self.assertEqual(self.registry.stats()["dirty"], 1)
+        self.assertEqual(self.registry["a"], {"name": "a"})
+        print("test_evict_writes_back_and_releases passed.")
+
+    def test_writes_are_batched(self):
+        """
+        Test that writes are committed once the batch size is reached.
+        """
+        registry = self.database.registry("items", batch_size=3, flush_interval=3600)
+        registry["a"] = 1
+        registry["b"] = 2
+        self.assertEqual(registry.stats()["dirty"], 2)
+        registry["c"] = 3
+        self.assertEqual(registry.stats()["dirty"], 0)
+        print("test_writes_are_batched passed.")
+
+class TestProposalSerialization(unittest.TestCase):
+    """
+    Unit tests for storing proposals separately from their DAO.
+    """
+
+    def tearDown(self):
+        daos.clear()
+
+    def test_proposal_is_relinked_to_dao(self):
+        """
+        Test that a loaded proposal refers to the DAO held in the `daos` registry.
+        """
+        dao = DAOCreation("TestDAO", ["Alice", "Bob"], "TT", 1000)
+        daos[dao.dao_id] = dao
+        proposal = Proposal("Title", "Description", "Alice", dao)
+        proposal.votes["Alice"] = "yes"
+        loaded = _load_proposal(_dump_proposal(proposal))
+        self.assertIs(loaded.dao, dao)
+        self.assertEqual(loaded.votes, {"Alice": "yes"})
+        print("test_proposal_is_relinked_to_dao passed.")
+
+if __name__ == "__main__":
+    unittest.main()
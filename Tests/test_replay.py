@@ -0,0 +1,143 @@
+import os
+import shutil
+import tempfile
+import unittest
+from Backend.Database.blockchain import MultiSigWallet
+from Backend.Features.dao_creation import DAOCreation
+from Backend.Features.events import MemberAdded, VoteCast, event_from_dict
+from Backend.Features.proposals import Proposal, start_voting, cast_vote, check_voting_result
+from Backend.Features.smart_contracts import process_user_input_and_add_contract
+from Backend.Features.transaction_engine import TransactionEngine
+from Backend.Features.transactions import (
+    TokenSaleTransaction, TreasuryContributionTransaction, FundDistributionTransaction, InvestmentTransaction
+)
+from Backend.Features.snapshot import dumps, save_snapshot
+from Backend.Features.replay import (
+    ReplayError, audit_trail, block_events, replay, replay_many, state_digest
+)
+
+class TestReplay(unittest.TestCase):
+    """
+    Unit tests for typed DAO events and rebuilding DAO state from the chain.
+    """
+
+    def setUp(self):
+        self.dao = DAOCreation("TestDAO", ["Alice", "Bob"], "TT", 1000)
+        self.wallet = MultiSigWallet(["Alice", "Bob"], required_signatures=2)
+        self.dao.set_governance_rule("quorum", 2)
+        self.dao.add_member("Carol")
+        self.proposal_id = self.dao.create_proposal("Grow", "Grow the treasury", "Alice")
+        self.dao.vote_on_proposal(self.proposal_id, "Bob", "yes")
+        TreasuryContributionTransaction(self.dao, "Alice", 200, self.wallet, "contribution-1").execute()
+        TokenSaleTransaction(self.dao, "Carol", 10, 1.5, self.wallet).execute()
+        process_user_input_and_add_contract("Set quorum to 50% plus 1", self.dao.blockchain)
+
+    def extend(self, dao):
+        """
+        Adds batched transactions, a member and an enacted proposal to a DAO.
+        """
+        TransactionEngine(dao, self.wallet).execute_batch([
+            FundDistributionTransaction(dao, "Carol", 50, "Grant", self.wallet),
+            InvestmentTransaction(dao, "ProjectX", 25, self.wallet),
+        ])
+        dao.add_member("Dave")
+        dao.vote_on_proposal(self.proposal_id, "Bob", "no")
+        proposal = Proposal("Enact", "Enact it", "Alice", dao)
+        start_voting(proposal)
+        for member in ("Alice", "Bob"):
+            cast_vote(proposal, member, "yes")
+        self.assertEqual(check_voting_result(proposal, dao), "Proposal passed.")
+
+    def test_mutations_record_typed_events(self):
+        """
+        Test that each change to a DAO records a typed event next to its action description.
+        """
+        chain = self.dao.blockchain.chain
+        types = [event.event_type for block in chain for event in block_events(block)]
+        self.assertEqual(types, ["dao_created", "governance_rule_set", "member_added", "proposal_created",
+                                 "vote_cast", "transaction_executed", "transaction_executed"])
+        self.assertEqual(chain[3].transactions[0]["action"], "Added member: Carol")
+        self.assertEqual(event_from_dict(chain[3].transactions[0]["event"]), MemberAdded("Carol"))
+        self.assertEqual(event_from_dict(chain[5].transactions[0]["event"]), VoteCast(self.proposal_id, "Bob", "yes"))
+        print("test_mutations_record_typed_events passed.")
+
+    def test_replay_rebuilds_state(self):
+        """
+        Test that replaying the whole chain rebuilds the live DAO, including its idempotency keys.
+        """
+        self.extend(self.dao)
+        rebuilt = replay(self.dao.blockchain)
+        self.assertEqual(state_digest(rebuilt), state_digest(self.dao))
+        for field in ("wallets", "members", "governance_rules", "proposals"):
+            self.assertEqual(getattr(rebuilt, field), getattr(self.dao, field), field)
+        self.assertEqual(rebuilt.ledger.report(), self.dao.ledger.report())
+        self.assertIs(rebuilt.blockchain, self.dao.blockchain)
+        height = len(rebuilt.blockchain.chain)
+        result = TreasuryContributionTransaction(rebuilt, "Alice", 200, self.wallet, "contribution-1").execute()
+        self.assertIn("executed and recorded", result)
+        self.assertEqual(len(rebuilt.blockchain.chain), height)  # Deduplicated
+        print("test_replay_rebuilds_state passed.")
+
+    def test_replay_from_snapshot(self):
+        """
+        Test that replaying from a snapshot applies only the later blocks and matches a full replay.
+        """
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, "dao.snap")
+            save_snapshot(self.dao, path)
+            data = dumps(self.dao)
+            self.extend(self.dao)
+            expected = state_digest(self.dao)
+            self.assertEqual(state_digest(replay(self.dao.blockchain, path)), expected)
+            self.assertEqual(state_digest(replay(self.dao.blockchain, data)), expected)
+            other = DAOCreation("OtherDAO", ["Alice"])
+            with self.assertRaises(ReplayError):
+                replay(self.dao.blockchain, dumps(other))
+        finally:
+            shutil.rmtree(directory)
+        print("test_replay_from_snapshot passed.")
+
+    def test_replay_rejects_tampered_and_untyped_chains(self):
+        """
+        Test that replay rejects a block changed after it was recorded and a chain without a creation event.
+        """
+        self.dao.blockchain.chain[3].transactions[0]["event"]["member"] = "Mallory"
+        with self.assertRaises(ReplayError):
+            replay(self.dao.blockchain)
+        del self.dao.blockchain.chain[1].transactions[0]["event"]
+        with self.assertRaises(ReplayError):
+            replay(self.dao.blockchain, verify=False)
+        print("test_replay_rejects_tampered_and_untyped_chains passed.")
+
+    def test_replay_many(self):
+        """
+        Test that DAOs replayed in worker processes match their live state.
+        """
+        other = DAOCreation("OtherDAO", ["Erin"], "OT", 500)
+        other.add_member("Frank")
+        data = dumps(other)
+        other.set_governance_rule("quorum", 1)
+        sources = {self.dao.dao_id: self.dao.blockchain, other.dao_id: (other.blockchain, data)}
+        for workers in (1, 2):
+            rebuilt = replay_many(sources, max_workers=workers)
+            self.assertEqual(state_digest(rebuilt[self.dao.dao_id]), state_digest(self.dao))
+            self.assertEqual(state_digest(rebuilt[other.dao_id]), state_digest(other))
+            self.assertIs(rebuilt[other.dao_id].blockchain, other.blockchain)
+        print("test_replay_many passed.")
+
+    def test_audit_trail(self):
+        """
+        Test that the audit trail lists each event with its block and leaves contracts out.
+        """
+        trail = audit_trail(self.dao.blockchain, start=2)
+        self.assertEqual(trail[0]["block"], 2)
+        self.assertEqual(trail[0]["event"], {"type": "governance_rule_set", "rule_name": "quorum", "value": 2})
+        sale = trail[-1]
+        self.assertEqual(sale["event"]["transaction"]["buyer"], "Carol")
+        self.assertNotIn("solidity", sale["event"]["transaction"])
+        self.assertEqual(sale["hash"], self.dao.blockchain.chain[sale["block"]].hash)
+        print("test_audit_trail passed.")
+
+if __name__ == "__main__":
+    unittest.main()
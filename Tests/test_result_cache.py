@@ -0,0 +1,97 @@
+import unittest
+from Backend.Database import Blockchain
+from Backend.Features.dao_creation import DAOCreation
+from Frontend.Input.excel_creation import daos
+from Frontend.Input.excel_transactions import (
+    excel_get_blockchain_info, excel_get_read_cache_stats, excel_treasury_contribution, excel_wallets
+)
+from Frontend.Input.excel_smart_contracts import excel_add_smart_contract, excel_get_smart_contracts, excel_blockchains
+from Frontend.Input.result_cache import ResultCache, read_results
+
+class TestResultCache(unittest.TestCase):
+    """
+    Unit tests for the chain-version-aware result cache.
+    """
+
+    def setUp(self):
+        self.cache = ResultCache(max_entries=2)
+        self.blockchain = Blockchain()
+        self.calls = 0
+
+    def compute(self):
+        self.calls += 1
+        return f"result {self.calls}"
+
+    def test_reused_until_chain_changes(self):
+        """
+        Test that results are reused until a block is added.
+        """
+        self.assertEqual(self.cache.get_or_compute("f", "dao", self.blockchain, self.compute), "result 1")
+        self.assertEqual(self.cache.get_or_compute("f", "dao", self.blockchain, self.compute), "result 1")
+        self.blockchain.add_block([])
+        self.assertEqual(self.cache.get_or_compute("f", "dao", self.blockchain, self.compute), "result 2")
+        self.assertEqual(self.cache.stats(), {"size": 1, "hits": 1, "misses": 2})
+        print("test_reused_until_chain_changes passed.")
+
+    def test_replaced_chain_is_not_confused(self):
+        """
+        Test that a different chain under the same key at the same version is a miss.
+        """
+        self.cache.get_or_compute("f", "dao", self.blockchain, self.compute)
+        other = Blockchain()
+        other.chain[0].hash = "different genesis"
+        self.assertEqual(self.cache.get_or_compute("f", "dao", other, self.compute), "result 2")
+        print("test_replaced_chain_is_not_confused passed.")
+
+    def test_size_is_bounded(self):
+        """
+        Test that the least recently used results are evicted.
+        """
+        for key in ["a", "b", "c"]:
+            self.cache.get_or_compute("f", key, self.blockchain, self.compute)
+        self.assertEqual(self.cache.stats()["size"], 2)
+        self.cache.get_or_compute("f", "a", self.blockchain, self.compute)
+        self.assertEqual(self.calls, 4)
+        print("test_size_is_bounded passed.")
+
+class TestCachedExcelReads(unittest.TestCase):
+    """
+    Unit tests for the cached Excel read functions.
+    """
+
+    def setUp(self):
+        self.dao = DAOCreation("TestDAO", ["Mihail", "Ben"], token_name="REVO", initial_supply=1000)
+        daos[self.dao.dao_id] = self.dao
+        read_results.clear()
+
+    def tearDown(self):
+        daos.clear()
+        excel_wallets.clear()
+        excel_blockchains.clear()
+
+    def test_blockchain_info_invalidated_by_new_block(self):
+        """
+        Test that blockchain info is served from the cache until a transaction adds a block.
+        """
+        hits = read_results.hits
+        first = excel_get_blockchain_info(self.dao.dao_id)
+        self.assertEqual(excel_get_blockchain_info(self.dao.dao_id), first)
+        self.assertEqual(read_results.hits, hits + 1)
+        excel_treasury_contribution(self.dao.dao_id, "Mihail", 10)
+        self.assertNotEqual(excel_get_blockchain_info(self.dao.dao_id), first)
+        self.assertIn(["hits", str(read_results.hits)], excel_get_read_cache_stats())
+        print("test_blockchain_info_invalidated_by_new_block passed.")
+
+    def test_smart_contracts_invalidated_by_new_contract(self):
+        """
+        Test that the contract summary is recomputed after a contract is added.
+        """
+        excel_add_smart_contract("session", "Set voting time to maximum 24 hours")
+        first = excel_get_smart_contracts("session")
+        self.assertEqual(excel_get_smart_contracts("session"), first)
+        excel_add_smart_contract("session", "Set proposal cost to 10 tokens")
+        self.assertEqual(len(excel_get_smart_contracts("session").splitlines()), 2)
+        print("test_smart_contracts_invalidated_by_new_contract passed.")
+
+if __name__ == "__main__":
+    unittest.main()
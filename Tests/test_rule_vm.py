@@ -0,0 +1,85 @@
+import unittest
+import numpy as np
+from Backend.Database import Blockchain
+from Backend.Features.rule_vm import (
+    RuleProgram, RuleVM, RuleVMError, assemble_quorum, assemble_voting_time, assemble_proposal_cost
+)
+from Backend.Features.smart_contracts import compile_governance_rule, process_user_input_and_add_contract
+
+class TestRuleVM(unittest.TestCase):
+    """
+    Unit tests for the governance rule VM.
+    """
+
+    def test_quorum_program(self):
+        """
+        Test that the quorum program matches the Solidity formula.
+        """
+        vm = RuleVM(assemble_quorum(50, 1))
+        self.assertEqual(vm.call("quorum", totalMembers=10), 6)
+        self.assertTrue(vm.call("isQuorumMet", 6, totalMembers=10))
+        self.assertFalse(vm.call("isQuorumMet", 5, totalMembers=10))
+        print("test_quorum_program passed.")
+
+    def test_voting_time_and_proposal_cost_programs(self):
+        """
+        Test the voting deadline and proposal cost programs.
+        """
+        self.assertEqual(RuleVM(assemble_voting_time(3600)).call("getVotingDeadline", 1000), 4600)
+        vm = RuleVM(assemble_proposal_cost(10))
+        self.assertTrue(vm.call("canSubmitProposal", 10))
+        self.assertFalse(vm.call("canSubmitProposal", 9))
+        print("test_voting_time_and_proposal_cost_programs passed.")
+
+    def test_batch_mode(self):
+        """
+        Test evaluating a function over arrays of inputs in one call.
+        """
+        vm = RuleVM(assemble_quorum(50, 0))
+        result = vm.call_batch("isQuorumMet", [1, 2, 3, 4], totalMembers=[4, 4, 8, 8])
+        np.testing.assert_array_equal(result, [False, True, False, True])
+        deadlines = RuleVM(assemble_voting_time(60)).call_batch("getVotingDeadline", np.arange(3))
+        np.testing.assert_array_equal(deadlines, [60, 61, 62])
+        print("test_batch_mode passed.")
+
+    def test_serialization_round_trip(self):
+        """
+        Test that programs survive serialization to hex and back.
+        """
+        program = assemble_quorum(66, 2)
+        restored = RuleProgram.from_hex(program.to_hex())
+        self.assertEqual(restored.rule_type, "quorum")
+        self.assertEqual(restored.env, ("totalMembers",))
+        self.assertEqual(RuleVM(restored).call("quorum", totalMembers=100), 68)
+        with self.assertRaises(RuleVMError):
+            RuleProgram.from_bytes(b"nope")
+        print("test_serialization_round_trip passed.")
+
+    def test_errors(self):
+        """
+        Test unknown functions and missing environment values.
+        """
+        vm = RuleVM(assemble_quorum(50, 1))
+        with self.assertRaises(RuleVMError):
+            vm.call("unknown")
+        with self.assertRaises(RuleVMError):
+            vm.call("quorum")
+        print("test_errors passed.")
+
+    def test_compiled_rule_recorded_on_chain(self):
+        """
+        Test that rules added from user input carry an executable program.
+        """
+        rule_type, solidity, program = compile_governance_rule("Set voting time to 2 days")
+        self.assertEqual(rule_type, "voting_time")
+        self.assertIn("172800", solidity)
+        self.assertEqual(RuleVM(program).call("VotingTime"), 172800)
+        bc = Blockchain()
+        process_user_input_and_add_contract("Set proposal cost to 10", bc)
+        tx = bc.chain[1].transactions[0]
+        self.assertEqual(tx["rule_type"], "proposal_cost")
+        self.assertTrue(RuleVM(RuleProgram.from_hex(tx["rule_bytecode"])).call("canSubmitProposal", 25))
+        print("test_compiled_rule_recorded_on_chain passed.")
+
+if __name__ == "__main__":
+    unittest.main()
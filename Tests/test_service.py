@@ -0,0 +1,247 @@
+import json
+import asyncio
+import unittest
+from Backend.Features.concurrency import dao_locks
+from Backend.memory import allocations
+from Backend.Features.service import DAOHTTPServer, DAOService, ServiceError
+
+def request(method, path, body=None, close=False):
+    """
+    Encodes an HTTP/1.1 request.
+    """
+    data = b"" if body is None else json.dumps(body).encode()
+    head = f"{method} {path} HTTP/1.1\r\nHost: test\r\nContent-Length: {len(data)}\r\n"
+    if close:
+        head += "Connection: close\r\n"
+    return head.encode() + b"\r\n" + data
+
+async def read_response(reader):
+    """
+    Reads one response and returns its status and decoded JSON body.
+    """
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode().split("\r\n")
+    headers = dict(line.split(": ", 1) for line in lines[1:] if line)
+    body = await reader.readexactly(int(headers["Content-Length"]))
+    return int(lines[0].split(" ")[1]), json.loads(body)
+
+class TestDAOService(unittest.TestCase):
+    """
+    Unit tests for the asyncio HTTP/JSON service.
+    """
+
+    def run_with_server(self, scenario, **server_options):
+        """
+        Starts a server on a free port, runs the scenario against it and shuts it down.
+        """
+        async def run():
+            server = DAOHTTPServer(**server_options)
+            await server.start("127.0.0.1", 0)
+            port = server.server.sockets[0].getsockname()[1]
+            try:
+                return await scenario(server, port)
+            finally:
+                await server.close()
+        return asyncio.run(run())
+
+    async def call(self, port, method, path, body=None):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(request(method, path, body, close=True))
+        await writer.drain()
+        response = await read_response(reader)
+        writer.close()
+        return response
+
+    def test_pipelined_requests_answered_in_order(self):
+        """
+        Test that requests sent back to back on one connection get responses in request order.
+        """
+        async def scenario(server, port):
+            status, created = await self.call(port, "POST", "/daos", {"name": "TestDAO", "founders": ["Alice", "Bob"],
+                                                                         "initial_supply": 1000})
+            self.assertEqual(status, 201)
+            dao_id = created["dao_id"]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(request("POST", f"/daos/{dao_id}/transactions",
+                                 {"type": "treasury_contribution", "member": "Alice", "amount": 100})
+                         + request("GET", f"/daos/{dao_id}")
+                         + request("GET", "/missing")
+                         + request("GET", "/health", close=True))
+            await writer.drain()
+            responses = [await read_response(reader) for _ in range(4)]
+            writer.close()
+            return responses
+
+        responses = self.run_with_server(scenario)
+        self.assertTrue(responses[0][1]["ok"])
+        self.assertEqual(responses[1][0], 200)
+        self.assertEqual(responses[2][0], 404)
+        self.assertEqual(responses[3], (200, {"status": "ok"}))
+        print("test_pipelined_requests_answered_in_order passed.")
+
+    def test_concurrent_writes_share_blocks(self):
+        """
+        Test that concurrent transactions for one DAO are grouped into fewer blocks.
+        """
+        async def scenario(server, port):
+            _, created = await self.call(port, "POST", "/daos", {"name": "TestDAO", "founders": ["Alice"]})
+            dao_id = created["dao_id"]
+            results = await asyncio.gather(*[
+                self.call(port, "POST", f"/daos/{dao_id}/transactions",
+                          {"type": "token_sale", "member": f"Buyer{i}", "amount": 10, "token_price": 1.0})
+                for i in range(20)
+            ])
+            _, chain = await self.call(port, "GET", f"/daos/{dao_id}/chain?start=2&limit=100")
+            return results, chain, server.service.stats()
+
+        results, chain, stats = self.run_with_server(scenario)
+        self.assertTrue(all(status == 200 and body["ok"] for status, body in results))
+        self.assertEqual(stats["transactions_written"], 20)
+        self.assertEqual(len(chain["blocks"]), stats["blocks_written"])
+        self.assertLess(stats["blocks_written"], 20)
+        print("test_concurrent_writes_share_blocks passed.")
+
+    def test_proposal_vote_and_result(self):
+        """
+        Test creating a proposal, voting and checking the result over HTTP.
+        """
+        async def scenario(server, port):
+            _, created = await self.call(port, "POST", "/daos", {"name": "TestDAO", "founders": ["Alice", "Bob"]})
+            dao_id = created["dao_id"]
+            await self.call(port, "POST", f"/daos/{dao_id}/proposals", {"title": "Grow", "proposer": "Alice"})
+            await self.call(port, "POST", f"/daos/{dao_id}/proposals/Grow/votes", {"member": "Alice", "vote": "yes"})
+            await self.call(port, "POST", f"/daos/{dao_id}/proposals/Grow/votes", {"member": "Bob", "vote": "yes"})
+            return await self.call(port, "POST", f"/daos/{dao_id}/proposals/Grow/result")
+
+        status, body = self.run_with_server(scenario)
+        self.assertEqual(status, 200)
+        self.assertEqual(body["result"], "Proposal passed.")
+        print("test_proposal_vote_and_result passed.")
+
+    def test_memory_report(self):
+        """
+        Test that the memory route reports each DAO by subsystem.
+        """
+        async def scenario(server, port):
+            _, created = await self.call(port, "POST", "/daos", {"name": "TestDAO", "founders": ["Alice", "Bob"]})
+            await self.call(port, "POST", f"/daos/{created['dao_id']}/transactions",
+                            {"type": "token_sale", "buyer": "Carol", "amount": 10, "token_price": 1.0})
+            return await self.call(port, "GET", "/stats/memory")
+
+        status, body = self.run_with_server(scenario)
+        self.assertEqual(status, 200)
+        self.assertEqual(len(body["daos"]), 1)
+        self.assertGreater(body["daos"][0]["contracts"], 0)
+        self.assertGreaterEqual(body["daos"][0]["multisig"], 0)
+        print("test_memory_report passed.")
+
+    def test_allocations_route(self):
+        """
+        Test that the allocations route answers 409 until tracking runs, then samples growth by call site.
+        """
+        async def scenario(server, port):
+            stopped = await self.call(port, "GET", "/stats/allocations")
+            allocations.start()
+            try:
+                await self.call(port, "POST", "/daos", {"name": "TestDAO", "founders": ["Alice", "Bob"]})
+                sampled = await self.call(port, "GET", "/stats/allocations?limit=5")
+            finally:
+                allocations.stop()
+            return stopped, sampled
+
+        stopped, (status, body) = self.run_with_server(scenario)
+        self.assertEqual(stopped[0], 409)
+        self.assertEqual(status, 200)
+        self.assertTrue(0 < len(body["sites"]) <= 5)
+        self.assertTrue(all(row["site"].startswith(("Backend", "Frontend")) for row in body["sites"]))
+        print("test_allocations_route passed.")
+
+    def test_events_route(self):
+        """
+        Test that the events route lists a DAO's typed events with their blocks.
+        """
+        async def scenario(server, port):
+            _, created = await self.call(port, "POST", "/daos", {"name": "TestDAO", "founders": ["Alice", "Bob"]})
+            await self.call(port, "POST", f"/daos/{created['dao_id']}/transactions",
+                            {"type": "token_sale", "member": "Carol", "amount": 10, "token_price": 1.0})
+            return await self.call(port, "GET", f"/daos/{created['dao_id']}/events?start=1")
+
+        status, body = self.run_with_server(scenario)
+        self.assertEqual(status, 200)
+        self.assertEqual([e["event"]["type"] for e in body["events"]], ["dao_created", "transaction_executed"])
+        self.assertEqual(body["events"][1]["event"]["transaction"]["buyer"], "Carol")
+        print("test_events_route passed.")
+
+    def test_limits(self):
+        """
+        Test that oversized bodies and invalid requests are refused.
+        """
+        async def scenario(server, port):
+            too_large = await self.call(port, "POST", "/daos", {"name": "x" * 100, "founders": ["Alice"]})
+            bad = await self.call(port, "POST", "/daos", {"name": "TestDAO"})
+            wrong_method = await self.call(port, "DELETE", "/daos")
+            return too_large, bad, wrong_method
+
+        too_large, bad, wrong_method = self.run_with_server(scenario, max_body_bytes=50)
+        self.assertEqual(too_large[0], 413)
+        self.assertEqual(bad[0], 400)
+        self.assertEqual(wrong_method[0], 405)
+        print("test_limits passed.")
+
+    def test_invalid_integers(self):
+        """
+        Test that non-numeric or negative integers in bodies, queries and headers are answered with 400.
+        """
+        async def scenario(server, port):
+            _, created = await self.call(port, "POST", "/daos", {"name": "TestDAO", "founders": ["Alice"]})
+            responses = [
+                await self.call(port, "POST", "/daos", {"name": "TestDAO", "founders": ["Alice"], "initial_supply": "many"}),
+                await self.call(port, "POST", "/daos", {"name": "TestDAO", "founders": ["Alice"], "initial_supply": -1}),
+                await self.call(port, "GET", f"/daos/{created['dao_id']}/chain?start=x"),
+                await self.call(port, "GET", f"/daos/{created['dao_id']}/events?limit=-5"),
+            ]
+            for length in ("abc", "-1"):
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                writer.write(f"POST /daos HTTP/1.1\r\nHost: test\r\nContent-Length: {length}\r\n\r\n".encode())
+                await writer.drain()
+                responses.append(await read_response(reader))
+                writer.close()
+            return responses
+
+        responses = self.run_with_server(scenario)
+        self.assertEqual([status for status, _ in responses], [400] * 6)
+        self.assertEqual(responses[0][1], {"error": "initial_supply must be an integer."})
+        self.assertEqual(responses[4][1], {"error": "Content-Length must be an integer."})
+        print("test_invalid_integers passed.")
+
+    def test_pending_writes_are_bounded(self):
+        """
+        Test that writes beyond the per-DAO queue limit are refused while a block is being built.
+        """
+        async def scenario():
+            service = DAOService(max_pending_writes=2)
+            dao_id = (await service.create_dao({"name": "TestDAO", "founders": ["Alice"]}))["dao_id"]
+            sale = {"type": "token_sale", "member": "Bob", "amount": 1, "token_price": 1.0}
+            lock = dao_locks.lock_for(dao_id)
+            lock.acquire()  # Hold the DAO so the first batch cannot finish
+            try:
+                first = asyncio.create_task(service.submit_transactions(dao_id, [sale]))
+                await asyncio.sleep(0.05)
+                queued = [asyncio.create_task(service.submit_transactions(dao_id, [dict(sale, member=m)]))
+                          for m in ["Carol", "Dave"]]
+                await asyncio.sleep(0)
+                with self.assertRaises(ServiceError) as ctx:
+                    await service.submit_transactions(dao_id, [dict(sale, member="Eve")])
+            finally:
+                lock.release()
+            results = await asyncio.gather(first, *queued)
+            service.executor.shutdown()
+            return ctx.exception.status, results
+
+        status, results = asyncio.run(scenario())
+        self.assertEqual(status, 503)
+        self.assertTrue(all(result[0]["ok"] for result in results))
+        print("test_pending_writes_are_bounded passed.")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+import Frontend.Input.excel_creation as excel
+from Frontend.Input.session_store import SessionStore
+
+class FakeClock:
+    """
+    A controllable clock for testing session expiry.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestSessionStore(unittest.TestCase):
+    """
+    Unit tests for the bounded, TTL-evicting session store.
+    """
+
+    def setUp(self):
+        """
+        Set up a store with a fake clock.
+        """
+        self.clock = FakeClock()
+        self.store = SessionStore(max_sessions=3, ttl_seconds=60, clock=self.clock)
+
+    def test_ttl_expiry_is_sliding(self):
+        """
+        Test that sessions expire after being idle for the TTL, and that use refreshes them.
+        """
+        self.store["a"] = {"name": "A"}
+        self.store["b"] = {"name": "B"}
+        self.clock.now = 50
+        self.assertEqual(self.store["a"]["name"], "A")
+        self.clock.now = 70
+        self.assertIn("a", self.store)
+        self.assertNotIn("b", self.store)
+        self.assertEqual(self.store.stats()["expirations"], 1)
+        print("test_ttl_expiry_is_sliding passed.")
+
+    def test_lru_eviction(self):
+        """
+        Test that the least recently used session is evicted when the store is full.
+        """
+        for key in "abc":
+            self.store[key] = {}
+        self.store["a"]
+        self.store["d"] = {}
+        self.assertEqual(sorted(self.store), ["a", "c", "d"])
+        stats = self.store.stats()
+        self.assertEqual((stats["size"], stats["evictions"], stats["hits"]), (3, 1, 1))
+        self.assertIsNone(self.store.get("b"))
+        self.assertEqual(self.store.stats()["misses"], 1)
+        print("test_lru_eviction passed.")
+
+    def test_wizard_session_expires(self):
+        """
+        Test that an abandoned Excel wizard session is dropped.
+        """
+        original_clock = excel.dao_creation_steps.clock
+        excel.dao_creation_steps.clock = self.clock
+        try:
+            excel.dao_creation_steps.clear()
+            excel.excel_set_dao_name("abandoned", "TestDAO")
+            self.clock.now += excel.dao_creation_steps.ttl_seconds
+            result = excel.excel_set_num_founders("abandoned", 2)
+            self.assertEqual(result, "Please set DAO name first.")
+            self.assertEqual(len(excel.dao_creation_steps), 0)
+        finally:
+            excel.dao_creation_steps.clock = original_clock
+            excel.dao_creation_steps.clear()
+        print("test_wizard_session_expires passed.")
+
+if __name__ == "__main__":
+    unittest.main()
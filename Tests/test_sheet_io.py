@@ -0,0 +1,173 @@
+import unittest
+from unittest.mock import patch
+import Frontend.Input.excel_macros as macros
+from Backend.Features.dao_creation import DAOCreation
+from Frontend.Input.excel_creation import daos
+from Frontend.Input.excel_transactions import excel_wallets
+from Frontend.Input.sheet_io import SheetIO, parse_cell, cell_address, range_address
+
+class FakeRange:
+    """
+    A COM-like Range over a FakeWorksheet: single cells are scalars, blocks are tuples of tuples.
+    """
+
+    def __init__(self, worksheet, address):
+        first, _, last = address.partition(":")
+        self.worksheet = worksheet
+        self.top, self.left = parse_cell(first)
+        self.bottom, self.right = parse_cell(last or first)
+
+    @property
+    def Value(self):
+        cells = self.worksheet.cells
+        rows = tuple(tuple(cells.get((r, c)) for c in range(self.left, self.right + 1))
+                     for r in range(self.top, self.bottom + 1))
+        return rows[0][0] if len(rows) == 1 and len(rows[0]) == 1 else rows
+
+    @Value.setter
+    def Value(self, value):
+        if not isinstance(value, (tuple, list)):
+            value = [[value]]
+        for r, row in enumerate(value):
+            for c, cell in enumerate(row):
+                self.worksheet.cells[(self.top + r, self.left + c)] = cell
+
+class FakeWorksheet:
+    """
+    A worksheet that counts Range calls, each of which is a COM round trip in Excel.
+    """
+
+    def __init__(self):
+        self.cells = {}
+        self.range_calls = 0
+
+    def Range(self, address):
+        self.range_calls += 1
+        return FakeRange(self, address)
+
+    def set(self, address, value):
+        self.cells[parse_cell(address)] = value
+
+    def get(self, address):
+        return self.cells.get(parse_cell(address))
+
+class FakeApp:
+    """
+    A stand-in for pyxll.xl_app() holding fake worksheets.
+    """
+
+    def __init__(self):
+        self.sheets = {}
+
+    def Worksheets(self, name):
+        return self.sheets.setdefault(name, FakeWorksheet())
+
+    def range_calls(self):
+        return sum(sheet.range_calls for sheet in self.sheets.values())
+
+class TestSheetIO(unittest.TestCase):
+    """
+    Unit tests for the bulk sheet I/O layer.
+    """
+
+    def setUp(self):
+        self.app = FakeApp()
+        self.sheet = self.app.Worksheets("Creation")
+
+    def test_addresses(self):
+        """
+        Test conversion between A1 addresses and row/column numbers.
+        """
+        self.assertEqual(parse_cell("P13"), (13, 16))
+        self.assertEqual(parse_cell("$AB$7"), (7, 28))
+        self.assertEqual(cell_address(7, 28), "AB7")
+        self.assertEqual(range_address(3, 1, 5, 2), "A3:B5")
+        with self.assertRaises(ValueError):
+            parse_cell("13P")
+        print("test_addresses passed.")
+
+    def test_read_fields_uses_one_call(self):
+        """
+        Test that named cells are read with a single Range call.
+        """
+        self.sheet.set("P13", "session")
+        self.sheet.set("R33", 1000)
+        values = SheetIO(self.app, "Creation").read_fields({"session_id": "P13", "supply": "R33", "empty": "Q20"})
+        self.assertEqual(values, {"session_id": "session", "supply": 1000, "empty": None})
+        self.assertEqual(self.sheet.range_calls, 1)
+        print("test_read_fields_uses_one_call passed.")
+
+    def test_write_fields_groups_adjacent_cells(self):
+        """
+        Test that adjacent outputs share a write and cells between outputs are untouched.
+        """
+        self.sheet.set("A2", "keep")
+        SheetIO(self.app, "Creation").write_fields({"A1": 1, "A3": 3, "A4": 4, "B1": "x"})
+        self.assertEqual(self.sheet.range_calls, 3)
+        self.assertEqual([self.sheet.get(a) for a in ["A1", "A2", "A3", "A4", "B1"]], [1, "keep", 3, 4, "x"])
+        print("test_write_fields_groups_adjacent_cells passed.")
+
+    def test_read_table_and_write_column(self):
+        """
+        Test reading a table without its trailing blank rows and writing results as a column.
+        """
+        self.sheet.set("A3", "Alice")
+        self.sheet.set("B3", 10)
+        self.sheet.set("A5", "Bob")
+        io = SheetIO(self.app, "Creation")
+        rows = io.read_table("A3:B100")
+        self.assertEqual(rows, [["Alice", 10], [None, None], ["Bob", None]])
+        io.write_column("C3", [["ok"], [""], ["failed"]])
+        self.assertEqual(self.sheet.get("C5"), "failed")
+        self.assertEqual(self.sheet.range_calls, 2)
+        print("test_read_table_and_write_column passed.")
+
+class TestExcelMacros(unittest.TestCase):
+    """
+    Unit tests for the macros against a fake Excel application.
+    """
+
+    def setUp(self):
+        self.dao = DAOCreation("TestDAO", ["Mihail", "Ben"], token_name="REVO", initial_supply=1000)
+        daos[self.dao.dao_id] = self.dao
+        self.app = FakeApp()
+        self.app.Worksheets("Creation").set("P42", self.dao.dao_id)
+        patcher = patch.object(macros, "xl_app", return_value=self.app)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        daos.clear()
+        excel_wallets.clear()
+
+    def test_macro_token_sale(self):
+        """
+        Test that a single-operation macro reads each sheet once and writes its result once.
+        """
+        transactions = self.app.Worksheets("Transactions")
+        transactions.set("R15", "Alice")
+        transactions.set("R16", 100.0)
+        transactions.set("R17", 1.5)
+        macros.macro_token_sale()
+        self.assertIn("executed and recorded", transactions.get("P20"))
+        self.assertEqual(self.app.range_calls(), 3)
+        print("test_macro_token_sale passed.")
+
+    def test_macro_batch_token_sales(self):
+        """
+        Test that a table of token sales runs as one block with one read and one write.
+        """
+        batch = self.app.Worksheets("Batch")
+        for i, (buyer, amount) in enumerate([("Alice", 100.0), ("Bob", 50.0), ("Carol", 25.0)]):
+            batch.set(f"A{3 + i}", buyer)
+            batch.set(f"B{3 + i}", amount)
+            batch.set(f"C{3 + i}", 2.0)
+        chain_length = len(self.dao.blockchain.chain)
+        macros.macro_batch_token_sales()
+        self.assertTrue(all("executed and recorded" in batch.get(f"E{r}") for r in range(3, 6)))
+        self.assertEqual(len(self.dao.blockchain.chain), chain_length + 1)
+        self.assertEqual(batch.range_calls, 2)
+        print("test_macro_batch_token_sales passed.")
+
+if __name__ == "__main__":
+    unittest.main()
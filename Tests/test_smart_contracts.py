@@ -1,5 +1,5 @@
 from Backend.Database import Blockchain
-from Backend.Features.smart_contracts import process_user_input_and_add_contract
+from Backend.Features.smart_contracts import process_user_input_and_add_contract, process_user_inputs_and_add_contracts
 import unittest
 
 class TestSmartContracts(unittest.TestCase):
@@ -50,5 +50,31 @@ def test_unrecognized_input(self):
         self.assertIn("No recognized governance rule in input.", result)
         self.assertEqual(len(bc.chain), 1)  # Only genesis block
 
+    def test_bulk_contracts_single_block(self):
+        """
+        Test compiling many rules in a process pool and appending them as one block.
+        """
+        bc = Blockchain()
+        inputs = ["Set quorum to 50% +1", "Not a rule", "Set voting time to 48 hours", None, "Set proposal cost to 10"]
+        results = process_user_inputs_and_add_contracts(inputs, bc, max_workers=2)
+        self.assertEqual(len(results), 5)
+        self.assertIn("Smart contract added to blockchain", results[0])
+        self.assertIn("No recognized governance rule in input.", results[1])
+        self.assertIn("Smart contract added to blockchain", results[2])
+        self.assertIn("Error compiling governance rule", results[3])
+        self.assertEqual(len(bc.chain), 2)
+        txs = bc.chain[1].transactions
+        self.assertEqual([tx["rule_type"] for tx in txs], ["quorum", "voting_time", "proposal_cost"])
+        self.assertEqual(results[4], f"Smart contract added to blockchain. Bytecode: {txs[2]['bytecode']}")
+
+    def test_bulk_contracts_match_single_path(self):
+        """
+        Test that pooled compilation produces the same bytecode as the single-contract path.
+        """
+        single, bulk = Blockchain(), Blockchain()
+        process_user_input_and_add_contract("Set quorum to 60%", single)
+        process_user_inputs_and_add_contracts(["Set quorum to 60%", "Set quorum to 60%"], bulk, max_workers=2)
+        self.assertEqual(single.chain[1].transactions[0]["bytecode"], bulk.chain[1].transactions[0]["bytecode"])
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,137 @@
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+import numpy as np
+from Backend.Database.blockchain import MultiSigWallet
+from Backend.Features.dao_creation import DAOCreation
+from Backend.Features.smart_contracts import process_user_input_and_add_contract
+from Backend.Features.transactions import TokenSaleTransaction, TreasuryContributionTransaction
+from Backend.Features.replay import verify_chain
+from Backend.Features.snapshot import (
+    CHAIN_TIMESTAMPS, FORMAT_VERSION, HEADER, SnapshotError, SnapshotReader,
+    dumps, loads, load_snapshot, save_snapshot
+)
+
+class TestSnapshot(unittest.TestCase):
+    """
+    Unit tests for the binary DAO snapshot format.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.dao = DAOCreation("TestDAO", ["Alice", "Bob"], "TT", 1000)
+        self.wallet = MultiSigWallet(["Alice", "Bob"], required_signatures=2)
+        TreasuryContributionTransaction(self.dao, "Alice", 100, self.wallet, "contribution-1").execute()
+        TokenSaleTransaction(self.dao, "Carol", 10, 1.5, self.wallet).execute()
+        self.dao.add_member("Dave")
+        self.dao.set_governance_rule("quorum", 2)
+        proposal_id = self.dao.create_proposal("Grow", "Grow the treasury", "Alice")
+        self.dao.vote_on_proposal(proposal_id, "Bob", "yes")
+        process_user_input_and_add_contract("Set quorum to 50% plus 1", self.dao.blockchain)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def assertRestored(self, restored):
+        original = self.dao
+        self.assertEqual([vars(b) for b in restored.blockchain.chain], [vars(b) for b in original.blockchain.chain])
+        verify_chain(restored.blockchain)  # Restored transactions keep their types, so blocks match their hashes
+        self.assertEqual(restored.blockchain.version, original.blockchain.version)
+        self.assertEqual(restored.blockchain.contract_registry.active_rule("quorum")["bytecode"],
+                         original.blockchain.contract_registry.active_rule("quorum")["bytecode"])
+        for field in ("dao_id", "name", "founders", "token_name", "initial_supply", "creation_time",
+                      "wallets", "members", "governance_rules", "proposals"):
+            self.assertEqual(getattr(restored, field), getattr(original, field), field)
+        self.assertEqual(vars(restored.ledger), vars(original.ledger))
+        self.assertIs(restored.ledger.member_balances, restored.wallets)
+        self.assertEqual(restored.idempotency.lookup("contribution-1"), original.idempotency.lookup("contribution-1"))
+
+    def test_roundtrip(self):
+        """
+        Test that a restored DAO equals the original and keeps working.
+        """
+        restored = loads(dumps(self.dao))
+        self.assertRestored(restored)
+        result = TreasuryContributionTransaction(restored, "Alice", 100, self.wallet, "contribution-1").execute()
+        self.assertIn("executed and recorded", result)
+        self.assertEqual(len(restored.blockchain.chain), len(self.dao.blockchain.chain))  # Deduplicated
+        TokenSaleTransaction(restored, "Erin", 5, 1.0, self.wallet).execute()
+        chain = restored.blockchain.chain
+        self.assertEqual(chain[-1].previous_hash, chain[-2].hash)
+        self.assertEqual(restored.blockchain.version, self.dao.blockchain.version + 1)
+        print("test_roundtrip passed.")
+
+    def test_compressed_file_and_memory_map(self):
+        """
+        Test compressed snapshots and loading files through a memory map.
+        """
+        for _ in range(50):
+            self.dao.add_member(f"member{_}")
+        self.assertLess(len(dumps(self.dao, compress=True)), len(dumps(self.dao)))
+        self.assertRestored(loads(dumps(self.dao, compress=9)))
+        path = os.path.join(self.directory, "dao.snapshot")
+        self.assertEqual(save_snapshot(self.dao, path, compress=True), os.path.getsize(path))
+        self.assertRestored(load_snapshot(path))
+        save_snapshot(self.dao, path)
+        self.assertRestored(load_snapshot(path))
+        print("test_compressed_file_and_memory_map passed.")
+
+    def test_columns_are_zero_copy(self):
+        """
+        Test that uncompressed numeric columns are views into the snapshot buffer.
+        """
+        data = dumps(self.dao)
+        timestamps = SnapshotReader(data).column(CHAIN_TIMESTAMPS, "d")
+        self.assertIs(timestamps.obj, data)
+        self.assertEqual(timestamps.tolist(), [block.timestamp for block in self.dao.blockchain.chain])
+        print("test_columns_are_zero_copy passed.")
+
+    def test_corruption_is_detected(self):
+        """
+        Test that corrupt, truncated, foreign and newer snapshots are rejected.
+        """
+        data = bytearray(dumps(self.dao))
+        flipped = bytearray(data)
+        flipped[-20] ^= 0xFF
+        with self.assertRaisesRegex(SnapshotError, "checksum"):
+            loads(bytes(flipped))
+        with self.assertRaisesRegex(SnapshotError, "truncated"):
+            loads(bytes(data[:len(data) // 2]))
+        with self.assertRaisesRegex(SnapshotError, "Not a DAO snapshot"):
+            loads(b"PK\x03\x04" + bytes(data[4:]))
+        newer = bytearray(data)
+        struct.pack_into("<H", newer, 8, FORMAT_VERSION + 1)
+        with self.assertRaisesRegex(SnapshotError, "newer"):
+            loads(bytes(newer))
+        self.assertEqual(HEADER.unpack_from(data)[1], FORMAT_VERSION)
+        print("test_corruption_is_detected passed.")
+
+    def test_tagged_values(self):
+        """
+        Test that tuples, sets, frozensets, bytes and bytearrays survive, and values JSON would change are refused.
+        """
+        self.dao.set_governance_rule("window", (1, 2))
+        self.dao.governance_rules["admins"] = {"Alice", "Bob"}
+        self.dao.governance_rules["seal"] = b"\x00\x01"
+        self.dao.set_governance_rule("signers", frozenset({"Alice", "Bob"}))  # Recorded in a block
+        self.dao.governance_rules["buffer"] = bytearray(b"\x02")
+        TokenSaleTransaction(self.dao, "Erin", 2.5, 1.0, self.wallet).execute()  # Mixed int and float wallets
+        restored = loads(dumps(self.dao))
+        self.assertRestored(restored)
+        self.assertEqual(restored.governance_rules["window"], (1, 2))
+        self.assertEqual(restored.governance_rules["admins"], {"Alice", "Bob"})
+        self.assertEqual(restored.governance_rules["seal"], b"\x00\x01")
+        self.assertIs(type(restored.governance_rules["signers"]), frozenset)
+        self.assertIs(type(restored.governance_rules["buffer"]), bytearray)
+        self.assertEqual([b.hash_block() for b in restored.blockchain.chain], [b.hash for b in self.dao.blockchain.chain])
+        self.assertIs(type(restored.wallets["Alice"]), int)
+        for value in (object(), np.int64(1), np.float64(1.0), {1: "one"}):
+            self.dao.governance_rules["unsupported"] = value
+            with self.assertRaises(SnapshotError):
+                dumps(self.dao)
+        print("test_tagged_values passed.")
+
+if __name__ == "__main__":
+    unittest.main()
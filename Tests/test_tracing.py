@@ -0,0 +1,117 @@
+import os
+import json
+import shutil
+import asyncio
+import tempfile
+import unittest
+import Frontend.Input.excel_async as excel_async
+from Backend.Features.dao_creation import DAOCreation
+from Backend.tracing import tracer, Tracer
+from Frontend.Input.excel_creation import daos
+from Frontend.Input.excel_transactions import excel_wallets, excel_treasury_contribution, excel_fund_distribution
+
+def _names(span):
+    """
+    Flattens a span tree into the names of its spans, depth first.
+    """
+    return [span.name] + [name for child in span.children for name in _names(child)]
+
+class TestTracing(unittest.TestCase):
+    """
+    Unit tests for the tracing spans and the slow-call profiling mode.
+    """
+
+    def setUp(self):
+        self.dao = DAOCreation("TestDAO", ["Mihail", "Ben"], token_name="REVO", initial_supply=1000)
+        daos[self.dao.dao_id] = self.dao
+        self.directory = tempfile.mkdtemp()
+        tracer.clear()
+        tracer.enable()
+
+    def tearDown(self):
+        tracer.disable()
+        tracer.clear()
+        daos.clear()
+        excel_wallets.clear()
+        shutil.rmtree(self.directory)
+
+    def test_spans_nest_from_excel_entry_point(self):
+        """
+        Test that an Excel call traces its backend stages down to the block hash.
+        """
+        excel_treasury_contribution(self.dao.dao_id, "Mihail", 100)
+        result = excel_fund_distribution(self.dao.dao_id, "Ben", 50, "Grant")
+        self.assertIn("executed and recorded", result)
+        trace = tracer.traces()[-1]
+        self.assertEqual(trace.name, "excel_fund_distribution")
+        self.assertEqual(_names(trace), [
+            "excel_fund_distribution", "transaction.execute", "transaction.validate", "multisig.approve",
+            "ledger.apply", "dao.get_summary", "contract.generate", "contract.compile",
+            "blockchain.add_block", "block.hash", "contract_registry.register_block",
+        ])
+        execute = trace.children[0]
+        self.assertEqual(execute.attributes, {"type": "fund_distribution", "dao": self.dao.dao_id})
+        self.assertLessEqual(sum(child.duration for child in execute.children), execute.duration)
+        print("test_spans_nest_from_excel_entry_point passed.")
+
+    def test_context_propagates_to_worker_threads(self):
+        """
+        Test that spans of an async call's worker thread nest under the async entry point.
+        """
+        asyncio.run(excel_async.excel_token_sale_async(self.dao.dao_id, "Buyer", 10, 1.0))
+        trace = tracer.traces()[-1]
+        self.assertEqual(trace.name, "excel_token_sale_async")
+        self.assertEqual([child.name for child in trace.children], ["excel_token_sale"])
+        self.assertIn("blockchain.add_block", _names(trace))
+        print("test_context_propagates_to_worker_threads passed.")
+
+    def test_slow_calls_are_profiled(self):
+        """
+        Test that profiling mode writes a cProfile file and a folded stack file for slow calls only.
+        """
+        tracer.enable(profile_threshold=0, profile_dir=self.directory)
+        excel_treasury_contribution(self.dao.dao_id, "Mihail", 100)
+        files = sorted(os.listdir(self.directory))
+        self.assertEqual([os.path.splitext(name)[1] for name in files], [".folded", ".prof"])
+        with open(os.path.join(self.directory, files[0])) as f:
+            stacks = [line.rsplit(" ", 1)[0] for line in f.read().splitlines()]
+        self.assertIn("excel_treasury_contribution;transaction.execute;blockchain.add_block;block.hash", stacks)
+
+        tracer.enable(profile_threshold=60)
+        excel_treasury_contribution(self.dao.dao_id, "Mihail", 100, "another")
+        self.assertEqual(len(os.listdir(self.directory)), 2)
+        print("test_slow_calls_are_profiled passed.")
+
+    def test_write_and_disabled(self):
+        """
+        Test writing traces as JSON lines, and that nothing is recorded while disabled.
+        """
+        tracer.disable()
+        excel_treasury_contribution(self.dao.dao_id, "Mihail", 100)
+        self.assertEqual(tracer.traces(), [])
+        tracer.enable()
+        excel_treasury_contribution(self.dao.dao_id, "Mihail", 100, "traced")
+        path = os.path.join(self.directory, "traces.jsonl")
+        tracer.write(path)
+        with open(path) as f:
+            traces = [json.loads(line) for line in f]
+        self.assertEqual(len(traces), 1)
+        self.assertEqual(traces[0]["children"][0]["attributes"]["type"], "treasury_contribution")
+        print("test_write_and_disabled passed.")
+
+    def test_errors_are_recorded(self):
+        """
+        Test that a span records the exception that closed it.
+        """
+        local = Tracer(enabled=True)
+        with self.assertRaises(ValueError):
+            with local.span("outer"):
+                with local.span("inner"):
+                    raise ValueError("boom")
+        trace = local.traces()[0]
+        self.assertEqual(trace.error, "ValueError: boom")
+        self.assertEqual(trace.children[0].error, "ValueError: boom")
+        print("test_errors_are_recorded passed.")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+from unittest.mock import patch
+from Backend.Features.dao_creation import DAOCreation
+from Backend.Database.blockchain import MultiSigWallet
+from Backend.Features import dao_creation
+from Backend.Features.transaction_engine import TransactionEngine, PER_TRANSACTION
+from Backend.Features.transactions import (
+    TokenSaleTransaction,
+    TreasuryContributionTransaction,
+    FundDistributionTransaction,
+    InvestmentTransaction
+)
+
+class TestTransactionEngine(unittest.TestCase):
+    """
+    Unit tests for the batched transaction execution engine.
+    """
+
+    def setUp(self):
+        """
+        Set up a DAO, a multisig wallet and an engine for testing.
+        """
+        founders = ["Mihail", "Ben", "Moritz"]
+        self.dao = DAOCreation("TestDAO", founders, token_name="REVO", initial_supply=3000)
+        self.wallet = MultiSigWallet(owners=founders, required_signatures=3)
+        self.engine = TransactionEngine(self.dao, self.wallet)
+
+    def test_mixed_batch_single_block(self):
+        """
+        Test that a mixed batch is applied and recorded as one block.
+        """
+        prev_chain_len = len(self.dao.blockchain.chain)
+        results = self.engine.execute_batch([
+            TokenSaleTransaction(self.dao, "Alice", 100, 1.5, self.wallet),
+            TreasuryContributionTransaction(self.dao, "Mihail", 50, self.wallet),
+            FundDistributionTransaction(self.dao, "Bob", 20, "Grant", self.wallet),
+            InvestmentTransaction(self.dao, "CoolProject", 10, self.wallet),
+        ])
+        self.assertTrue(all("executed and recorded on blockchain" in r for r in results))
+        self.assertEqual(self.dao.wallets["Alice"], 100)
+        self.assertEqual(self.dao.wallets["Mihail"], 950)
+        self.assertEqual(self.dao.wallets["Bob"], 20)
+        self.assertEqual(len(self.dao.blockchain.chain), prev_chain_len + 1)
+        txs = self.dao.blockchain.chain[-1].transactions
+        self.assertEqual([tx["type"] for tx in txs],
+                         ["smart_contract", "token_sale", "treasury_contribution", "fund_distribution", "investment"])
+        self.assertEqual(len(self.wallet.pending_transactions), 1)
+        print("test_mixed_batch_single_block passed.")
+
+    def test_payroll_compiles_once(self):
+        """
+        Test that a large payroll run compiles the DAO contract once.
+        """
+        payroll = [TreasuryContributionTransaction(self.dao, founder, 1000, self.wallet) for founder in self.dao.founders]
+        payroll += [FundDistributionTransaction(self.dao, f"member{i}", 1, "Payroll", self.wallet) for i in range(1000)]
+        with patch.object(dao_creation, "compile_solidity_to_bytecode",
+                          wraps=dao_creation.compile_solidity_to_bytecode) as compile_mock:
+            results = self.engine.execute_batch(payroll)
+        self.assertEqual(compile_mock.call_count, 1)
+        self.assertEqual(len(results), 1003)
+        self.assertEqual(self.dao.wallets["member999"], 1)
+        print("test_payroll_compiles_once passed.")
+
+    def test_invalid_transactions_rejected(self):
+        """
+        Test that invalid transactions are rejected per item without blocking the batch.
+        """
+        other = DAOCreation("OtherDAO", ["Eve"])
+        results = self.engine.execute_batch([
+            TokenSaleTransaction(self.dao, "Alice", -5, 1.5, self.wallet),
+            TokenSaleTransaction(other, "Alice", 5, 1.5, self.wallet),
+            TokenSaleTransaction(self.dao, "Carol", 5, 1.5, self.wallet),
+        ])
+        self.assertIn("rejected: Amount must be positive", results[0])
+        self.assertIn("rejected: Transaction belongs to a different DAO", results[1])
+        self.assertIn("executed and recorded on blockchain", results[2])
+        self.assertNotIn("Alice", self.dao.wallets)
+        print("test_invalid_transactions_rejected passed.")
+
+    def test_failed_multisig_approval(self):
+        """
+        Test that a batch without enough approvals changes nothing.
+        """
+        wallet = MultiSigWallet(owners=["Mihail"], required_signatures=2)
+        engine = TransactionEngine(self.dao, wallet, multisig_policy=PER_TRANSACTION)
+        prev_chain_len = len(self.dao.blockchain.chain)
+        results = engine.execute_batch([TokenSaleTransaction(self.dao, "Alice", 5, 1.5, wallet)])
+        self.assertEqual(results, ["Token sale failed multisig approval."])
+        self.assertEqual(len(self.dao.blockchain.chain), prev_chain_len)
+        print("test_failed_multisig_approval passed.")
+
+if __name__ == "__main__":
+    unittest.main()
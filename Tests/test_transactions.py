@@ -53,6 +53,7 @@ def test_fund_distribution_transaction(self):
         """
         Test executing a fund distribution transaction.
         """
+        TreasuryContributionTransaction(self.dao, "Mihail", 200, self.wallet).execute()  # Fund the treasury
         prev_chain_len = len(self.dao.blockchain.chain)
         tx = FundDistributionTransaction(self.dao, "Bob", 75, "Grant for project", self.wallet)
         result = tx.execute()
@@ -65,6 +66,7 @@ def test_investment_transaction(self):
         """
         Test executing an investment transaction.
         """
+        TreasuryContributionTransaction(self.dao, "Mihail", 200, self.wallet).execute()  # Fund the treasury
         prev_chain_len = len(self.dao.blockchain.chain)
         tx = InvestmentTransaction(self.dao, "CoolProject", 120, self.wallet)
         result = tx.execute()
@@ -92,5 +94,26 @@ def test_token_sale_transaction_insufficient_signatures(self):
             wallet.execute_transaction(0)
         print("test_token_sale_transaction_insufficient_signatures passed.")
 
+    def test_treasury_contribution_overdraft_rejected(self):
+        """
+        Test that a contribution larger than the contributor's balance is rejected.
+        """
+        prev_chain_len = len(self.dao.blockchain.chain)
+        tx = TreasuryContributionTransaction(self.dao, "Moritz", 250, self.wallet)
+        result = tx.execute()
+        self.assertIn("rejected: Insufficient balance in 'Moritz'", result)
+        self.assertEqual(self.dao.wallets["Moritz"], 200)
+        self.assertEqual(len(self.dao.blockchain.chain), prev_chain_len)
+        print("test_treasury_contribution_overdraft_rejected passed.")
+
+    def test_fund_distribution_requires_treasury_funds(self):
+        """
+        Test that distributions cannot overdraw the treasury.
+        """
+        result = FundDistributionTransaction(self.dao, "Bob", 75, "Grant for project", self.wallet).execute()
+        self.assertIn("rejected: Insufficient balance in 'treasury'", result)
+        self.assertNotIn("Bob", self.dao.wallets)
+        print("test_fund_distribution_requires_treasury_funds passed.")
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,107 @@
+import os
+import csv
+import shutil
+import tempfile
+import unittest
+from openpyxl import Workbook
+from Backend.Features.workbook_replay import WorkbookReplay, main
+
+class TestWorkbookReplay(unittest.TestCase):
+    """
+    Unit tests for replaying workbooks of DAO operations.
+    """
+
+    def setUp(self):
+        """
+        Write a workbook with Creation, Transactions and Proposal sheets.
+        """
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "operations.xlsx")
+        workbook = Workbook()
+        creation = workbook.active
+        creation.title = "Creation"
+        creation.append(["dao_ref", "name", "founders", "token_name", "initial_supply"])
+        creation.append(["a", "DAO A", "Alice, Bob", "AAA", 1000])
+        creation.append(["b", "DAO B", "Carol", "BBB", 500])
+        transactions = workbook.create_sheet("Transactions")
+        transactions.append(["dao_ref", "type", "member", "amount", "token_price", "reason", "target_project"])
+        transactions.append(["a", "treasury_contribution", "Alice", 200, None, None, None])
+        transactions.append(["b", "token_sale", "Dave", 50, 1.5, None, None])
+        transactions.append([None, None, None, None, None, None, None])
+        transactions.append(["a", "fund_distribution", "Eve", 150, None, "Grant", None])
+        transactions.append(["a", "investment", None, 1000, None, None, "Moon"])
+        transactions.append(["x", "token_sale", "Frank", 10, 1.0, None, None])
+        proposal = workbook.create_sheet("Proposal")
+        proposal.append(["dao_ref", "action", "title", "description", "member", "vote"])
+        proposal.append(["a", "create", "Grow", "Grow the DAO", "Alice", None])
+        proposal.append(["a", "vote", "Grow", None, "Alice", "yes"])
+        proposal.append(["a", "vote", "Grow", None, "Bob", "yes"])
+        proposal.append(["a", "result", "Grow", None, None, None])
+        proposal.append(["a", "vote", "Missing", None, "Bob", "yes"])
+        workbook.save(self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_replay_counts_and_failures(self):
+        """
+        Test that operations are replayed in batches and failures keep their sheet row.
+        """
+        replay = WorkbookReplay(chunksize=2)
+        summary = replay.run(self.path)
+        self.assertEqual(summary["rows"], 2 + 5 + 5)
+        self.assertEqual(summary["daos"], 2)
+        self.assertEqual(summary["transactions"], 3)
+        self.assertEqual(summary["proposal_operations"], 4)
+        self.assertGreater(summary["rows_per_second"], 0)
+        failures = {(sheet, row): reason for sheet, row, reason in replay.failures}
+        self.assertIn("Insufficient treasury balance", failures[("Transactions", 6)])
+        self.assertIn("Unknown dao_ref", failures[("Transactions", 7)])
+        self.assertEqual(failures[("Proposal", 6)], "Proposal not found.")
+        dao = replay.daos["a"]
+        self.assertEqual(dao.wallets["Eve"], 150)
+        self.assertEqual(dao.ledger.treasury_balance, 50)
+        print("test_replay_counts_and_failures passed.")
+
+    def test_invalid_initial_supply_fails_its_row(self):
+        """
+        Test that a DAO with a non-numeric, fractional or negative initial supply fails its row and the replay goes on,
+        while 0 is kept and only blank cells take the default.
+        """
+        workbook = Workbook()
+        creation = workbook.active
+        creation.title = "Creation"
+        creation.append(["dao_ref", "name", "founders", "token_name", "initial_supply"])
+        creation.append(["a", "DAO A", "Alice", "AAA", "lots"])
+        creation.append(["b", "DAO B", "Bob", "BBB", -5])
+        creation.append(["c", "DAO C", "Carol", "CCC", 300])
+        creation.append(["d", "DAO D", "Dave", "DDD", 1.5])
+        creation.append(["e", "DAO E", "Erin", "EEE", 0])
+        creation.append(["f", "DAO F", "Frank", "FFF", None])
+        creation.append(["g", "DAO G", "Gina", "GGG", "400"])
+        workbook.save(self.path)
+        replay = WorkbookReplay()
+        summary = replay.run(self.path)
+        self.assertEqual(summary["daos"], 4)
+        self.assertEqual(replay.failures, [("Creation", 2, "Invalid initial_supply: lots"),
+                                           ("Creation", 3, "Invalid initial_supply: -5"),
+                                           ("Creation", 5, "Invalid initial_supply: 1.5")])
+        self.assertEqual(replay.daos["c"].wallets["Carol"], 300)
+        self.assertEqual(replay.daos["e"].initial_supply, 0)
+        self.assertEqual(replay.daos["f"].initial_supply, 1000000)
+        self.assertEqual(replay.daos["g"].initial_supply, 400)
+        print("test_invalid_initial_supply_fails_its_row passed.")
+
+    def test_cli_writes_failure_report(self):
+        """
+        Test the command line entry point and its failure report.
+        """
+        report = os.path.join(self.directory, "failures.csv")
+        self.assertEqual(main([self.path, "--failures", report]), 1)
+        with open(report) as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(len(rows), 3)
+        print("test_cli_writes_failure_report passed.")
+
+if __name__ == "__main__":
+    unittest.main()